@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오래된 포스트 보관 (Jekyll 빌드 대상 _posts/ 크기 제한)
+- 보관 기간이 지난 포스트를 _posts/ → _archive/YYYY/MM/ 로 이동
+- _archive 는 _config.yml 의 archive 컬렉션 (포스트와 같은 permalink 형식이라 URL 유지)
+- site.posts 에는 최근 포스트만 남으므로 홈/사이드바/관련 기사/페이지네이션 루프가 전체 포스트 수와 무관
+- --max-posts 지정 시 기간과 관계없이 오래된 순으로 보관하여 _posts/ 파일 수 상한 유지
+
+사용법:
+    python archive_posts.py                        # 60일 지난 포스트 보관
+    python archive_posts.py --keep-days 30 --max-posts 2000
+    python archive_posts.py --dry-run              # 이동할 파일만 출력
+"""
+
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from search_index import POST_FILENAME_PATTERN
+
+
+def archive_path(archive_dir, filename):
+    """포스트 파일명 → 보관 경로 (_archive/YYYY/MM/파일명)"""
+    year, month = POST_FILENAME_PATTERN.match(filename).groups()[:2]
+    return Path(archive_dir) / year / month / filename
+
+
+def select_posts(posts_dir, keep_days=60, max_posts=None, now=None):
+    """보관할 포스트 목록 (오래된 순)"""
+    posts = sorted(
+        (path for path in Path(posts_dir).glob('*.md') if POST_FILENAME_PATTERN.match(path.name)),
+        key=lambda path: path.name
+    )
+    cutoff = ((now or datetime.now()) - timedelta(days=keep_days)).strftime('%Y-%m-%d')
+    selected = [path for path in posts if path.name[:10] < cutoff]
+
+    # 남는 포스트가 max_posts 를 넘으면 오래된 순으로 추가 보관
+    if max_posts is not None and len(posts) - len(selected) > max_posts:
+        selected = posts[:len(posts) - max_posts]
+    return selected
+
+
+def archive_posts(posts_dir, archive_dir, keep_days=60, max_posts=None, dry_run=False, now=None):
+    """포스트를 보관 디렉토리로 이동, 이동한 파일 수 반환"""
+    selected = select_posts(posts_dir, keep_days, max_posts, now)
+    months = set()
+    for path in selected:
+        target = archive_path(archive_dir, path.name)
+        months.add(target.parent)
+        if dry_run:
+            print(f"  {path.name} → {target.relative_to(Path(archive_dir).parent)}")
+            continue
+        if target.exists():
+            print(f"  [WARNING] 이미 보관된 파일이 있어 건너뜀: {target}")
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        path.replace(target)
+
+    remaining = sum(1 for _ in Path(posts_dir).glob('*.md'))
+    if dry_run:
+        remaining -= len(selected)
+    print(f"[OK] {'보관 예정' if dry_run else '보관 완료'}: {len(selected)}개 포스트 "
+          f"(월 디렉토리 {len(months)}개), _posts/ 에 {remaining}개 남음")
+    return len(selected)
+
+
+def main():
+    root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description='오래된 포스트를 _archive/ 컬렉션으로 이동')
+    parser.add_argument('--keep-days', type=int, default=60, help='_posts/ 에 남길 기간(일) (기본: 60)')
+    parser.add_argument('--max-posts', type=int, help='_posts/ 에 남길 최대 포스트 수')
+    parser.add_argument('--posts', default=str(root / "_posts"), help='포스트 디렉토리')
+    parser.add_argument('--archive', default=str(root / "_archive"), help='보관 디렉토리')
+    parser.add_argument('--dry-run', action='store_true', help='이동하지 않고 대상만 출력')
+    args = parser.parse_args()
+
+    archive_posts(args.posts, args.archive, args.keep_days, args.max_posts, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포스트 보관(archive_posts.py) 전후 Jekyll 빌드 비교
+- 사이트 파일을 임시 디렉토리에 복사하고 합성 포스트 N개(기본 20000개) 생성
+- 보관 전/후 _posts/ 파일 수, site.posts 순회 횟수(추정), jekyll build 시간 비교
+- 두 빌드 결과에 모든 포스트 URL이 그대로 있는지 확인 (permalink 유지)
+- jekyll이 설치되어 있지 않으면 빌드 시간 측정은 생략하고, URL은 _config.yml 의 permalink
+  (포스트 / archive 컬렉션)로 계산하여 보관 전 _posts/ URL과 비교
+- URL이 하나라도 사라지면 종료 코드 1
+
+사용법:
+    python bench_archive.py                              # 20000개, 365일, 최근 30일만 유지
+    python bench_archive.py --posts 5000 --keep-days 14
+    python bench_archive.py --no-build                   # 빌드 없이 파일 수/순회 횟수만
+"""
+
+import argparse
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from archive_posts import archive_posts
+from search_index import POST_FILENAME_PATTERN, parse_post
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+SITE_ROOT = Path(__file__).parent.parent
+SKIP_ENTRIES = {'.git', '_pytools', '_posts', '_archive', '_site', '.jekyll-cache', 'media'}
+
+# Jekyll 기본 permalink 스타일
+PERMALINK_STYLES = {
+    'date': '/:categories/:year/:month/:day/:title:output_ext',
+    'pretty': '/:categories/:year/:month/:day/:title/',
+    'ordinal': '/:categories/:year/:y_day/:title:output_ext',
+    'none': '/:categories/:title:output_ext',
+}
+COLLECTION_PERMALINK = '/:collection/:path:output_ext'
+PLACEHOLDER_PATTERN = re.compile(r':(categories|collection|output_ext|y_day|year|month|day|title|path)')
+
+# 홈(전체 + 카테고리 6개), 사이드바, 푸터에서 site.posts 를 순회하는 루프 수
+LISTING_LOOPS = 9
+
+WORDS = ['시장', '주가', '실적', '금리', '투자자', '상승', '하락', '발표', '전망', '분기',
+         'NVDA', 'AAPL', '반도체', '은행', '연준', '달러', '수익', '매출', '기술', '에너지']
+
+
+def copy_site(target):
+    """포스트/도구/미디어를 제외한 사이트 파일 복사"""
+    for entry in SITE_ROOT.iterdir():
+        if entry.name in SKIP_ENTRIES:
+            continue
+        if entry.is_dir():
+            shutil.copytree(entry, target / entry.name)
+        else:
+            shutil.copy2(entry, target / entry.name)
+
+
+def write_synthetic_posts(posts_dir, count, days, seed=0):
+    """크롤러 출력 형식의 합성 포스트를 최근 days일에 고르게 생성"""
+    generator = random.Random(seed)
+    posts_dir.mkdir(parents=True, exist_ok=True)
+    now = datetime.now()
+    for i in range(count):
+        date = now - timedelta(seconds=days * 86400 * i / count)
+        title = ' '.join(generator.choice(WORDS) for _ in range(6)) + f" {i}"
+        body = '\n\n'.join(' '.join(generator.choice(WORDS) for _ in range(60)) for _ in range(8))
+        slug = title.replace(' ', '-')
+        (posts_dir / f"{date:%Y-%m-%d}-{slug}.md").write_text(f"""---
+layout: post
+title: '{title}'
+date: {date:%Y-%m-%d %H:%M:%S} +0900
+categories: [Financial]
+author: "Investing.com"
+article_id: "{4000000 + i}"
+excerpt: '{body[:200]}...'
+stock_tags:
+  - symbol: NVDA
+    instrument_id: 6497
+---
+
+{body}
+""", encoding='utf-8')
+
+
+def config_permalinks(config_path, collection='archive'):
+    """_config.yml 에서 (포스트 permalink, collection 컬렉션 permalink) 읽기"""
+    post_permalink = 'date'
+    collection_permalink = None
+    section = None
+    in_collection = False
+    for line in config_path.read_text(encoding='utf-8').splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        indent = len(line) - len(line.lstrip())
+        key, _, value = line.strip().partition(':')
+        value = value.strip().strip('\'"')
+        if indent == 0:
+            section = key
+            if key == 'permalink':
+                post_permalink = value
+        elif section == 'collections' and indent == 2:
+            in_collection = key == collection
+        elif section == 'collections' and in_collection and key == 'permalink':
+            collection_permalink = value
+
+    post_permalink = PERMALINK_STYLES.get(post_permalink, post_permalink)
+    collection_permalink = PERMALINK_STYLES.get(collection_permalink, collection_permalink) or COLLECTION_PERMALINK
+    return post_permalink, collection_permalink
+
+
+def render_permalink(pattern, path, collection_dir, collection=None):
+    """Jekyll permalink 패턴으로 포스트 URL 계산 (파일명의 날짜/슬러그 + front matter categories)"""
+    match = POST_FILENAME_PATTERN.match(path.name)
+    if not match:
+        return None
+    year, month, day, slug = match.groups()
+    meta = parse_post(path.read_text(encoding='utf-8'))[0]
+    categories = meta.get('categories') or []
+    if isinstance(categories, str):
+        categories = categories.split()
+    values = {
+        'categories': '/'.join(c.lower() for c in dict.fromkeys(categories)),
+        'collection': collection or 'posts',
+        'output_ext': '.html',
+        'year': year, 'month': month, 'day': day,
+        'y_day': f"{datetime(int(year), int(month), int(day)).timetuple().tm_yday:03d}",
+        'title': slug,
+        'path': path.relative_to(collection_dir).with_suffix('').as_posix(),
+    }
+    url = PLACEHOLDER_PATTERN.sub(lambda m: values[m.group(1)], pattern)
+    return re.sub(r'/{2,}', '/', url)
+
+
+def expected_urls(site_dir, permalinks):
+    """_config.yml permalink 기준 _posts/ 와 _archive/ 의 모든 포스트 URL"""
+    post_permalink, archive_permalink = permalinks
+    posts_dir = site_dir / "_posts"
+    archive_dir = site_dir / "_archive"
+    urls = {render_permalink(post_permalink, path, posts_dir) for path in posts_dir.glob('*.md')}
+    if archive_dir.exists():
+        urls |= {render_permalink(archive_permalink, path, archive_dir, 'archive') for path in archive_dir.rglob('*.md')}
+    urls.discard(None)
+    return urls
+
+
+def jekyll_build(site_dir):
+    """jekyll build 시간(초), 실패하면 None"""
+    command = ['bundle', 'exec', 'jekyll', 'build', '--quiet']
+    if not shutil.which('bundle'):
+        command = ['jekyll', 'build', '--quiet']
+        if not shutil.which('jekyll'):
+            return None
+
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=site_dir, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        print(f"  [WARNING] jekyll build 실패: {(result.stderr or result.stdout).strip()[-500:]}")
+        return None
+    return elapsed
+
+
+def built_urls(site_dir):
+    return {'/' + path.relative_to(site_dir / "_site").as_posix() for path in (site_dir / "_site").rglob('*.html')}
+
+
+def measure(site_dir, build):
+    hot = sum(1 for _ in (site_dir / "_posts").glob('*.md'))
+    archived = sum(1 for _ in (site_dir / "_archive").rglob('*.md')) if (site_dir / "_archive").exists() else 0
+    # _posts/ 포스트 페이지마다 관련 기사 루프가 site.posts 전체를 순회 + 목록 루프
+    # (보관 문서는 archive 레이아웃이라 site.posts 를 순회하지 않음)
+    iterations = hot * hot + LISTING_LOOPS * hot
+    seconds = jekyll_build(site_dir) if build else None
+    return {'hot': hot, 'archived': archived, 'iterations': iterations, 'seconds': seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='포스트 보관 전후 Jekyll 빌드 비교')
+    parser.add_argument('--posts', type=int, default=20000, help='합성 포스트 수 (기본: 20000)')
+    parser.add_argument('--days', type=int, default=365, help='포스트가 분포할 기간(일) (기본: 365)')
+    parser.add_argument('--keep-days', type=int, default=30, help='_posts/ 에 남길 기간(일) (기본: 30)')
+    parser.add_argument('--max-posts', type=int, help='_posts/ 에 남길 최대 포스트 수')
+    parser.add_argument('--no-build', action='store_true', help='jekyll build 생략')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        site_dir = Path(tmp)
+        copy_site(site_dir)
+        print(f"[INFO] 합성 포스트 {args.posts}개 생성 중 ({args.days}일 분량)...")
+        write_synthetic_posts(site_dir / "_posts", args.posts, args.days)
+        permalinks = config_permalinks(site_dir / "_config.yml")
+        urls = expected_urls(site_dir, permalinks)
+
+        before = measure(site_dir, not args.no_build)
+        before_urls = built_urls(site_dir) if before['seconds'] is not None else None
+
+        start = time.perf_counter()
+        archive_posts(site_dir / "_posts", site_dir / "_archive", args.keep_days, args.max_posts)
+        archive_seconds = time.perf_counter() - start
+
+        after = measure(site_dir, before['seconds'] is not None)
+        after_urls = built_urls(site_dir) if after['seconds'] is not None else None
+
+        print("\n" + "=" * 70)
+        print(f"포스트 보관 비교 ({args.posts}개, 최근 {args.keep_days}일 유지)")
+        print("=" * 70)
+        print(f"{'':<26}{'보관 전':>16}{'보관 후':>16}")
+        print(f"{'_posts/ 파일 수':<26}{before['hot']:>16,}{after['hot']:>16,}")
+        print(f"{'_archive/ 파일 수':<26}{before['archived']:>16,}{after['archived']:>16,}")
+        print(f"{'site.posts 순회 (추정)':<26}{before['iterations']:>16,}{after['iterations']:>16,}")
+        if before['seconds'] is not None and after['seconds'] is not None:
+            print(f"{'jekyll build (초)':<26}{before['seconds']:>16.1f}{after['seconds']:>16.1f}")
+        elif not args.no_build:
+            print("[WARNING] jekyll을 실행할 수 없어 빌드 시간 측정 생략 (bundle install 필요)")
+        print(f"보관 작업 시간: {archive_seconds:.2f}초")
+
+        # URL 보존 확인: 빌드 결과가 있으면 실제 출력으로, 없으면 _config.yml permalink로 계산한 URL로 확인
+        if before_urls is not None and after_urls is not None:
+            missing = (urls & before_urls) - after_urls
+            label = "permalink 유지 (jekyll 빌드 결과)"
+        else:
+            missing = urls - expected_urls(site_dir, permalinks)
+            label = f"permalink 유지 (빌드 없음, _config.yml 기준: 포스트 {permalinks[0]}, archive {permalinks[1]})"
+        print(f"{label}: {'OK' if not missing else f'{len(missing)}개 URL 누락'}")
+        if missing:
+            for url in sorted(missing)[:5]:
+                print(f"  - {url}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
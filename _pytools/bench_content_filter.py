@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+본문 필터 마이크로 벤치마크
+- 기존 방식: 키워드마다 소문자 변환 본문 검사 + 전체 count, 문단마다 lower() 후 문구별 검사, re.findall 로 한글 수 계산
+- 새 방식: content_filter.py (컴파일된 정규식 하나로 한 번만 검사)
+- 두 방식의 결과가 같은지 함께 확인
+
+사용법:
+    python bench_content_filter.py                       # 기본 크기 (5KB ~ 500KB)
+    python bench_content_filter.py --sizes 2000 200000 --repeat 10
+    python bench_content_filter.py --rules my_rules.json
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from content_filter import DEFAULT_RULES_PATH, ContentFilter
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+ENGLISH_WORDS = ['shares', 'market', 'investors', 'earnings', 'rose', 'fell', 'quarter', 'revenue',
+                 'guidance', 'analysts', 'Nasdaq', 'rate', 'Fed', 'growth', 'chip', 'demand']
+KOREAN_WORDS = ['주가', '시장', '투자자', '실적', '상승', '하락', '분기', '매출', '전망', '금리', '반도체', '수요']
+BOILERPLATE = ("Risk Warning: Trading involves risk. Fusion Media would like to remind you. "
+               "Disclaimer: All rights reserved. See our Terms and Conditions and Privacy Policy.")
+PROMO = "Click here to subscribe to our newsletter and sign up for alerts."
+
+
+def synthetic_paragraphs(size, korean=False, seed=0):
+    """약 size 자 분량의 문단 목록 (일부는 광고성 문구)"""
+    generator = random.Random(seed)
+    words = KOREAN_WORDS + ENGLISH_WORDS[:4] if korean else ENGLISH_WORDS
+    paragraphs = []
+    length = 0
+    while length < size:
+        if generator.random() < 0.1:
+            paragraph = PROMO
+        else:
+            paragraph = ' '.join(generator.choice(words) for _ in range(generator.randint(10, 60))) + '.'
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return paragraphs
+
+
+def legacy_is_valid(rules, text):
+    """기존 is_valid_article_content"""
+    if not text or len(text) < rules['min_length']:
+        return False
+    invalid_keywords = rules['legal']['keywords']
+    text_start = text[:rules['legal']['head_chars']].lower()
+    keyword_count = sum(1 for keyword in invalid_keywords if keyword.lower() in text_start)
+    if keyword_count >= rules['legal']['head_min_keywords']:
+        return False
+    total_text_lower = text.lower()
+    legal_word_count = sum(total_text_lower.count(keyword.lower()) for keyword in invalid_keywords)
+    if len(text) < rules['legal']['short_length'] and legal_word_count >= rules['legal']['short_min_matches']:
+        return False
+    return True
+
+
+def legacy_filter(rules, paragraphs):
+    """기존 fetch_full_article_content 문단 루프"""
+    content_parts = []
+    for p in paragraphs:
+        text = p.strip()
+        if text and len(text) > rules['min_paragraph_length']:
+            if not any(skip.lower() in text.lower() for skip in rules['skip_phrases']):
+                content_parts.append(text)
+    return content_parts
+
+
+def legacy_is_korean(rules, text):
+    """기존 is_korean"""
+    if not text:
+        return False
+    korean_chars = len(re.findall(r'[가-힣]', text))
+    total_chars = len(re.sub(r'\s', '', text))
+    if total_chars == 0:
+        return False
+    return (korean_chars / total_chars) > rules['korean_ratio']
+
+
+def best_time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='본문 필터 마이크로 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5000, 50000, 500000], help='본문 크기(자)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최솟값 사용)')
+    parser.add_argument('--rules', default=str(DEFAULT_RULES_PATH), help='규칙 JSON 경로')
+    args = parser.parse_args()
+
+    engine = ContentFilter.load(args.rules)
+    rules = engine.rules
+
+    print("=" * 78)
+    print(f"{'항목':<28}{'크기':>10}{'기존 (ms)':>12}{'새 방식 (ms)':>14}{'배율':>8}  결과")
+    print("=" * 78)
+    mismatches = 0
+    for size in args.sizes:
+        for korean in (False, True):
+            paragraphs = synthetic_paragraphs(size, korean, seed=size)
+            text = '\n\n'.join(paragraphs)
+            label = '한국어' if korean else '영어'
+            cases = [
+                (f"본문 검증 ({label})", lambda: legacy_is_valid(rules, text),
+                 lambda: engine.check_article(text)[0]),
+                (f"본문 검증+고지 ({label})", lambda: legacy_is_valid(rules, text + BOILERPLATE),
+                 lambda: engine.check_article(text + BOILERPLATE)[0]),
+                (f"문단 필터 ({label})", lambda: legacy_filter(rules, paragraphs),
+                 lambda: engine.filter_paragraphs(paragraphs)),
+                (f"한국어 판별 ({label})", lambda: legacy_is_korean(rules, text),
+                 lambda: engine.is_korean(text)),
+            ]
+            for name, legacy, fast in cases:
+                legacy_ms, expected = best_time(legacy, args.repeat)
+                fast_ms, actual = best_time(fast, args.repeat)
+                same = expected == actual
+                mismatches += not same
+                print(f"{name:<28}{size:>10,}{legacy_ms:>12.3f}{fast_ms:>14.3f}"
+                      f"{legacy_ms / max(fast_ms, 1e-9):>7.1f}x  {'일치' if same else '불일치'}")
+
+    # 짧은 법적 고지 본문 (전체 비율 검사 경로)
+    short = (BOILERPLATE + ' ') * 3
+    same = legacy_is_valid(rules, short) == engine.check_article(short)[0]
+    mismatches += not same
+    print(f"\n짧은 법적 고지 본문 판정: {'일치' if same else '불일치'}")
+
+    if mismatches:
+        print(f"[ERROR] 결과 불일치 {mismatches}건")
+        sys.exit(1)
+    print("[OK] 모든 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
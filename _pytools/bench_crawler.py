@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 전체 벤치마크 (오프라인)
+- 녹화된 fixture(또는 합성 fixture)로 run(limit=N)을 네트워크 없이 실행
+- 실행 시간, 단계별 요청 수, 번역 호출 수, 최대 RSS 출력
+
+사용법:
+    # 1. 실제 실행을 녹화
+    python investing_complete_kr.py --limit 10 --record fixtures/
+
+    # 2. 녹화본으로 벤치마크 (요청당 200ms 지연, 5% 오류 주입)
+    python bench_crawler.py --fixtures fixtures/ --limit 10 --workers 4 --latency 0.2 --error-rate 0.05
+
+    # 녹화본 없이 합성 fixture 사용
+    python bench_crawler.py --synthetic 20 --limit 20
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from investing_complete_kr import InvestingCompleteKR
+from replay import FakeTranslator, ReplaySession, write_synthetic_fixtures
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+def peak_rss_mb():
+    """최대 RSS (MB), 측정할 수 없으면 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return usage / 1024 / 1024 if sys.platform == 'darwin' else usage / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 오프라인 벤치마크')
+    parser.add_argument('--fixtures', help='녹화된 fixture 디렉토리')
+    parser.add_argument('--synthetic', type=int, default=10, help='fixture가 없을 때 생성할 합성 기사 수 (기본: 10)')
+    parser.add_argument('--limit', type=int, default=10, help='처리할 기사 수 (기본: 10)')
+    parser.add_argument('--workers', type=int, default=1, help='동시에 처리할 기사 수 (기본: 1)')
+    parser.add_argument('--latency', type=float, default=0.0, help='요청당 지연 시간(초)')
+    parser.add_argument('--translate-latency', type=float, default=0.0, help='번역 호출당 지연 시간(초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답(503) 비율 (0~1)')
+    parser.add_argument('--seed', type=int, default=0, help='오류 주입 난수 시드')
+    parser.add_argument('--no-rate-limit', action='store_true', help='호스트별 요청 속도 제한 해제')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        fixtures_dir = Path(args.fixtures) if args.fixtures else tmp / 'fixtures'
+        if not args.fixtures:
+            write_synthetic_fixtures(fixtures_dir, args.synthetic)
+
+        session = ReplaySession(fixtures_dir, latency=args.latency, error_rate=args.error_rate, seed=args.seed)
+        translator = FakeTranslator(latency=args.translate_latency)
+        crawler = InvestingCompleteKR(scraper=session, translator=translator,
+                                      posts_dir=tmp / '_posts', cache_dir=tmp / '.cache')
+        if args.no_rate_limit:
+            crawler.rate_limiter.default_rate = (1e6, 1e6)
+            crawler.rate_limiter.host_rates = {}
+
+        start = time.perf_counter()
+        crawler.run(limit=args.limit, workers=args.workers)
+        elapsed = time.perf_counter() - start
+
+        posts = len(list((tmp / '_posts').glob('*.md')))
+
+    print("\n" + "=" * 70)
+    print("벤치마크 결과")
+    print("=" * 70)
+    print(f"실행 시간: {elapsed:.2f}s (limit={args.limit}, workers={args.workers})")
+    print(f"생성된 포스트: {posts}개")
+    print(f"HTTP 요청: {sum(session.requests.values())}개 (주입된 오류 {session.errors}개)")
+    for stage, count in sorted(session.requests.items()):
+        print(f"  - {stage:<12} {count}")
+    print(f"번역 호출: {translator.calls}개 ({translator.chars} 자)")
+    rss = peak_rss_mb()
+    if rss is not None:
+        print(f"최대 RSS: {rss:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+__NEXT_DATA__ 추출 마이크로 벤치마크
+- 기존 방식: BeautifulSoup(lxml) 전체 파싱 + json.loads + 재귀 탐색
+- 새 방식: next_data.py (문자열 범위 추출 + orjson + 알려진 경로 우선)
+
+사용법:
+    python bench_next_data.py                    # 합성 페이지로 측정
+    python bench_next_data.py pages/*.html       # 저장된 기사 페이지로 측정
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import next_data
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+def synthetic_page(body_paragraphs=40, filler_kb=400):
+    """실제 기사 페이지와 비슷한 크기의 합성 HTML 생성"""
+    body = ''.join(f"<p>Paragraph {i}: Stocks moved as investors weighed earnings. " * 3 + "</p>"
+                   for i in range(body_paragraphs))
+    data = {
+        'props': {
+            'pageProps': {
+                'accessToken': 'eyJ' + 'a' * 200 + '.' + 'b' * 200 + '.sig',
+                'articleStore': {'article': {'title': 'Synthetic article', 'body': body}},
+                'state': {'related': [{'title': f'Related {i}', 'body': 'short'} for i in range(200)]},
+            }
+        }
+    }
+    filler = '<div class="nav">' + ('<a href="/x">menu item</a>' * (filler_kb * 1024 // 28)) + '</div>'
+    script = f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script>'
+    return f'<html><head><title>t</title></head><body>{filler}{script}</body></html>'
+
+
+def legacy_extract(html):
+    """기존 investing_complete_kr.py 방식"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'lxml')
+    script = soup.find('script', {'id': '__NEXT_DATA__'})
+    if not script:
+        return None
+    return next_data.find_article_body(json.loads(script.string))
+
+
+def fast_extract(html):
+    data = next_data.extract_next_data(html)
+    return next_data.find_article(data) if data else None
+
+
+def measure(func, pages, repeat):
+    """(페이지당 평균 시간 ms, 최대 메모리 KB) 반환"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages:
+            func(html)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    for html in pages:
+        func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best / len(pages) * 1000, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='__NEXT_DATA__ 추출 벤치마크')
+    parser.add_argument('pages', nargs='*', help='저장된 HTML 페이지 경로')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본: 5)')
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = [Path(p).read_text(encoding='utf-8', errors='replace') for p in args.pages]
+    else:
+        pages = [synthetic_page()]
+
+    avg_kb = sum(len(p) for p in pages) / len(pages) / 1024
+    print(f"페이지 {len(pages)}개 (평균 {avg_kb:.0f} KB), orjson: {'사용' if next_data.orjson else '미설치'}")
+
+    methods = [('fast (next_data)', fast_extract)]
+    try:
+        import bs4  # noqa: F401
+        import lxml  # noqa: F401
+        methods.insert(0, ('legacy (bs4+json)', legacy_extract))
+    except ImportError:
+        print("[WARNING] bs4/lxml 미설치 - 기존 방식 측정 생략")
+
+    for name, func in methods:
+        ms, peak_kb = measure(func, pages, args.repeat)
+        print(f"{name:<20} {ms:8.2f} ms/page   peak {peak_kb:8.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시작 시간 측정
+- python -X importtime 으로 investing_complete_kr 모듈 import 시간 측정
+- 비교: 무거운 의존성(cloudscraper, bs4, readability, deep_translator)을 모두 import 하는 시간
+- 새 기사가 없는 실행(오프라인 재생)에서 로드된 무거운 모듈 확인
+
+사용법:
+    python bench_startup.py
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+HEAVY_MODULES = ['cloudscraper', 'bs4', 'readability', 'deep_translator']
+
+# 모든 기사가 이미 처리된 상태에서 run() 실행 후 로드된 무거운 모듈 출력
+NO_NEW_ARTICLES_SCRIPT = '''
+import json, sys, tempfile, time
+from pathlib import Path
+start = time.perf_counter()
+from investing_complete_kr import InvestingCompleteKR
+from replay import ReplaySession, write_synthetic_fixtures
+
+tmp = Path(tempfile.mkdtemp())
+write_synthetic_fixtures(tmp / "fixtures", 10)
+posts = tmp / "_posts"
+posts.mkdir()
+for i in range(10):
+    (posts / f"2025-01-01-post-{i}.md").write_text(f'---\\narticle_id: "{4000000 + i}"\\n---\\n', encoding="utf-8")
+
+crawler = InvestingCompleteKR(scraper=ReplaySession(tmp / "fixtures"), posts_dir=posts, cache_dir=tmp / ".cache")
+crawler.run(limit=10)
+elapsed = time.perf_counter() - start
+print("RESULT", json.dumps({"seconds": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+''' % HEAVY_MODULES
+
+
+def import_times(modules):
+    """-X importtime 결과 → ({모듈: 누적 us}, 지정 모듈들의 누적 합계 us)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join(modules)],
+                            capture_output=True, text=True, cwd=Path(__file__).parent)
+    if result.returncode != 0:
+        return None, None
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        times[name.strip()] = int(cumulative_us)
+    return times, sum(times.get(module, 0) for module in modules)
+
+
+def main():
+    print("=" * 70)
+    print("시작 시간 측정 (-X importtime)")
+    print("=" * 70)
+
+    times, total = import_times(['investing_complete_kr'])
+    if times is None:
+        print("[ERROR] investing_complete_kr import 실패")
+        return
+    print(f"investing_complete_kr import: {total / 1000:.1f} ms")
+    eager = [name for name in HEAVY_MODULES if name in times]
+    print(f"  - import 시 로드된 무거운 모듈: {', '.join(eager) or '없음'}")
+
+    heavy_times, heavy_total = import_times(HEAVY_MODULES)
+    if heavy_times is None:
+        print("\n[WARNING] 무거운 의존성이 설치되지 않아 비교 생략")
+    else:
+        print(f"\n비교: {', '.join(HEAVY_MODULES)} import: {heavy_total / 1000:.1f} ms")
+        for name in HEAVY_MODULES:
+            print(f"  - {name:<30} {heavy_times.get(name, 0) / 1000:8.1f} ms")
+
+    result = subprocess.run([sys.executable, '-c', NO_NEW_ARTICLES_SCRIPT],
+                            capture_output=True, text=True, cwd=Path(__file__).parent)
+    lines = [line for line in result.stdout.splitlines() if line.startswith('RESULT ')]
+    if not lines:
+        print("\n[ERROR] 새 기사 없음 경로 측정 실패")
+        print(result.stderr[-2000:])
+        return
+
+    import json
+    data = json.loads(lines[-1][len('RESULT '):])
+    print(f"\n새 기사가 없는 실행 (오프라인 재생): {data['seconds'] * 1000:.1f} ms")
+    print(f"  - 로드된 무거운 모듈: {', '.join(data['loaded']) or '없음'}")
+
+
+if __name__ == "__main__":
+    main()
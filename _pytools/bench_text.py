@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+텍스트 처리 단계 마이크로 벤치마크 (회귀 검사)
+- 대상: sanitize_filename, clean_title, is_korean, build_excerpt,
+  convert_tickers_to_badges (종목 검색은 고정 매핑으로 대체), render_post
+- 합성 기사: 한국어/영어 x 본문 크기 x 티커 밀도
+- 함수별 처리량(호출/초, 글자/초)을 저장된 기준값(bench_text_baseline.json)과 비교
+  - 기기 차이는 고정된 순수 Python 보정 작업의 속도 비율로 보정
+  - 라운드마다 보정 작업과 모든 함수를 번갈아 실행하고, 라운드별 (함수/보정) 비율의 중앙값으로 비교
+    (측정 중 부하가 바뀌어도 같은 라운드의 보정 값도 함께 바뀜)
+  - 함수별 총 측정 시간은 --min-total 이상
+  - 처리량이 --threshold 이상 떨어진 함수는 한 번 더 측정하여 재현될 때만 실패
+  - 처리량이 재현되게 떨어졌거나 결과 해시가 달라지면 종료 코드 1
+- 의도적으로 결과가 바뀌었거나 기준 기기가 바뀌면 --save-baseline 으로 기준값 갱신
+
+사용법:
+    python bench_text.py                        # 기준값과 비교
+    python bench_text.py --save-baseline        # 기준값 저장
+    python bench_text.py --only clean_title render_post --threshold 0.1
+"""
+
+import argparse
+import hashlib
+import json
+import platform
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from investing_complete_kr import InvestingCompleteKR
+from replay import FakeTranslator
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "bench_text_baseline.json"
+
+ENGLISH_WORDS = ['shares', 'market', 'investors', 'earnings', 'rose', 'fell', 'quarter', 'revenue',
+                 'guidance', 'analysts', 'rate', 'growth', 'chip', 'demand', 'the', 'of', 'and', 'in']
+KOREAN_WORDS = ['주가가', '시장은', '투자자들은', '실적을', '상승했다', '하락했다', '분기', '매출', '전망을',
+                '금리', '반도체', '수요가', '발표했다', '증권가는']
+TICKERS = [('NASDAQ', 'NVDA'), ('NASDAQ', 'AAPL'), ('NASDAQ', 'MSFT'), ('NYSE', 'JPM'), ('NYSE', 'XOM'),
+           ('KS', '005930'), ('KS', '000660'), ('TSE', '7203'), ('HK', '0700'), ('LSE', 'BP')]
+TITLE_SUFFIXES = ['', ' By Investing.com', ' By InvestingPro', ' - Investing.com', ' -  investingpro ']
+
+SIZES = [500, 5000, 50000]
+TICKER_DENSITIES = [0, 2, 10]  # 1000자당 티커 수
+
+
+def synthetic_article(generator, korean, size, density):
+    """약 size 자 분량, 1000자당 density개 티커가 들어간 기사 (제목, 본문)"""
+    words = KOREAN_WORDS if korean else ENGLISH_WORDS
+    paragraphs = []
+    length = 0
+    while length < size:
+        sentence_words = [generator.choice(words) for _ in range(generator.randint(8, 40))]
+        paragraph = ' '.join(sentence_words) + '.'
+        tickers = round(len(paragraph) * density / 1000 + generator.random() - 0.5) if density else 0
+        for _ in range(tickers):
+            exchange, symbol = generator.choice(TICKERS)
+            position = generator.randrange(len(paragraph))
+            paragraph = f"{paragraph[:position]} ({exchange}:{symbol}) {paragraph[position:]}"
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+
+    title_words = [generator.choice(words) for _ in range(generator.randint(5, 14))]
+    if generator.random() < 0.3:
+        title_words.append("'인용'" if korean else "'quoted'")
+    title = ' '.join(title_words) + generator.choice(TITLE_SUFFIXES)
+    return title, '\n\n'.join(paragraphs)
+
+
+def synthetic_corpus(seed=0, per_cell=3):
+    """한국어/영어 x 크기 x 티커 밀도 조합별 per_cell개 기사"""
+    generator = random.Random(seed)
+    corpus = []
+    for korean in (False, True):
+        for size in SIZES:
+            for density in TICKER_DENSITIES:
+                for _ in range(per_cell):
+                    title, body = synthetic_article(generator, korean, size, density)
+                    corpus.append({'korean': korean, 'size': size, 'density': density,
+                                   'title': title, 'body': body})
+    return corpus
+
+
+def stub_resolver(tickers, search=True):
+    """종목 검색 대신 고정 매핑 (일부 종목은 찾지 못한 것으로 처리)"""
+    resolved = {}
+    for exchange, symbol in tickers:
+        digest = int(hashlib.md5(f"{exchange}:{symbol}".encode()).hexdigest()[:6], 16)
+        resolved[(exchange, symbol)] = None if digest % 7 == 0 else 1000 + digest % 100000
+    return resolved
+
+
+def calibration_work():
+    """기기 속도 보정용 고정 순수 Python 작업"""
+    total = 0
+    text = 'abc' * 50
+    for i in range(2000):
+        total += len(text.replace('b', str(i % 10))) + (i * i) % 7
+    return total
+
+
+def measure_round(func, units, min_time):
+    """min_time 이상 반복 실행한 한 라운드의 단위/초"""
+    loops = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        loops += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+    return units * loops / elapsed
+
+
+def measure(cases, rounds, min_time):
+    """
+    라운드마다 보정 작업과 모든 함수를 번갈아 측정
+
+    Returns:
+        (보정 작업 회/초 중앙값, {이름: (호출/초 중앙값, 보정 대비 비율 중앙값)})
+    """
+    calibrations = []
+    rates = {name: [] for name, _, _, _ in cases}
+    ratios = {name: [] for name, _, _, _ in cases}
+    for _ in range(rounds):
+        calibration = measure_round(calibration_work, 1, min_time)
+        calibrations.append(calibration)
+        for name, func, calls, _ in cases:
+            rate = measure_round(func, calls, min_time)
+            rates[name].append(rate)
+            ratios[name].append(rate / calibration)
+    return (statistics.median(calibrations),
+            {name: (statistics.median(rates[name]), statistics.median(ratios[name])) for name in rates})
+
+
+def build_cases(crawler, corpus):
+    """(이름, 입력 전체를 한 번 처리하는 함수, 호출 수, 입력 글자 수)"""
+    titles = [article['title'] for article in corpus]
+    bodies = [article['body'] for article in corpus]
+    translated = [f"[번역] {title}" for title in titles]
+    instruments = [{'symbol': symbol, 'id': 2000 + i, 'exchange_id': 1}
+                   for i, (_, symbol) in enumerate(TICKERS[:3])]
+    pub_date = datetime(2025, 11, 21, 14, 25, 8)
+    excerpts = [crawler.build_excerpt(body) for body in bodies]
+    rendered_inputs = [
+        ({'id': 4000000 + i, 'image_url': f"https://i-invdn-com.investing.com/news/{i}.jpg" if i % 2 else ''},
+         title, excerpt, body, instruments[:i % 4])
+        for i, (title, excerpt, body) in enumerate(zip(translated, excerpts, bodies))
+    ]
+
+    def chars(texts):
+        return sum(len(text) for text in texts)
+
+    return [
+        ('sanitize_filename', lambda: [crawler.sanitize_filename(t) for t in translated],
+         len(translated), chars(translated)),
+        ('clean_title', lambda: [crawler.clean_title(t) for t in titles + translated],
+         len(titles) * 2, chars(titles) + chars(translated)),
+        ('is_korean', lambda: [crawler.is_korean(b) for b in bodies], len(bodies), chars(bodies)),
+        ('build_excerpt', lambda: [crawler.build_excerpt(b) for b in bodies], len(bodies), chars(bodies)),
+        ('convert_tickers_to_badges', lambda: [crawler.convert_tickers_to_badges(b, instruments) for b in bodies],
+         len(bodies), chars(bodies)),
+        ('render_post', lambda: [crawler.render_post(article, title, excerpt, body, inst, pub_date)
+                                 for article, title, excerpt, body, inst in rendered_inputs],
+         len(rendered_inputs), chars(bodies)),
+    ]
+
+
+def result_digest(result):
+    return hashlib.sha1(repr(result).encode('utf-8')).hexdigest()[:12]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='텍스트 처리 단계 마이크로 벤치마크')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE_PATH), help='기준값 JSON 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준값으로 저장')
+    parser.add_argument('--threshold', type=float, default=0.35,
+                        help='허용 처리량 감소 비율 (기본: 0.35 = 다시 측정해도 35%% 이상 느리면 실패)')
+    parser.add_argument('--min-time', type=float, default=0.1, help='라운드당 함수별 최소 실행 시간(초)')
+    parser.add_argument('--repeat', type=int, default=7, help='최소 라운드 수 (중앙값 사용)')
+    parser.add_argument('--min-total', type=float, default=1.0, help='함수별 최소 총 측정 시간(초)')
+    parser.add_argument('--seed', type=int, default=0, help='합성 기사 시드')
+    parser.add_argument('--only', nargs='+', metavar='NAME', help='지정한 함수만 측정')
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        crawler = InvestingCompleteKR(translator=FakeTranslator(), posts_dir=tmp / "_posts", cache_dir=tmp / ".cache")
+        crawler.resolve_tickers = stub_resolver
+        cases = build_cases(crawler, corpus)
+        if args.only:
+            cases = [case for case in cases if case[0] in args.only]
+
+        rounds = max(args.repeat, math.ceil(args.min_total / args.min_time))
+        calibration, measured = measure(cases, rounds, args.min_time)
+        results = {}
+        ratios = {}
+        for name, func, calls, chars in cases:
+            calls_per_sec, ratios[name] = measured[name]
+            results[name] = {
+                'calls_per_sec': round(calls_per_sec, 1),
+                'mchars_per_sec': round(calls_per_sec / calls * chars / 1e6, 3),
+                'digest': result_digest(func()),
+            }
+
+        baseline_path = Path(args.baseline)
+        baseline = None
+        if baseline_path.exists() and not args.save_baseline:
+            with open(baseline_path, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+
+        def change_of(name, ratio):
+            """기준 기기의 (호출/초 / 보정) 비율 대비 변화"""
+            reference = baseline['results'][name]
+            return ratio / (reference['calls_per_sec'] / baseline['calibration']) - 1
+
+        # 느려진 것으로 보이는 함수만 다시 측정하여 더 좋은 값 사용 (일시적인 부하로 인한 실패 방지)
+        slow = [case for case in cases
+                if baseline and case[0] in baseline.get('results', {})
+                and change_of(case[0], ratios[case[0]]) < -args.threshold]
+        rechecked = set()
+        if slow:
+            print(f"[INFO] 느려진 함수 {len(slow)}개 다시 측정: {', '.join(case[0] for case in slow)}")
+            _, remeasured = measure(slow, rounds, args.min_time)
+            for name, _, calls, chars in slow:
+                calls_per_sec, ratio = remeasured[name]
+                rechecked.add(name)
+                if ratio > ratios[name]:
+                    ratios[name] = ratio
+                    results[name]['calls_per_sec'] = round(calls_per_sec, 1)
+                    results[name]['mchars_per_sec'] = round(calls_per_sec / calls * chars / 1e6, 3)
+
+    # 기준 기기 대비 속도 비율 (보정 작업 기준, 표시용)
+    scale = calibration / baseline['calibration'] if baseline else 1.0
+
+    print(f"합성 기사 {len(corpus)}개 (한국어/영어 x 크기 {SIZES} x 1000자당 티커 {TICKER_DENSITIES})")
+    print(f"라운드 {rounds}회 x 함수별 {args.min_time}초 (중앙값)")
+    print(f"보정 작업: {calibration:,.0f} 회/초" + (f" (기준 기기 대비 {scale:.2f}배)" if baseline else ""))
+    print("=" * 86)
+    print(f"{'함수':<28}{'호출/초':>12}{'M자/초':>10}{'기준 (보정)':>14}{'변화':>9}  결과")
+    print("=" * 86)
+
+    failures = []
+    for name, result in results.items():
+        reference = (baseline or {}).get('results', {}).get(name)
+        if not reference:
+            print(f"{name:<28}{result['calls_per_sec']:>12,.1f}{result['mchars_per_sec']:>10.3f}"
+                  f"{'-':>14}{'-':>9}  (기준값 없음)")
+            continue
+
+        change = change_of(name, ratios[name])
+        expected = result['calls_per_sec'] / (1 + change)
+        status = []
+        if change < -args.threshold:
+            status.append('느려짐 (재측정 확인)')
+            failures.append(f"{name}: 처리량 {change:+.0%}")
+        elif name in rechecked:
+            status.append('재측정 통과')
+        if result['digest'] != reference['digest']:
+            status.append('결과 변경')
+            failures.append(f"{name}: 결과 해시 {reference['digest']} → {result['digest']}")
+        print(f"{name:<28}{result['calls_per_sec']:>12,.1f}{result['mchars_per_sec']:>10.3f}"
+              f"{expected:>14,.1f}{change:>+9.0%}  {', '.join(status) or '통과'}")
+
+    if args.save_baseline:
+        data = {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'created': datetime.now().astimezone().isoformat(timespec='seconds'),
+            'seed': args.seed,
+            'calibration': round(calibration, 1),
+            'results': results,
+        }
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"\n[OK] 기준값 저장: {baseline_path}")
+        return
+
+    if baseline is None:
+        print(f"\n[INFO] 기준값 없음 ({baseline_path}), --save-baseline 으로 저장")
+        return
+    if failures:
+        print(f"\n[ERROR] 기준값 대비 회귀 {len(failures)}건 (허용 {args.threshold:.0%})")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print(f"\n[OK] 모든 함수 기준값 이내 (허용 {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
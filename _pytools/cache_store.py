@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 기반 영구 캐시
+- 키/값(JSON) 저장, 항목별 TTL 지원
+- 최대 항목 수 초과 시 오래 사용하지 않은 항목부터 제거 (LRU)
+- 스레드 간 공유 가능 (단일 커넥션 + Lock)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+MISSING = object()
+
+
+class SQLiteCache:
+    def __init__(self, db_path, table='cache', default_ttl=None, max_entries=None):
+        self.db_path = Path(db_path)
+        self.table = table
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.table} ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+            'expires_at REAL, accessed_at REAL NOT NULL)'
+        )
+        self.conn.execute(f'CREATE INDEX IF NOT EXISTS {self.table}_accessed ON {self.table}(accessed_at)')
+
+    def get(self, key, default=MISSING):
+        """캐시 조회 (없거나 만료되면 default 반환)"""
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys):
+        """여러 키를 한 번에 조회, 유효한 항목만 dict로 반환"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        now = time.time()
+        found = {}
+        with self.lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f'SELECT key, value, expires_at FROM {self.table} WHERE key IN ({placeholders})',
+                    chunk
+                ).fetchall()
+                for key, value, expires_at in rows:
+                    if expires_at is None or expires_at > now:
+                        found[key] = json.loads(value)
+
+            if found:
+                self.conn.executemany(
+                    f'UPDATE {self.table} SET accessed_at = ? WHERE key = ?',
+                    [(now, key) for key in found]
+                )
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def set(self, key, value, ttl=MISSING):
+        self.set_many({key: value}, ttl=ttl)
+
+    def set_many(self, items, ttl=MISSING):
+        """여러 항목 저장 (ttl=None 이면 만료 없음)"""
+        if not items:
+            return
+
+        ttl = self.default_ttl if ttl is MISSING else ttl
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        rows = [(key, json.dumps(value, ensure_ascii=False), expires_at, now) for key, value in items.items()]
+
+        with self.lock:
+            self.conn.execute('BEGIN')
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO {self.table} (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)',
+                rows
+            )
+            self.conn.execute('COMMIT')
+            self._evict()
+
+    def delete(self, key):
+        with self.lock:
+            self.conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+
+    def _evict(self):
+        """만료 항목 삭제 및 최대 항목 수 유지 (lock 보유 상태에서 호출)"""
+        self.conn.execute(f'DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?', (time.time(),))
+
+        if self.max_entries:
+            count = self.conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+            if count > self.max_entries:
+                self.conn.execute(
+                    f'DELETE FROM {self.table} WHERE key IN '
+                    f'(SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?)',
+                    (count - self.max_entries,)
+                )
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
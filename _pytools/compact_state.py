@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 로컬 상태(.cache/) 정리 - GitHub Actions 캐시 저장 전에 실행
+- SQLite 캐시: 만료 항목 삭제, 유사 기사 서명은 보관 기간/임시 서명 만료 기준으로 삭제,
+  작업 큐는 오래된 완료 기록 삭제 → WAL 체크포인트 후 VACUUM
+- 건너뜀 기록(seen_articles_skipped.txt): article_id당 한 줄로 정리
+- 실행 메트릭(metrics/run-*.json): 최근 N개만 유지
+
+사용법:
+    python compact_state.py
+    python compact_state.py --cache-dir .cache --keep-metrics 10
+"""
+
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+
+from near_duplicate import NearDuplicateIndex
+from run_metrics import prune_runs
+from seen_index import SeenArticleIndex
+from work_queue import WorkQueue
+
+
+def store_size(db_path):
+    """SQLite 파일 + WAL 파일 크기(바이트)"""
+    wal_path = db_path.with_name(db_path.name + '-wal')
+    return db_path.stat().st_size + (wal_path.stat().st_size if wal_path.exists() else 0)
+
+
+def vacuum(db_path):
+    """만료 항목(expires_at 컬럼이 있는 테이블) 삭제 후 WAL 체크포인트 + VACUUM, 삭제된 항목 수 반환"""
+    conn = sqlite3.connect(str(db_path), isolation_level=None, timeout=30)
+    try:
+        deleted = 0
+        tables = [name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        for table in tables:
+            columns = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+            if 'expires_at' in columns:
+                deleted += conn.execute(f'DELETE FROM {table} WHERE expires_at IS NOT NULL AND expires_at <= ?',
+                                        (time.time(),)).rowcount
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        conn.execute('VACUUM')
+        return deleted
+    finally:
+        conn.close()
+
+
+def compact_state(cache_dir, posts_dir, archive_dir, keep_metrics=30, queue_days=14):
+    cache_dir = Path(cache_dir)
+    if not cache_dir.exists():
+        print(f"[SKIP] 상태 디렉토리 없음: {cache_dir}")
+        return
+
+    # 보관 기간이 지났거나 확정되지 않고 만료된 유사 기사 서명 (생성 시 정리)
+    if (cache_dir / "near_duplicates.sqlite3").exists():
+        NearDuplicateIndex(cache_dir / "near_duplicates.sqlite3").close()
+    if (cache_dir / "queue.sqlite3").exists():
+        purged = WorkQueue(cache_dir / "queue.sqlite3").purge(queue_days)
+        print(f"[OK] 작업 큐 완료 기록 {purged}개 삭제")
+
+    for db_path in sorted(cache_dir.glob('*.sqlite3')):
+        before = store_size(db_path)
+        deleted = vacuum(db_path)
+        print(f"[OK] {db_path.name}: 만료 항목 {deleted}개 삭제, "
+              f"{before / 1024:,.0f}KB → {store_size(db_path) / 1024:,.0f}KB")
+
+    index = SeenArticleIndex(cache_dir / "seen_articles.txt", posts_dir, archive_dir)
+    print(f"[OK] 건너뜀 기록 정리: {index.compact_skips()}개")
+
+    if (cache_dir / "metrics").exists():
+        print(f"[OK] 오래된 실행 메트릭 {prune_runs(cache_dir / 'metrics', keep_metrics)}개 삭제")
+
+
+def main():
+    root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description='크롤러 로컬 상태(.cache/) 정리')
+    parser.add_argument('--cache-dir', default=str(Path(__file__).parent / ".cache"), help='상태 디렉토리')
+    parser.add_argument('--posts', default=str(root / "_posts"), help='포스트 디렉토리')
+    parser.add_argument('--archive', default=str(root / "_archive"), help='보관 디렉토리')
+    parser.add_argument('--keep-metrics', type=int, default=30, help='남길 실행 메트릭 파일 수 (기본: 30)')
+    parser.add_argument('--queue-days', type=int, default=14, help='작업 큐 완료 기록 보관 기간(일) (기본: 14)')
+    args = parser.parse_args()
+
+    compact_state(args.cache_dir, args.posts, args.archive, args.keep_metrics, args.queue_days)
+
+
+if __name__ == "__main__":
+    main()
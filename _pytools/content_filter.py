@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+본문 필터/분류 규칙 엔진
+- 규칙은 content_rules.json 에서 읽음 (법적 고지 키워드, 광고성 문구, 한국어 비율 등)
+- 문구 목록은 시작 시 한 번만 소문자/중복 제거하여 컴파일
+- 본문 검증: 짧은 본문 기준(short_length) 이상이면 앞부분만 검사 (전체 소문자 복사/전체 count 없음)
+- 문단 필터: 문단별로 문구를 하나씩 검사하지 않고, 소문자로 이어 붙인 본문을 문구당 한 번씩
+  C 수준 문자열 검색으로 훑은 뒤 위치를 문단 번호로 변환
+  (CPython에서는 대소문자 무시 정규식 alternation 이나 순수 Python Aho-Corasick 보다 빠름, bench_content_filter.py)
+- 한국어 판별: 글자 단위 리스트 대신 한글 연속 구간 길이 합계로 계산
+"""
+
+import bisect
+import json
+import re
+from pathlib import Path
+
+DEFAULT_RULES_PATH = Path(__file__).parent / "content_rules.json"
+
+HANGUL_RUN_PATTERN = re.compile(r'[가-힣]+')
+
+
+def compile_phrases(phrases):
+    """문구 목록 → 소문자, 중복 제거된 튜플"""
+    return tuple(dict.fromkeys(p.lower() for p in phrases if p))
+
+
+class ContentFilter:
+    def __init__(self, rules):
+        self.rules = rules
+        legal = rules.get('legal', {})
+        self.min_length = rules.get('min_length', 200)
+        self.legal_keywords = compile_phrases(legal.get('keywords', []))
+        self.head_chars = legal.get('head_chars', 500)
+        self.head_min_keywords = legal.get('head_min_keywords', 2)
+        self.short_length = legal.get('short_length', 1000)
+        self.short_min_matches = legal.get('short_min_matches', 5)
+        self.skip_phrases = compile_phrases(rules.get('skip_phrases', []))
+        self.min_paragraph_length = rules.get('min_paragraph_length', 15)
+        self.korean_ratio = rules.get('korean_ratio', 0.3)
+
+    @classmethod
+    def load(cls, path=DEFAULT_RULES_PATH):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def legal_matches(self, text):
+        """
+        법적 고지 키워드 검사
+
+        Returns:
+            (앞부분에 나온 서로 다른 키워드 수, 전체 등장 횟수)
+            본문이 short_length 이상이면 전체 등장 횟수는 쓰이지 않으므로 계산하지 않음 (0)
+        """
+        head = text[:self.head_chars].lower()
+        head_keywords = sum(1 for keyword in self.legal_keywords if keyword in head)
+        if len(text) >= self.short_length:
+            return head_keywords, 0
+
+        lowered = text.lower()
+        return head_keywords, sum(lowered.count(keyword) for keyword in self.legal_keywords)
+
+    def check_article(self, text):
+        """본문 검증, (유효 여부, 사유) 반환"""
+        if not text or len(text) < self.min_length:
+            return False, 'too_short'
+
+        head_keywords, total = self.legal_matches(text)
+        if head_keywords >= self.head_min_keywords:
+            return False, f'legal_head:{head_keywords}'
+        if len(text) < self.short_length and total >= self.short_min_matches:
+            return False, 'legal_ratio'
+        return True, None
+
+    def is_promo(self, paragraph):
+        """광고성 문구 포함 여부"""
+        lowered = paragraph.lower()
+        return any(phrase in lowered for phrase in self.skip_phrases)
+
+    def filter_paragraphs(self, paragraphs, min_length=None, skip_promo=True):
+        """공백 제거 후 min_length 초과, 광고성 문구가 없는 문단만 반환"""
+        min_length = self.min_paragraph_length if min_length is None else min_length
+        paragraphs = [p.strip() for p in paragraphs]
+        if not skip_promo or not self.skip_phrases:
+            return [p for p in paragraphs if len(p) > min_length]
+
+        # 소문자 문단을 줄바꿈으로 이어 붙이고 문단 시작 위치 기록
+        lowered = [p.lower() for p in paragraphs]
+        starts = []
+        position = 0
+        for p in lowered:
+            starts.append(position)
+            position += len(p) + 1
+        joined = '\n'.join(lowered)
+
+        promo = set()
+        for phrase in self.skip_phrases:
+            index = joined.find(phrase)
+            while index != -1:
+                paragraph_index = bisect.bisect_right(starts, index) - 1
+                promo.add(paragraph_index)
+                # 같은 문단의 나머지는 볼 필요 없음
+                next_start = starts[paragraph_index + 1] if paragraph_index + 1 < len(starts) else len(joined)
+                index = joined.find(phrase, next_start)
+
+        return [p for i, p in enumerate(paragraphs) if len(p) > min_length and i not in promo]
+
+    def korean_ratio_of(self, text):
+        """공백을 제외한 문자 중 한글 음절 비율"""
+        total = sum(map(len, text.split()))
+        if total == 0:
+            return 0.0
+        return sum(map(len, HANGUL_RUN_PATTERN.findall(text))) / total
+
+    def is_korean(self, text):
+        return bool(text) and self.korean_ratio_of(text) > self.korean_ratio
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 응답 캐시 (조건부 요청)
+- 응답 본문과 ETag / Last-Modified 저장
+- 다음 요청에 If-None-Match / If-Modified-Since 전송, 304면 캐시 본문 사용
+- 신선도 기간(fresh_for) 이내면 요청 없이 캐시 본문 사용
+"""
+
+import json
+import time
+
+from cache_store import SQLiteCache
+
+
+class CachedResponse:
+    """requests.Response와 호환되는 최소 인터페이스"""
+
+    def __init__(self, url, text, headers=None, status_code=200, not_modified=False, from_cache=True):
+        self.url = url
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.headers = headers or {}
+        self.status_code = status_code
+        self.not_modified = not_modified
+        self.from_cache = from_cache
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"{self.status_code} Error for url: {self.url}")
+
+
+class HTTPCache:
+    def __init__(self, db_path, table='http', max_entries=1000, ttl=7 * 86400):
+        self.store = SQLiteCache(db_path, table=table, default_ttl=ttl, max_entries=max_entries)
+        self.revalidated = 0
+        self.fresh_hits = 0
+
+    def get(self, send, url, fresh_for=0, headers=None, **kwargs):
+        """
+        캐시를 거쳐 GET 요청
+
+        Args:
+            send: 실제 요청 함수 (url, headers=..., **kwargs) -> Response
+            fresh_for: 이 시간(초) 이내에 받은 응답은 재요청 없이 사용
+
+        Returns:
+            Response 또는 CachedResponse (not_modified=True 이면 이전과 동일한 내용)
+        """
+        entry = self.store.get(url, None)
+        headers = dict(headers or {})
+
+        if entry:
+            if time.time() - entry['fetched_at'] < fresh_for:
+                self.fresh_hits += 1
+                return CachedResponse(url, entry['text'], entry['headers'], not_modified=True)
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = send(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.revalidated += 1
+            entry['fetched_at'] = time.time()
+            self.store.set(url, entry)
+            return CachedResponse(url, entry['text'], entry['headers'], not_modified=True)
+
+        if response.status_code == 200:
+            # 이전 본문과 같으면(서버가 검증자를 주지 않는 경우) 변경 없음으로 표시
+            unchanged = bool(entry) and entry['text'] == response.text
+            self.store.set(url, {
+                'text': response.text,
+                'headers': {'Content-Type': response.headers.get('Content-Type', '')},
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': time.time(),
+            })
+            response.not_modified = unchanged
+            response.from_cache = False
+
+        return response
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 이미지 로컬 저장
+- 여러 이미지를 동시에 다운로드
+- 내용 해시(sha256)로 저장하여 같은 사진은 한 번만 저장 (media/investing/<해시 앞 2자리>/)
+- Pillow가 설치되어 있으면 썸네일/중간 크기 변형 생성 (WebP, 미지원 시 JPEG)
+"""
+
+import hashlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+    features = None
+
+CONTENT_TYPE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/webp': '.webp',
+    'image/gif': '.gif',
+}
+
+# 변형 이름 → 최대 가로 크기(px)
+VARIANT_WIDTHS = {
+    'thumb': 400,
+    'medium': 960,
+}
+
+
+class ImagePipeline:
+    def __init__(self, fetch, media_root, cache, subdir='investing', workers=4, timeout=None):
+        """
+        Args:
+            fetch: URL → Response 함수 (rate limit 적용된 GET)
+            media_root: 저장소의 media/ 디렉토리
+            cache: URL → 결과 dict 캐시 (SQLiteCache)
+            timeout: 기본 timeout → 실제 요청 timeout 함수 (마감 시간 적용), 없으면 기본값 사용
+        """
+        self.fetch = fetch
+        self.timeout = timeout or (lambda default: default)
+        self.media_root = Path(media_root)
+        self.subdir = subdir
+        self.cache = cache
+        self.workers = workers
+        self.variant_format = None
+        if Image is not None:
+            self.variant_format = 'WEBP' if features.check('webp') else 'JPEG'
+
+    def _site_path(self, path):
+        """파일 경로 → 사이트 URL 경로 (/media/...)"""
+        return '/' + path.relative_to(self.media_root.parent).as_posix()
+
+    def _extension(self, url, content_type):
+        ext = CONTENT_TYPE_EXTENSIONS.get((content_type or '').split(';')[0].strip())
+        if ext:
+            return ext
+        suffix = Path(url.split('?')[0]).suffix.lower()
+        return suffix if suffix in ('.jpg', '.jpeg', '.png', '.webp', '.gif') else '.jpg'
+
+    def _write_variants(self, data, base_path):
+        """썸네일/중간 크기 변형 저장, {변형 이름: 경로} 반환"""
+        if Image is None:
+            return {}
+
+        ext = '.webp' if self.variant_format == 'WEBP' else '.jpg'
+        variants = {}
+        with Image.open(io.BytesIO(data)) as original:
+            original = original.convert('RGB')
+            for name, width in VARIANT_WIDTHS.items():
+                path = base_path.with_name(f"{base_path.stem}-{name}{ext}")
+                if not path.exists():
+                    image = original
+                    if original.width > width:
+                        height = round(original.height * width / original.width)
+                        image = original.resize((width, height), Image.LANCZOS)
+                    tmp_path = path.with_name(path.name + '.tmp')
+                    image.save(tmp_path, self.variant_format, quality=80)
+                    tmp_path.replace(path)
+                variants[name] = self._site_path(path)
+        return variants
+
+    def process(self, url):
+        """이미지 1개 다운로드/저장, {'image', 'thumb', 'medium'} 반환 (실패 시 None)"""
+        response = self.fetch(url, timeout=self.timeout(30))
+        if response.status_code != 200 or not response.content:
+            print(f"  [WARNING] 이미지 다운로드 실패 (HTTP {response.status_code}): {url}")
+            return None
+
+        data = response.content
+        digest = hashlib.sha256(data).hexdigest()
+        ext = self._extension(url, response.headers.get('Content-Type'))
+        path = self.media_root / self.subdir / digest[:2] / f"{digest[:16]}{ext}"
+
+        # 같은 내용이면 이미 저장된 파일 재사용
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + '.tmp')
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+
+        result = {'image': self._site_path(path)}
+        try:
+            result.update(self._write_variants(data, path))
+        except Exception as e:
+            print(f"  [WARNING] 이미지 변형 생성 실패 ({url}): {e}")
+        return result
+
+    def process_many(self, urls, cached_only=False):
+        """여러 이미지를 동시에 처리, {url: 결과 dict} 반환 (캐시 우선, cached_only 이면 다운로드하지 않음)"""
+        urls = list(dict.fromkeys(u for u in urls if u))
+        results = self.cache.get_many(urls)
+
+        # 캐시에 있어도 파일이 지워졌으면 다시 받음
+        for url, result in list(results.items()):
+            if not (self.media_root.parent / result['image'].lstrip('/')).exists():
+                del results[url]
+
+        missing = [u for u in urls if u not in results]
+        if not missing or cached_only:
+            return results
+
+        def safe_process(url):
+            try:
+                return self.process(url)
+            except Exception as e:
+                print(f"  [WARNING] 이미지 처리 실패 ({url}): {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(missing))) as executor:
+            processed = dict(zip(missing, executor.map(safe_process, missing)))
+
+        stored = {url: result for url, result in processed.items() if result}
+        self.cache.set_many(stored)
+        results.update(stored)
+        return results
@@ -6,44 +6,255 @@ Investing.com 완전판 크롤러 (한국어)
 - 실제 페이지에서 전체 본문 크롤링
 - 관련 주식 정보 추가
 - 한국어 자동 번역 (필요시)
+
+cloudscraper, bs4, readability, deep_translator는 시작 시간을 줄이기 위해
+처음 필요한 단계에서 import (새 기사가 없는 실행은 번역기/본문 파서를 로드하지 않음)
 """
 
-import cloudscraper
-from bs4 import BeautifulSoup
-from readability import Document
-from deep_translator import GoogleTranslator
+from collections import OrderedDict
 from datetime import datetime
+import hashlib
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
+from urllib.parse import urlencode, urlparse
+import json
 import sys
+import threading
 import time
 
+from cache_store import SQLiteCache
+from content_filter import ContentFilter
+from http_cache import HTTPCache
+from image_pipeline import ImagePipeline
+from near_duplicate import NearDuplicateIndex
+from news_sources import DEFAULT_SOURCES_PATH, load_news_sources, merge_candidates
+from next_data import extract_next_data, find_access_token, find_article
+from quote_snapshot import QuoteSnapshot
+from rate_limit import HostRateLimiter
+from run_deadline import RunDeadline
+from run_metrics import RunMetrics, prune_runs
+from search_index import SearchIndexBuilder
+from seen_index import SeenArticleIndex, read_article_id
+from session_state import SessionState
+from work_queue import LeaseKeeper, WorkQueue, default_worker_id
+
+# 본문 내 종목 코드 패턴: (KS:005930), (NASDAQ:NVDA), (TYO:9984) 등
+TICKER_PATTERN = re.compile(r'\(([A-Z]+):([A-Z0-9]+)\)')
+
+# 문단 구분 (빈 줄)
+PARAGRAPH_SPLIT_PATTERN = re.compile(r'\n\s*\n')
+
+# 파일명 정리 (허용 문자 외 제거, 공백/하이픈 연속은 하이픈 하나로)
+FILENAME_STRIP_PATTERN = re.compile(r'[^\w\sㄱ-ㅎㅏ-ㅣ가-힣-]')
+FILENAME_DASH_PATTERN = re.compile(r'[-\s]+')
+
+# 제목 끝의 출처 표기 ("By Investing.com", "- InvestingPro" 등), 순서대로 적용
+TITLE_SOURCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s*By\s+Investing\.com\s*$',
+    r'\s*By\s+InvestingPro\s*$',
+    r'\s*-\s*Investing\.com\s*$',
+    r'\s*-\s*InvestingPro\s*$',
+))
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 문장 구분 (긴 문단을 나눌 때 사용)
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?。])\s+')
+
+# 기본 위치(.cache/metrics/)에 남길 실행 메트릭 파일 수
+METRICS_KEEP_RUNS = 30
+
+# 감시 모드에서 기억할 최근 목록 article_id 수 (오래된 ID의 중복 확인은 기사 인덱스가 담당)
+POLLED_IDS_MAX = 2000
+
 # Windows 콘솔 인코딩 문제 해결
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 
 class InvestingCompleteKR:
-    def __init__(self):
+    def __init__(self, scraper=None, translator=None, posts_dir=None, cache_dir=None, rules_path=None,
+                 sources_path=None):
+        """
+        Args:
+            scraper: HTTP 세션 (기본: cloudscraper, 테스트/벤치마크에서는 replay 세션)
+            translator: 번역기 (기본: GoogleTranslator)
+            posts_dir: 포스트 저장 경로 (기본: ../_posts)
+            cache_dir: 로컬 상태 경로 (기본: ./.cache)
+            rules_path: 본문 필터 규칙 JSON (기본: ./content_rules.json)
+            sources_path: 뉴스 목록 소스 JSON (기본: ./news_sources.json)
+        """
         self.base_url = "https://www.investing.com"
-        self.api_url = "https://endpoints.investing.com/news-delivery/api/v2/articles/delivery/domains/18/news/lists/breaking-news"
+        # 뉴스 목록 소스 (우선순위 순, 동시에 요청 후 article_id로 병합), 백필은 첫 번째 소스 사용
+        self.news_sources = load_news_sources(sources_path or DEFAULT_SOURCES_PATH)
+        self.api_url = self.news_sources[0]['url']
         self.instrument_api_url = "https://endpoints.investing.com/pd-instruments/v1/instruments"
-        self.posts_dir = Path(__file__).parent.parent / "_posts"
-        self.posts_dir.mkdir(exist_ok=True)
+        self.posts_dir = Path(posts_dir) if posts_dir else Path(__file__).parent.parent / "_posts"
+        self.posts_dir.mkdir(parents=True, exist_ok=True)
+        self.archive_dir = self.posts_dir.parent / "_archive"
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(__file__).parent / ".cache"
+
+        # 본문 검증/문단 필터/한국어 판별 규칙 (컴파일된 단일 패스 매처)
+        self.content_filter = ContentFilter.load(rules_path) if rules_path else ContentFilter.load()
+
+        # 처리 완료 기사 인덱스 (article_id 기반)
+        self.seen_index = SeenArticleIndex(self.cache_dir / "seen_articles.txt", self.posts_dir, self.archive_dir)
+
+        # 검색 인덱스 (assets/search/ 월별 샤드, 새 포스트만 반영)
+        self.search_index = SearchIndexBuilder(self.posts_dir, self.posts_dir.parent / "assets" / "search",
+                                               self.archive_dir)
         
-        # cloudscraper 세션 생성
-        self.scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }
+        # HTTP 세션/번역기는 처음 사용할 때 생성 (scraper, translator 속성)
+        self._scraper = None
+        self._translator = translator
+
+        # 이전 실행의 토큰/쿠키 복원 (만료 전까지 재사용)
+        self.session_state = SessionState(self.cache_dir / "session.json")
+        self.bearer_token = self.session_state.valid_token()
+        self.token_lock = threading.Lock()
+        if self.bearer_token:
+            print(f"[INFO] 저장된 세션 토큰 사용")
+        if scraper is not None:
+            self.scraper = scraper
+
+        # 호스트별 요청 속도 제한 (스레드 간 공유)
+        self.rate_limiter = HostRateLimiter()
+
+        # HTTP 응답 캐시 (ETag/Last-Modified 조건부 요청)
+        # 뉴스 목록: 소스 수만큼의 작은 캐시 (남아 있는 기사 페이지 항목도 LRU로 정리됨)
+        # 기사 페이지: 같은 기사를 다시 처리할 때(실패 후 재시도)만 쓰이므로 본문은 적게, 짧게 보관
+        # list_fresh_for: 뉴스 목록을 재요청 없이 재사용하는 시간(초), page_fresh_for: 기사 페이지
+        self.http_cache = HTTPCache(self.cache_dir / "http.sqlite3", max_entries=100)
+        self.page_cache = HTTPCache(self.cache_dir / "http.sqlite3", table='http_pages', max_entries=100, ttl=86400)
+        self.list_fresh_for = 0
+        self.page_fresh_for = 3600
+        self.news_list_unchanged = False
+
+        # 한국어/영어 기사 페이지 hedged 요청
+        # hedge_delay: 한국어 요청 후 이 시간(초) 안에 결과가 없으면 영어도 요청 (None이면 한국어 완료 후 순차 요청)
+        # korean_grace: 영어가 먼저 성공해도 한국어를 더 기다리는 시간(초)
+        self.hedge_delay = 0.5
+        self.korean_grace = 1.0
+
+        # 주식 정보 캐시 (기사/실행 간 공유, 시세 변동을 고려해 짧은 TTL)
+        self.instrument_batch_size = 20
+        self.instrument_cache = SQLiteCache(self.cache_dir / "cache.sqlite3", table='instruments', default_ttl=600)
+
+        # 종목 코드(exchange:symbol) → 종목 검색 결과 캐시 (검색 실패도 짧게 캐시)
+        self.symbol_cache = SQLiteCache(self.cache_dir / "cache.sqlite3", table='symbols',
+                                        default_ttl=30 * 86400, max_entries=20000)
+        self.symbol_miss_ttl = 86400
+
+        # 종목 뱃지용 정적 데이터 (종목 코드 → instrument_id, 시세 스냅샷)
+        # 새 포스트가 없으면 quote_refresh_interval(초)이 지났을 때만 시세 갱신
+        self.quote_snapshot = QuoteSnapshot(self.posts_dir.parent / "assets" / "data" / "tickers.json")
+        self.quote_refresh_interval = 3600
+
+        # 번역 메모리: 정규화된 원문 문단 해시 → 번역문 (항목 수 기준으로 LRU 제거)
+        self.translation_memory = SQLiteCache(self.cache_dir / "cache.sqlite3", table='translations',
+                                              max_entries=50000)
+        self.translation_workers = 3
+
+        # 메인 이미지 로컬 저장 (media/investing/, 내용 해시로 중복 제거 + 썸네일/중간 크기 변형)
+        self.image_pipeline = ImagePipeline(
+            self.http_get, self.posts_dir.parent / "media",
+            SQLiteCache(self.cache_dir / "cache.sqlite3", table='images', max_entries=20000),
+            timeout=self.request_timeout
         )
-        
-        # 번역기 초기화
-        self.translator = GoogleTranslator(source='en', target='ko')
-        self.bearer_token = None
+        self.local_images = {}
+
+        # 유사 기사 탐지 (재배포/수정판은 번역 전에 건너뜀, SimHash + LSH 버킷)
+        self.near_duplicates = NearDuplicateIndex(self.cache_dir / "near_duplicates.sqlite3")
+
+        # 단계별 시간/요청 수 측정 (run() 마다 새로 생성)
+        self.metrics = RunMetrics()
+        self.metrics_path = None
+        # 감시 모드 확인 간격 계산용: 직전 확인 이후 목록에 새로 나타난 기사 수,
+        # 이번 실행에서 limit 때문에 남은 기사 수, 최근 목록에서 본 article_id (최대 POLLED_IDS_MAX개, 오래된 순)
+        self.last_new_count = 0
+        self.last_pending_count = 0
+        self.polled_ids = OrderedDict()
+
+        # 실행 마감 시간 (--deadline, 초), run() 마다 새로 시작
+        self.deadline_seconds = None
+        self.deadline = None
+
+        # 공유 작업 큐 (--queue), 없으면 이 프로세스가 목록의 기사를 직접 처리
+        self.work_queue = None
+        self.worker_id = default_worker_id()
+        # 일시적으로 처리하지 못한 기사를 큐에서 다시 가져가기까지의 시간(초)
+        self.queue_retry_delay = 600
+
+    @property
+    def scraper(self):
+        """cloudscraper 세션 (처음 요청할 때 생성)"""
+        if self._scraper is None:
+            import cloudscraper
+
+            self.scraper = cloudscraper.create_scraper(
+                browser={
+                    'browser': 'chrome',
+                    'platform': 'windows',
+                    'mobile': False
+                }
+            )
+        return self._scraper
+
+    @scraper.setter
+    def scraper(self, session):
+        self._scraper = session
+        restored = self.session_state.restore_session(session)
+        if restored:
+            print(f"[INFO] 저장된 쿠키 {restored}개 복원")
+
+    @property
+    def translator(self):
+        """번역기 (처음 번역할 때 생성)"""
+        if self._translator is None:
+            from deep_translator import GoogleTranslator
+
+            self._translator = GoogleTranslator(source='en', target='ko')
+        return self._translator
+
+    def http_get(self, url, fresh_for=None, cache=None, **kwargs):
+        """Rate limit을 적용한 GET 요청 (fresh_for 지정 시 HTTP 캐시 사용, 기본: 뉴스 목록 캐시)"""
+        if fresh_for is not None:
+            return (cache or self.http_cache).get(self._send_get, url, fresh_for=fresh_for, **kwargs)
+        return self._send_get(url, **kwargs)
+
+    def _send_get(self, url, **kwargs):
+        self.rate_limiter.wait(url)
+        response = self.scraper.get(url, **kwargs)
+        self._count_response(url, response)
+        return response
+
+    def http_post(self, url, **kwargs):
+        """Rate limit을 적용한 POST 요청"""
+        self.rate_limiter.wait(url)
+        response = self.scraper.post(url, **kwargs)
+        self._count_response(url, response)
+        return response
+
+    def _count_response(self, url, response):
+        """요청 수/수신 바이트 메트릭 기록"""
+        self.metrics.count('requests')
+        self.metrics.count(f"requests.{urlparse(url).hostname}")
+        self.metrics.count('bytes', len(response.content or b''))
+        if response.status_code >= 400:
+            self.metrics.count('http_errors')
     
+    def request_timeout(self, default):
+        """요청 timeout (마감 시간이 있으면 남은 시간 이내)"""
+        return self.deadline.timeout(default) if self.deadline else default
+
+    def within_budget(self, step):
+        """마감 시간까지 선택 작업 step(crawl/tickers/instruments)을 실행할 여유가 있는지"""
+        if self.deadline is None or self.deadline.allows(step):
+            return True
+        self.metrics.count(f'deadline_skip_{step}')
+        return False
+
     def search_instrument(self, search_text):
         """
         Investing.com 검색 API로 종목 정보 조회
@@ -79,7 +290,7 @@ class InvestingCompleteKR:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:145.0) Gecko/20100101 Firefox/145.0'
             }
 
-            response = self.scraper.post(url, data=data, headers=headers, timeout=30)
+            response = self.http_post(url, data=data, headers=headers, timeout=self.request_timeout(30))
 
             if response.status_code == 200:
                 result_data = response.json()
@@ -113,28 +324,23 @@ class InvestingCompleteKR:
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.9',
             }
-            response = self.scraper.get(f"{self.base_url}/news/latest-news", headers=headers, timeout=30)
+            response = self.http_get(f"{self.base_url}/news/latest-news", headers=headers, timeout=self.request_timeout(30))
 
             if response.status_code != 200:
                 print(f"[WARNING] 페이지 로드 실패 (HTTP {response.status_code})")
 
             # 방법 1: __NEXT_DATA__에서 accessToken 추출 (가장 확실한 방법)
-            soup = BeautifulSoup(response.text, 'lxml')
-            next_data = soup.find('script', {'id': '__NEXT_DATA__'})
-
-            if next_data:
-                try:
-                    import json
-                    data = json.loads(next_data.string)
+            try:
+                data = extract_next_data(response.text)
 
-                    # props.pageProps.accessToken 경로로 접근
-                    access_token = data.get('props', {}).get('pageProps', {}).get('accessToken')
+                # props.pageProps.accessToken 경로로 접근
+                access_token = find_access_token(data) if data else None
 
-                    if access_token and len(access_token) > 100 and '.' in access_token:
-                        print(f"[OK] __NEXT_DATA__에서 JWT 토큰 발견 (길이: {len(access_token)})")
-                        return access_token
-                except Exception as e:
-                    print(f"[WARNING] __NEXT_DATA__ 파싱 실패: {e}")
+                if access_token and len(access_token) > 100 and '.' in access_token:
+                    print(f"[OK] __NEXT_DATA__에서 JWT 토큰 발견 (길이: {len(access_token)})")
+                    return access_token
+            except Exception as e:
+                print(f"[WARNING] __NEXT_DATA__ 파싱 실패: {e}")
 
             # 방법 2: Regex 패턴 사용 (Fallback)
             print("[INFO] Regex 패턴으로 시도 중...")
@@ -174,13 +380,105 @@ class InvestingCompleteKR:
             print(f"[WARNING] 토큰 추출 실패: {e}")
             return None
     
-    def fetch_breaking_news_api(self):
-        """API로 Breaking News 목록 가져오기"""
+    def refresh_bearer_token(self, rejected=None):
+        """
+        Bearer 토큰을 새로 추출하고 세션 상태 저장
+
+        Args:
+            rejected: 거부된 토큰 (여러 목록을 동시에 요청할 때 다른 스레드가 이미 갱신했으면 재사용)
+        """
+        with self.token_lock:
+            if rejected is not None and self.bearer_token and self.bearer_token != rejected:
+                return self.bearer_token
+            with self.metrics.stage('token'):
+                self.bearer_token = self.extract_bearer_token()
+            self.session_state.set_token(self.bearer_token)
+            self.save_session()
+            return self.bearer_token
+
+    def save_session(self):
+        """토큰과 쿠키를 다음 실행을 위해 저장"""
+        try:
+            if self._scraper is not None:
+                self.session_state.capture_session(self._scraper)
+            self.session_state.save()
+        except Exception as e:
+            print(f"[WARNING] 세션 상태 저장 실패: {e}")
+
+    def parse_article(self, article):
+        """news-delivery API 기사 항목을 내부 기사 dict로 변환"""
+        # 메인 이미지 추출
+        main_image = None
+        media = article.get('media', [])
+        for m in media:
+            if m.get('purpose') == 'main_image':
+                main_image = m.get('url')
+                break
+        
+        # URL 생성
+        link = article.get('link', '')
+        full_url = f"{self.base_url}{link}" if link.startswith('/') else link
+        
+        # 관련 주식 ID 추출
+        instruments = article.get('instruments') or []
+        instrument_ids = [inst['id'] for inst in instruments if inst and inst.get('primary_tag')]
+        
+        return {
+            'id': article.get('id'),
+            'title': article.get('title', ''),
+            'url': full_url,
+            'summary': article.get('body', ''),  # API 요약
+            'image_url': main_image,
+            'instrument_ids': instrument_ids[:5],  # 최대 5개만
+            'published': article.get('published_at', ''),
+        }
+
+    def fetch_breaking_news_api(self, params=None):
+        """
+        API로 Breaking News(첫 번째 소스) 목록 가져오기
+
+        Args:
+            params: 추가 쿼리 파라미터 (예: 페이지 번호). 지정하면 HTTP 캐시를 사용하지 않음
+        """
+        articles, unchanged = self.fetch_news_list(self.api_url, params)
+        self.news_list_unchanged = unchanged
+        return articles
+
+    def fetch_news_sources(self):
+        """
+        설정된 모든 뉴스 목록을 동시에 요청
+
+        Returns:
+            [(소스 dict, 기사 목록 또는 None), ...] (우선순위 순)
+        """
+        if not self.bearer_token:
+            self.refresh_bearer_token()
+
+        if len(self.news_sources) == 1:
+            lists = [self.fetch_news_list(self.news_sources[0]['url'])]
+        else:
+            with ThreadPoolExecutor(max_workers=len(self.news_sources)) as executor:
+                lists = list(executor.map(
+                    lambda source: self.fetch_news_list(source['url'], label=source['name']),
+                    self.news_sources
+                ))
+
+        self.news_list_unchanged = all(unchanged for _, unchanged in lists)
+        return [(source, articles) for source, (articles, _) in zip(self.news_sources, lists)]
+
+    def fetch_news_list(self, list_url, params=None, label=None):
+        """
+        뉴스 목록 1개 요청
+
+        Returns:
+            (기사 목록 또는 None, 이전 실행과 같은 목록인지 여부)
+        """
+        prefix = f"[{label}] " if label else ""
         try:
             if not self.bearer_token:
-                self.bearer_token = self.extract_bearer_token()
+                self.refresh_bearer_token()
             
-            print(f"\n[INFO] API 호출 중...")
+            print(f"\n[INFO] {prefix}API 호출 중...")
 
             headers = {
                 'Accept': 'application/json, text/plain, */*',
@@ -194,174 +492,171 @@ class InvestingCompleteKR:
             if self.bearer_token:
                 headers['Authorization'] = f'Bearer {self.bearer_token}'
 
-            response = self.scraper.get(self.api_url, headers=headers, timeout=30)
+            url = f"{list_url}?{urlencode(params)}" if params else list_url
+            fresh_for = None if params else self.list_fresh_for
+            response = self.http_get(url, fresh_for=fresh_for, headers=headers, timeout=self.request_timeout(30))
+
+            # 토큰 만료/거부 시 한 번만 새 토큰으로 재시도
+            if response.status_code in (401, 403):
+                print(f"[INFO] {prefix}인증 실패 (HTTP {response.status_code}), 토큰 갱신 후 재시도")
+                self.metrics.count('retries')
+                rejected = headers.get('Authorization', '').replace('Bearer ', '', 1)
+                if self.refresh_bearer_token(rejected=rejected):
+                    headers['Authorization'] = f'Bearer {self.bearer_token}'
+                else:
+                    headers.pop('Authorization', None)
+                response = self.http_get(url, fresh_for=fresh_for, headers=headers, timeout=self.request_timeout(30))
             
             if response.status_code == 200:
+                # 이전 실행과 목록이 같은지 (304 또는 동일 본문)
+                unchanged = getattr(response, 'not_modified', False)
+                if unchanged:
+                    print(f"[INFO] {prefix}뉴스 목록 변경 없음 (캐시 사용)")
+
                 data = response.json()
                 articles = data.get('articles', [])
-                print(f"[OK] API로부터 {len(articles)}개 기사 수신\n")
+                print(f"[OK] {prefix}API로부터 {len(articles)}개 기사 수신\n")
                 
                 # 기사 정보 파싱
-                parsed_articles = []
-                for article in articles:
-                    # 메인 이미지 추출
-                    main_image = None
-                    media = article.get('media', [])
-                    for m in media:
-                        if m.get('purpose') == 'main_image':
-                            main_image = m.get('url')
-                            break
-                    
-                    # URL 생성
-                    link = article.get('link', '')
-                    full_url = f"{self.base_url}{link}" if link.startswith('/') else link
-                    
-                    # 관련 주식 ID 추출
-                    instruments = article.get('instruments') or []
-                    instrument_ids = [inst['id'] for inst in instruments if inst and inst.get('primary_tag')]
-                    
-                    parsed_articles.append({
-                        'id': article.get('id'),
-                        'title': article.get('title', ''),
-                        'url': full_url,
-                        'summary': article.get('body', ''),  # API 요약
-                        'image_url': main_image,
-                        'instrument_ids': instrument_ids[:5],  # 최대 5개만
-                        'published': article.get('published_at', ''),
-                    })
+                parsed_articles = [self.parse_article(article) for article in articles]
                 
-                return parsed_articles
+                return parsed_articles, unchanged
             else:
-                print(f"[ERROR] API 호출 실패 (코드: {response.status_code})")
-                return None
+                print(f"[ERROR] {prefix}API 호출 실패 (코드: {response.status_code})")
+                return None, False
                 
         except Exception as e:
-            print(f"[ERROR] API 호출 실패: {e}")
-            return None
+            print(f"[ERROR] {prefix}API 호출 실패: {e}")
+            return None, False
     
+    def fetch_article_variant(self, url):
+        """
+        기사 페이지 1개에서 __NEXT_DATA__ 본문 추출
+
+        Returns:
+            (제목, 본문, HTML) - 본문이 없거나 유효하지 않으면 본문은 None, 페이지가 없으면 HTML도 None
+        """
+        from bs4 import BeautifulSoup
+
+        response = self.http_get(url, fresh_for=self.page_fresh_for, cache=self.page_cache,
+                                 timeout=self.request_timeout(30))
+        if response.status_code == 404:
+            print(f"  - 페이지 없음: {url}")
+            return None, None, None
+        response.raise_for_status()
+        html = response.text
+
+        # __NEXT_DATA__에서 전체 기사 데이터 추출 (HTML 전체 파싱 없이)
+        try:
+            data = extract_next_data(html)
+            # 알려진 경로(articleStore 등) 우선, 실패 시 전체 탐색
+            article_data = find_article(data) if data else None
+        except Exception as e:
+            print(f"  [WARNING] __NEXT_DATA__ 파싱 실패: {e}")
+            return None, None, html
+
+        if not article_data or not article_data.get('body'):
+            return None, None, html
+
+        # HTML을 텍스트로 변환 (의미있는 문단만, 광고성 문구 제외)
+        body_soup = BeautifulSoup(article_data['body'], 'lxml')
+        content_parts = self.content_filter.filter_paragraphs(
+            p.get_text() for p in body_soup.find_all(['p', 'h2', 'h3', 'li'])
+        )
+        content = '\n\n'.join(content_parts)
+
+        # 본문 검증
+        if content and self.is_valid_article_content(content):
+            print(f"  - __NEXT_DATA__에서 본문 추출 완료 ({len(content)} 자, {urlparse(url).hostname})")
+            return article_data.get('title', ''), content, html
+        if content:
+            print(f"  - __NEXT_DATA__ 결과가 유효하지 않음 (법적 고지 등, {urlparse(url).hostname})")
+        return None, None, html
+
+    def _fetch_variant_safely(self, url):
+        try:
+            return self.fetch_article_variant(url)
+        except Exception as e:
+            print(f"  [WARNING] 크롤링 실패 ({url}): {e}")
+            return None, None, None
+
+    def fetch_hedged(self, korean_url, english_url):
+        """
+        한국어/영어 기사 페이지를 hedged 방식으로 요청
+        - 한국어를 먼저 요청하고 hedge_delay 안에 유효한 본문이 없으면 영어도 요청 (한국어 실패 시 즉시)
+        - 먼저 유효한 본문을 반환, 영어가 먼저 성공하면 한국어를 korean_grace 초 더 기다림
+        - 남은 요청은 기다리지 않음 (시작 전이면 취소)
+
+        Returns:
+            {'ko': (제목, 본문, HTML), 'en': ...} 중 완료된 결과, 선택된 언어 ('ko', 'en' 또는 None)
+        """
+        executor = ThreadPoolExecutor(max_workers=2)
+        results = {}
+        try:
+            korean = executor.submit(self._fetch_variant_safely, korean_url)
+            done, _ = wait([korean], timeout=self.hedge_delay)
+            if done:
+                results['ko'] = korean.result()
+                if results['ko'][1]:
+                    return results, 'ko'
+            else:
+                self.metrics.count('hedged_requests')
+
+            english = executor.submit(self._fetch_variant_safely, english_url)
+            futures = {english: 'en'}
+            if not done:
+                futures[korean] = 'ko'
+
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[futures[future]] = future.result()
+
+                if results.get('ko', (None, None))[1]:
+                    return results, 'ko'
+                if results.get('en', (None, None))[1]:
+                    if korean in pending:
+                        finished, _ = wait([korean], timeout=self.korean_grace)
+                        if finished:
+                            results['ko'] = korean.result()
+                            if results['ko'][1]:
+                                return results, 'ko'
+                    return results, 'en'
+            return results, None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def fetch_full_article_content(self, url):
-        """실제 기사 페이지에서 전체 본문 크롤링"""
+        """실제 기사 페이지에서 전체 본문 크롤링 (한국어 우선, 영어 원본과 hedged 요청)"""
         try:
             print(f"  - 전체 본문 크롤링 중...")
-            time.sleep(1)
 
-            # 한국어 사이트와 영어 사이트 모두 시도
-            urls_to_try = [
-                url.replace('www.investing.com', 'kr.investing.com'),  # 한국어 우선
-                url  # 영어 원본
-            ]
+            korean_url = url.replace('www.investing.com', 'kr.investing.com')
+            results, chosen = self.fetch_hedged(korean_url, url)
+            if chosen:
+                self.metrics.count(f'crawl_source_{chosen}')
+                title, content, _ = results[chosen]
+                return title, content
 
-            for try_url in urls_to_try:
-                try:
-                    response = self.scraper.get(try_url, timeout=30)
-                    response.raise_for_status()
-
-                    soup = BeautifulSoup(response.text, 'lxml')
-
-                    # __NEXT_DATA__에서 전체 기사 데이터 추출
-                    next_data_script = soup.find('script', {'id': '__NEXT_DATA__'})
-
-                    if next_data_script:
-                        try:
-                            import json
-                            data = json.loads(next_data_script.string)
-
-                            # 현재 기사의 본문을 찾기 위해 articleStore를 우선 탐색
-                            def find_article_body(obj, depth=0):
-                                if depth > 10:
-                                    return None
-
-                                if isinstance(obj, dict):
-                                    # articleStore나 article 키를 찾아서 그 안의 body를 우선
-                                    if 'articleStore' in obj or 'article' in obj:
-                                        article_obj = obj.get('articleStore') or obj.get('article')
-                                        if isinstance(article_obj, dict):
-                                            body = article_obj.get('body', '')
-                                            if isinstance(body, str) and len(body) > 500:
-                                                return {'title': article_obj.get('title', ''), 'body': body}
-
-                                    # 일반 body 검색 (길이가 충분히 긴 것만)
-                                    if 'body' in obj and 'title' in obj:
-                                        body = obj.get('body', '')
-                                        if isinstance(body, str) and len(body) > 500:
-                                            return {'title': obj.get('title', ''), 'body': body}
-
-                                    # 재귀 탐색
-                                    for v in obj.values():
-                                        result = find_article_body(v, depth+1)
-                                        if result:
-                                            return result
-
-                                elif isinstance(obj, list):
-                                    for item in obj:
-                                        result = find_article_body(item, depth+1)
-                                        if result:
-                                            return result
-
-                                return None
-
-                            article_data = find_article_body(data)
-
-                            if article_data and article_data.get('body'):
-                                title = article_data.get('title', '')
-                                body_html = article_data['body']
-
-                                # HTML을 텍스트로 변환
-                                body_soup = BeautifulSoup(body_html, 'lxml')
-
-                                # 본문 텍스트 추출
-                                paragraphs = body_soup.find_all(['p', 'h2', 'h3', 'li'])
-                                content_parts = []
-
-                                for p in paragraphs:
-                                    text = p.get_text().strip()
-                                    # 의미있는 문단만
-                                    if text and len(text) > 15:
-                                        # 광고성 문구 필터링
-                                        skip_phrases = ['subscribe', 'newsletter', 'sign up', 'click here',
-                                                       '구독', '뉴스레터', '가입']
-                                        if not any(skip.lower() in text.lower() for skip in skip_phrases):
-                                            content_parts.append(text)
-
-                                content = '\n\n'.join(content_parts)
-
-                                # 본문 검증
-                                if content and self.is_valid_article_content(content):
-                                    print(f"  - __NEXT_DATA__에서 본문 추출 완료 ({len(content)} 자)")
-                                    return title, content
-                                elif content:
-                                    print(f"  - __NEXT_DATA__ 결과가 유효하지 않음 (법적 고지 등)")
-                                    # 다음 URL 시도
-                                    continue
-
-                        except Exception as e:
-                            print(f"  [WARNING] __NEXT_DATA__ 파싱 실패: {e}")
-
-                    # 이 URL에서 성공했다면 Readability 시도하지 않고 다음 URL로
-                    # (한국어에서 실패하면 영어 시도)
+            # Fallback: Readability 사용 (영어 원본 페이지 우선)
+            html = results.get('en', (None, None, None))[2] or results.get('ko', (None, None, None))[2]
+            if not html:
+                return None, None
 
-                except Exception as e:
-                    # 404나 다른 에러면 다음 URL 시도
-                    if '404' in str(e):
-                        print(f"  - 한국어 페이지 없음, 영어 페이지 시도...")
-                        continue
-                    print(f"  [WARNING] 크롤링 실패 ({try_url}): {e}")
-                    continue
-            
-            # Fallback: Readability 사용
             print(f"  - Readability 방식으로 시도...")
-            doc = Document(response.text)
+            from bs4 import BeautifulSoup
+            from readability import Document
+
+            doc = Document(html)
             title = doc.title()
             content_html = doc.summary()
 
             soup2 = BeautifulSoup(content_html, 'lxml')
             paragraphs = soup2.find_all(['p', 'h2', 'h3'])
-            content_parts = []
-
-            for p in paragraphs:
-                text = p.get_text().strip()
-                if text and len(text) > 20:
-                    content_parts.append(text)
+            content_parts = self.content_filter.filter_paragraphs(
+                (p.get_text() for p in paragraphs), min_length=20, skip_promo=False
+            )
 
             content = '\n\n'.join(content_parts)
 
@@ -378,38 +673,115 @@ class InvestingCompleteKR:
             print(f"  [WARNING] 본문 크롤링 실패: {e}")
             return None, None
     
-    def fetch_instrument_info(self, instrument_ids):
-        """관련 주식 정보 가져오기"""
+    def parse_instrument(self, inst):
+        """instruments API 응답 항목을 주식 정보 dict로 변환"""
+        return {
+            'id': inst.get('id'),
+            'name': inst.get('long_name', inst.get('short_name', '')),
+            'symbol': inst.get('symbol', ''),
+            'exchange_id': inst.get('exchange_id'),
+            'price': inst.get('price', {}),
+            'link': f"{self.base_url}{inst.get('link', '')}" if inst.get('link') else '',
+        }
+
+    def fetch_instruments_batch(self, instrument_ids):
+        """
+        여러 주식 정보를 한 번에 조회 (캐시 우선, 없는 ID만 batch 요청)
+
+        Returns:
+            dict: {instrument_id(str): 주식 정보 dict}
+        """
+        ids = list(dict.fromkeys(str(i) for i in instrument_ids if i))
+        if not ids:
+            return {}
+
+        result = self.instrument_cache.get_many(ids)
+        missing = [i for i in ids if i not in result]
+
+        for start in range(0, len(missing), self.instrument_batch_size):
+            batch = missing[start:start + self.instrument_batch_size]
+            try:
+                url = f"{self.instrument_api_url}?instrument_ids={','.join(batch)}"
+                response = self.http_get(url, timeout=self.request_timeout(10))
+
+                if response.status_code == 200:
+                    fetched = {}
+                    for inst in response.json() or []:
+                        if inst and inst.get('id'):
+                            fetched[str(inst['id'])] = self.parse_instrument(inst)
+                    self.instrument_cache.set_many(fetched)
+                    result.update(fetched)
+                else:
+                    print(f"  [WARNING] 주식 정보 조회 실패 (코드: {response.status_code})")
+            except Exception as e:
+                print(f"  [WARNING] 주식 정보 조회 실패: {e}")
+
+        return result
+
+    def prefetch_instruments(self, articles):
+        """처리할 모든 기사의 주식 정보를 미리 batch 조회하여 캐시에 저장"""
+        ids = [inst_id for article in articles for inst_id in article.get('instrument_ids', [])[:3]]
+        if not ids:
+            return
+
+        unique_count = len(set(map(str, ids)))
+        print(f"[INFO] 관련 주식 정보 일괄 조회 중 ({unique_count}개)...")
+        fetched = self.fetch_instruments_batch(ids)
+        print(f"[OK] 주식 정보 {len(fetched)}개 준비 완료\n")
+
+    def prefetch_images(self, articles):
+        """처리할 기사들의 메인 이미지를 동시에 다운로드하여 media/ 에 저장"""
+        urls = [article.get('image_url') for article in articles if article.get('image_url')]
+        if not urls:
+            return
+
+        # 마감 시간이 가까우면 이미 저장된 이미지만 사용 (나머지 포스트는 원본 이미지 URL 사용)
+        cached_only = not self.within_budget('images')
+        if cached_only:
+            print(f"[INFO] 마감 시간 임박, 저장된 메인 이미지만 사용 ({len(urls)}개)...")
+        else:
+            print(f"[INFO] 메인 이미지 저장 중 ({len(urls)}개)...")
+        self.local_images.update(self.image_pipeline.process_many(urls, cached_only=cached_only))
+        saved = sum(1 for url in urls if url in self.local_images)
+        print(f"[OK] 이미지 {saved}개 준비 완료\n")
+
+    def write_quote_snapshot(self, force=False):
+        """종목 뱃지용 정적 데이터 저장 (시세는 batch 조회, 변경이 없고 최근에 갱신했으면 생략)"""
+        if not force and not self.quote_snapshot.changed and self.quote_snapshot.age() < self.quote_refresh_interval:
+            return
+
+        ids = self.quote_snapshot.instrument_ids()
+        try:
+            fetched = self.fetch_instruments_batch(ids)
+            symbols, quotes = self.quote_snapshot.write(fetched)
+            print(f"[OK] 종목 데이터 저장 (종목 코드 {symbols}개, 시세 {quotes}개)")
+        except Exception as e:
+            print(f"[WARNING] 종목 데이터 저장 실패: {e}")
+
+    def seed_quote_snapshot(self):
+        """기존 포스트(_posts/, _archive/)의 종목으로 스냅샷 대상 채우기 (시세는 write_quote_snapshot 에서 조회)"""
+        posts = list(self.posts_dir.glob('*.md')) if self.posts_dir.exists() else []
+        if self.archive_dir.exists():
+            posts.extend(self.archive_dir.rglob('*.md'))
+        if not posts:
+            return
+        # 파일명(날짜) 순으로 읽어 최근 포스트 종목이 앞쪽에 오도록
+        symbols, ids = self.quote_snapshot.seed_from_posts(sorted(posts, key=lambda path: path.name))
+        print(f"[INFO] 기존 포스트 {len(posts)}개에서 종목 수집 (종목 코드 {symbols}개, instrument {ids}개)")
+
+    def fetch_instrument_info(self, instrument_ids, cached_only=False):
+        """관련 주식 정보 가져오기 (cached_only: 요청 없이 캐시에 있는 정보만)"""
         if not instrument_ids:
             return []
         
         try:
             print(f"  - 관련 주식 정보 조회 중 ({len(instrument_ids)}개)...")
-            
-            instruments_info = []
-            # 각 주식 ID를 개별적으로 조회
-            for inst_id in instrument_ids[:3]:  # 최대 3개만
-                try:
-                    url = f"{self.instrument_api_url}?instrument_ids={inst_id}"
-                    response = self.scraper.get(url, timeout=10)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data and len(data) > 0:
-                            inst = data[0]
-                            instruments_info.append({
-                                'id': inst.get('id'),
-                                'name': inst.get('long_name', inst.get('short_name', '')),
-                                'symbol': inst.get('symbol', ''),
-                                'exchange_id': inst.get('exchange_id'),
-                                'price': inst.get('price', {}),
-                                'link': f"{self.base_url}{inst.get('link', '')}" if inst.get('link') else '',
-                            })
-                    
-                    time.sleep(0.3)  # Rate limiting
-                except:
-                    continue
-            
+
+            ids = [str(inst_id) for inst_id in instrument_ids[:3]]  # 최대 3개만
+            fetched = self.instrument_cache.get_many(ids) if cached_only else self.fetch_instruments_batch(ids)
+            instruments_info = [fetched[inst_id] for inst_id in ids if inst_id in fetched]
+            self.quote_snapshot.add_instruments(inst['id'] for inst in instruments_info)
+
             print(f"  - 주식 정보 조회 완료 ({len(instruments_info)}개)")
             return instruments_info
             
@@ -418,51 +790,32 @@ class InvestingCompleteKR:
             return []
     
     def is_valid_article_content(self, text):
-        """본문이 유효한 기사 내용인지 검증"""
-        if not text or len(text) < 200:
-            return False
-
-        # 법적 고지사항이나 불필요한 내용 필터링
-        invalid_keywords = [
-            'risk warning', 'disclaimer', '리스크 고지', '면책 조항',
-            'fusion media', '판권소유', 'all rights reserved',
-            'terms and conditions', '이용약관',
-            'privacy policy', '개인정보 보호정책'
-        ]
-
-        # 텍스트 앞부분 500자를 검사 (법적 고지가 앞에 오는 경우가 많음)
-        text_start = text[:500].lower()
-
-        # 여러 개의 invalid 키워드가 포함되어 있으면 법적 고지로 판단
-        keyword_count = sum(1 for keyword in invalid_keywords if keyword.lower() in text_start)
-
-        if keyword_count >= 2:
-            print(f"  [WARNING] 법적 고지사항으로 판단되어 스킵 (키워드 {keyword_count}개 발견)")
-            return False
-
-        # 전체 텍스트에서 법적 키워드 비율 확인
-        total_text_lower = text.lower()
-        legal_word_count = sum(total_text_lower.count(keyword.lower()) for keyword in invalid_keywords)
-
-        # 텍스트가 짧은데 법적 키워드가 많으면 의심
-        if len(text) < 1000 and legal_word_count >= 5:
+        """본문이 유효한 기사 내용인지 검증 (법적 고지사항 등은 제외, 규칙: content_rules.json)"""
+        valid, reason = self.content_filter.check_article(text)
+        if reason and reason.startswith('legal_head'):
+            print(f"  [WARNING] 법적 고지사항으로 판단되어 스킵 (키워드 {reason.split(':')[1]}개 발견)")
+        elif reason == 'legal_ratio':
             print(f"  [WARNING] 법적 고지사항 비율이 높아 스킵")
-            return False
-
-        return True
+        return valid
 
     def is_korean(self, text):
         """텍스트가 한국어인지 확인"""
-        if not text:
-            return False
-        korean_chars = len(re.findall(r'[가-힣]', text))
-        total_chars = len(re.sub(r'\s', '', text))
-        if total_chars == 0:
-            return False
-        return (korean_chars / total_chars) > 0.3
+        return self.content_filter.is_korean(text)
     
+    def translation_key(self, text):
+        """번역 메모리 키: 공백을 정규화한 원문의 해시"""
+        normalized = ' '.join(text.split())
+        return hashlib.sha1(f"en>ko:{normalized}".encode('utf-8')).hexdigest()
+
+    def _translate_remote(self, text):
+        """번역 API 호출 (rate limit 적용)"""
+        self.rate_limiter.wait('translate.google.com')
+        self.metrics.count('translate_requests')
+        self.metrics.count('translate_chars', len(text))
+        return self.translator.translate(text)
+
     def translate_to_korean(self, text, max_length=4500):
-        """한국어로 번역"""
+        """한국어로 번역 (문단 단위 번역 메모리 사용, 없는 문단만 번역 요청)"""
         try:
             if not text or len(text.strip()) == 0:
                 return text
@@ -472,19 +825,93 @@ class InvestingCompleteKR:
             
             if len(text) > max_length:
                 text = text[:max_length]
-            
-            translated = self.translator.translate(text)
-            time.sleep(0.5)
-            return translated
+
+            paragraphs = [p.strip() for p in PARAGRAPH_SPLIT_PATTERN.split(text) if p.strip()]
+            keys = [self.translation_key(p) for p in paragraphs]
+            translations = self.translation_memory.get_many(keys)
+
+            missing = {key: p for key, p in zip(keys, paragraphs) if key not in translations}
+            if missing:
+                translated = self._translate_remote('\n\n'.join(missing.values()))
+                parts = [p.strip() for p in PARAGRAPH_SPLIT_PATTERN.split(translated or '') if p.strip()]
+
+                # 문단 수가 어긋나면 문단별로 다시 번역
+                if len(parts) != len(missing):
+                    parts = [self._translate_remote(p) for p in missing.values()]
+
+                new_translations = dict(zip(missing, parts))
+                self.translation_memory.set_many({k: v for k, v in new_translations.items() if v})
+                translations.update(new_translations)
+
+            return '\n\n'.join(translations[key] or '' for key in keys)
             
         except Exception as e:
             print(f"  [WARNING] 번역 실패: {e}")
             return text
     
+    def pack_paragraphs(self, text, max_length=4500):
+        """문단을 자르지 않고 max_length 이하의 번역 요청 단위로 묶기"""
+        pieces = []
+        for paragraph in PARAGRAPH_SPLIT_PATTERN.split(text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if len(paragraph) <= max_length:
+                pieces.append(paragraph)
+                continue
+
+            # 한 문단이 너무 길면 문장 단위로 나눔 (문장도 길면 강제로 자름)
+            current = ''
+            for sentence in SENTENCE_SPLIT_PATTERN.split(paragraph):
+                while len(sentence) > max_length:
+                    if current:
+                        pieces.append(current)
+                        current = ''
+                    pieces.append(sentence[:max_length])
+                    sentence = sentence[max_length:]
+                if current and len(current) + 1 + len(sentence) > max_length:
+                    pieces.append(current)
+                    current = sentence
+                else:
+                    current = f"{current} {sentence}" if current else sentence
+            if current:
+                pieces.append(current)
+
+        batches = []
+        current = []
+        current_length = 0
+        for piece in pieces:
+            added_length = len(piece) + (2 if current else 0)
+            if current and current_length + added_length > max_length:
+                batches.append('\n\n'.join(current))
+                current = []
+                current_length = 0
+                added_length = len(piece)
+            current.append(piece)
+            current_length += added_length
+        if current:
+            batches.append('\n\n'.join(current))
+
+        return batches
+
+    def translate_document(self, text, max_length=4500):
+        """긴 본문 전체 번역 (문단 단위로 묶어 동시 요청 후 원래 순서로 결합)"""
+        batches = self.pack_paragraphs(text, max_length)
+        if len(batches) > 1:
+            print(f"  - 번역 요청 {len(batches)}개로 분할")
+
+        if len(batches) <= 1 or self.translation_workers <= 1:
+            translated = [self.translate_to_korean(batch, max_length) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.translation_workers, len(batches))) as executor:
+                translated = list(executor.map(lambda batch: self.translate_to_korean(batch, max_length), batches))
+
+        return '\n\n'.join(part for part in translated if part)
+
     def sanitize_filename(self, text):
         """파일명으로 사용 가능한 문자열로 변환"""
-        text = re.sub(r'[^\w\sㄱ-ㅎㅏ-ㅣ가-힣-]', '', text)
-        text = re.sub(r'[-\s]+', '-', text)
+        text = FILENAME_STRIP_PATTERN.sub('', text)
+        text = FILENAME_DASH_PATTERN.sub('-', text)
         return text.strip('-')[:80]
     
     def clean_title(self, title):
@@ -492,28 +919,52 @@ class InvestingCompleteKR:
         if not title:
             return title
         
-        # "By Investing.com", "By InvestingPro" 등 패턴 제거
-        patterns = [
-            r'\s*By\s+Investing\.com\s*$',
-            r'\s*By\s+InvestingPro\s*$',
-            r'\s*-\s*Investing\.com\s*$',
-            r'\s*-\s*InvestingPro\s*$',
-        ]
-        
+        # "By Investing.com", "By InvestingPro" 등 패턴 제거 (출처 표기가 없으면 정규식 생략)
         cleaned = title
-        for pattern in patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        if 'investing' in title.lower():
+            for pattern in TITLE_SOURCE_PATTERNS:
+                cleaned = pattern.sub('', cleaned)
         
         return cleaned.strip()
     
-    def convert_tickers_to_badges(self, text, instruments_info=None):
+    def resolve_tickers(self, tickers, search=True):
         """
-        티커 심볼을 실시간 뱃지로 변환
-        API 데이터 또는 동적 검색으로 instrument_id 조회
+        종목 코드 목록을 instrument_id로 일괄 변환 (캐시 우선, 없는 것만 동시 검색)
+
+        Args:
+            tickers: [(exchange, symbol), ...]
+            search: False 이면 검색 없이 캐시만 사용 (없는 종목은 None)
+
+        Returns:
+            dict: {(exchange, symbol): instrument_id 또는 None}
         """
-        # 패턴: (KS:005930), (NASDAQ:NVDA), (TYO:9984) 등
-        pattern = r'\(([A-Z]+):([A-Z0-9]+)\)'
+        keys = {f"{exchange}:{symbol}": (exchange, symbol) for exchange, symbol in tickers}
+        cached = self.symbol_cache.get_many(keys)
+        resolved = {keys[key]: (info or {}).get('id') for key, info in cached.items()}
 
+        missing = [key for key in keys if key not in cached]
+        if missing and not search:
+            resolved.update({keys[key]: None for key in missing})
+        elif missing:
+            print(f"  - 종목 검색 중 ({len(missing)}개)...")
+            with ThreadPoolExecutor(max_workers=min(4, len(missing))) as executor:
+                results = dict(zip(missing, executor.map(lambda key: self.search_instrument(keys[key][1]), missing)))
+
+            found = {key: info for key, info in results.items() if info and info.get('id')}
+            self.symbol_cache.set_many(found)
+            self.symbol_cache.set_many({key: None for key in results if key not in found}, ttl=self.symbol_miss_ttl)
+
+            for key, info in results.items():
+                resolved[keys[key]] = info.get('id') if info else None
+
+        return resolved
+
+    def convert_tickers_to_badges(self, text, instruments_info=None, search=True):
+        """
+        티커 심볼을 실시간 뱃지로 변환
+        1) 본문의 고유 티커 수집 2) API 데이터/캐시/검색으로 일괄 조회 3) 한 번에 치환
+        search=False 이면 종목 검색 없이 API 데이터/캐시로만 변환
+        """
         # instrument 정보로부터 symbol -> id 매핑 생성
         symbol_to_id = {}
         if instruments_info:
@@ -523,38 +974,118 @@ class InvestingCompleteKR:
                 if symbol and inst_id:
                     symbol_to_id[symbol] = inst_id
 
-        def replace_ticker(match):
-            exchange = match.group(1)
-            symbol = match.group(2)
-            full_ticker = f"{exchange}:{symbol}"
+        # 1. 고유 티커 수집
+        tickers = dict.fromkeys(match.groups() for match in TICKER_PATTERN.finditer(text))
+        if not tickers:
+            return text
 
-            # 1. API 데이터에서 먼저 조회
-            instrument_id = symbol_to_id.get(symbol)
+        # 2. API 데이터에 없는 티커만 캐시/검색 API로 조회
+        resolved = {ticker: symbol_to_id[ticker[1]] for ticker in tickers if ticker[1] in symbol_to_id}
+        missing = [ticker for ticker in tickers if ticker not in resolved]
+        if missing:
+            resolved.update(self.resolve_tickers(missing, search=search))
 
-            # 2. 없으면 검색 API로 동적 조회
-            if not instrument_id:
-                search_result = self.search_instrument(symbol)
-                if search_result and search_result.get('id'):
-                    instrument_id = search_result['id']
+        self.quote_snapshot.add_symbols({f"{exchange}:{symbol}": instrument_id
+                                         for (exchange, symbol), instrument_id in resolved.items()})
 
-            # 3. 찾지 못하면 해당 텍스트를 제거
+        # 3. 치환 (찾지 못한 티커는 텍스트에서 제거)
+        def replace_ticker(match):
+            exchange, symbol = match.groups()
+            instrument_id = resolved.get((exchange, symbol))
             if not instrument_id:
                 return ''
 
+            full_ticker = f"{exchange}:{symbol}"
             # HTML 마크업으로 변환
             return f'<span class="stock-ticker" data-ticker="{full_ticker}" data-exchange="{exchange}" data-symbol="{symbol}" data-instrument-id="{instrument_id}">({full_ticker})</span>'
 
-        return re.sub(pattern, replace_ticker, text)
+        return TICKER_PATTERN.sub(replace_ticker, text)
     
+    def build_excerpt(self, content_kr, length=200):
+        """요약 생성 (앞부분에서 종목 코드 제거 후 공백 정리)"""
+        excerpt_text = content_kr[:length]
+        # 종목 코드 패턴 제거 (예: (KS:005930), (NASDAQ:NVDA))
+        excerpt_clean = TICKER_PATTERN.sub('', excerpt_text)
+        # 연속된 공백 정리
+        excerpt_clean = WHITESPACE_PATTERN.sub(' ', excerpt_clean).strip()
+        return excerpt_clean + "..." if len(content_kr) > length else excerpt_clean
+
+    def render_post(self, article, title_kr, excerpt, content_kr, instruments, pub_date):
+        """Jekyll 포스트 본문 (front matter 포함) 생성"""
+        image_url = article.get('image_url', '')
+        article_id = article.get('id', '')
+
+        # 로컬에 저장된 이미지가 있으면 사용 (썸네일/중간 크기 포함), 없으면 원본 URL
+        local_image = self.local_images.get(image_url) if image_url else None
+        if local_image:
+            image_line = f'image: "{local_image["image"]}"\n'
+            for variant in ('thumb', 'medium'):
+                if local_image.get(variant):
+                    image_line += f'image_{variant}: "{local_image[variant]}"\n'
+        else:
+            image_line = f'image: "{image_url}"\n' if image_url else ''
+
+        # YAML 이스케이프: 작은따옴표 사용 (더 안전)
+        title_escaped = title_kr.replace("'", "''")
+        excerpt_escaped = excerpt.replace("'", "''")
+
+        # 주식 태그 생성 (symbol과 instrument_id 포함)
+        stock_tags = []
+        if instruments:
+            for inst in instruments:
+                symbol = inst.get('symbol', '')
+                inst_id = inst.get('id', '')
+                exchange_id = inst.get('exchange_id', '')
+                if symbol and inst_id:
+                    stock_tags.append({
+                        'symbol': symbol,
+                        'instrument_id': inst_id,
+                        'exchange_id': exchange_id
+                    })
+
+        # YAML 형식으로 stock_tags 생성
+        stock_tags_yaml = ""
+        if stock_tags:
+            stock_tags_yaml = "stock_tags:\n"
+            for tag in stock_tags:
+                stock_tags_yaml += f"  - symbol: {tag['symbol']}\n"
+                stock_tags_yaml += f"    instrument_id: {tag['instrument_id']}\n"
+                if tag['exchange_id']:
+                    stock_tags_yaml += f"    exchange_id: {tag['exchange_id']}\n"
+
+        return f"""---
+layout: post
+title: '{title_escaped}'
+date: {pub_date.strftime('%Y-%m-%d %H:%M:%S +0900')}
+categories: [Financial]
+author: "Investing.com"
+article_id: "{article_id}"
+{image_line}excerpt: '{excerpt_escaped}'
+{stock_tags_yaml}---
+
+{content_kr}
+
+
+---
+"""
+
     def create_post(self, article, index):
         """완전한 Jekyll 포스트 생성"""
+        claimed = False  # 유사 기사 서명을 등록했고 아직 포스트로 확정되지 않음
         try:
             original_title = article.get('title', '').strip()
             article_url = article.get('url', '')
             image_url = article.get('image_url', '')
+            article_id = article.get('id', '')
             
             if not original_title or not article_url:
+                self.seen_index.skip(article_id, 'no_url', permanent=True)
                 return False
+
+            # 마감 시간 전에 끝낼 수 없으면 시작하지 않음 (기사 인덱스에 추가하지 않으므로 다음 실행에서 처리)
+            if self.deadline and not self.deadline.can_start():
+                return self.defer_article(article_id, index, original_title)
+            started = time.monotonic()
             
             print(f"\n{'='*70}")
             print(f"[{index}] {original_title[:50]}...")
@@ -565,11 +1096,16 @@ class InvestingCompleteKR:
             summary_content = article.get('summary', '')
             full_title = None
             full_content = summary_content
+            crawl_skipped = False
             
-            # 요약이 너무 짧으면 크롤링 시도
-            if len(summary_content) < 100:
+            # 요약이 너무 짧으면 크롤링 시도 (마감 시간이 가까우면 생략)
+            if len(summary_content) < 100 and not self.within_budget('crawl'):
+                print(f"  - 마감 시간 임박, 크롤링 생략 (API 요약 사용)")
+                crawl_skipped = True
+            elif len(summary_content) < 100:
                 print(f"  - 요약이 짧아 전체 본문 크롤링 시도...")
-                full_title, crawled_content = self.fetch_full_article_content(article_url)
+                with self.metrics.stage('crawl', article_id):
+                    full_title, crawled_content = self.fetch_full_article_content(article_url)
                 if crawled_content and len(crawled_content) > len(summary_content):
                     full_content = crawled_content
                     print(f"  - 크롤링 성공 ({len(crawled_content)} 자)")
@@ -579,45 +1115,52 @@ class InvestingCompleteKR:
                 print(f"  - API 요약 사용 ({len(summary_content)} 자)")
             
             if not full_content or len(full_content) < 50:
+                if crawl_skipped:
+                    return self.defer_article(article_id, index, original_title)
                 print(f"  [SKIP] 충분한 본문이 없음")
+                # 크롤링이 일시적으로 실패했을 수 있으므로 몇 번 더 시도한 뒤 건너뜀
+                if self.seen_index.skip(article_id, 'no_content'):
+                    print(f"  [SKIP] 반복해서 본문이 없어 이후 실행에서 제외 (ID: {article_id})")
                 return False
+
+            # 1.5. 유사 기사 확인 (번역 전, 영어 원문 기준)
+            duplicate = self.near_duplicates.claim(article_id, full_content, original_title)
+            if duplicate:
+                print(f"  [SKIP] 유사 기사 (ID: {duplicate['article_id']}, "
+                      f"유사도 {duplicate['similarity']:.0%}): {duplicate['title'][:40]}")
+                self.metrics.count('near_duplicates')
+                # 포스트 파일이 없으므로 인덱스 재생성 후에도 남도록 건너뜀 기록에 저장
+                self.seen_index.skip(article_id, 'near_duplicate', permanent=True)
+                return False
+            claimed = True
             
-            # 2. 관련 주식 정보
-            instruments = self.fetch_instrument_info(article.get('instrument_ids', []))
+            # 2. 관련 주식 정보 (마감 시간이 가까우면 캐시에 있는 정보만)
+            with self.metrics.stage('instruments', article_id):
+                instruments = self.fetch_instrument_info(article.get('instrument_ids', []),
+                                                         cached_only=not self.within_budget('instruments'))
             
             # 3. 제목 결정 및 번역
             title_to_use = full_title if full_title else original_title
             
             print(f"  - 제목 번역 중...")
-            title_kr = self.translate_to_korean(title_to_use)
+            with self.metrics.stage('translate_title', article_id):
+                title_kr = self.translate_to_korean(title_to_use)
             
             # 제목에서 출처 정보 제거
             title_kr = self.clean_title(title_kr)
             
             # 4. 본문 번역
             print(f"  - 본문 번역 중...")
-            content_chunks = [full_content[i:i+4500] for i in range(0, len(full_content), 4500)]
-            content_kr_parts = []
-            
-            for i, chunk in enumerate(content_chunks[:3], 1):
-                if i > 1:
-                    print(f"  - 번역 진행 중... ({i}/{min(3, len(content_chunks))})")
-                translated = self.translate_to_korean(chunk)
-                if translated:
-                    content_kr_parts.append(translated)
-            
-            content_kr = '\n\n'.join(content_kr_parts)
+            with self.metrics.stage('translate_body', article_id):
+                content_kr = self.translate_document(full_content)
             
             # 5. 요약 생성 (티커 변환 전, 종목 코드 제거)
-            excerpt_text = content_kr[:200] if len(content_kr) > 200 else content_kr
-            # 종목 코드 패턴 제거 (예: (KS:005930), (NASDAQ:NVDA))
-            excerpt_clean = re.sub(r'\([A-Z]+:[A-Z0-9]+\)', '', excerpt_text)
-            # 연속된 공백 정리
-            excerpt_clean = re.sub(r'\s+', ' ', excerpt_clean).strip()
-            excerpt = excerpt_clean + "..." if len(content_kr) > 200 else excerpt_clean
+            excerpt = self.build_excerpt(content_kr)
             
-            # 5.5. 티커 심볼을 실시간 뱃지로 변환 (excerpt 생성 후)
-            content_kr = self.convert_tickers_to_badges(content_kr, instruments)
+            # 5.5. 티커 심볼을 실시간 뱃지로 변환 (excerpt 생성 후, 마감 시간이 가까우면 종목 검색 생략)
+            with self.metrics.stage('tickers', article_id):
+                content_kr = self.convert_tickers_to_badges(content_kr, instruments,
+                                                            search=self.within_budget('tickers'))
             
             # 6. 주식 정보 마크다운 생성 (front matter에 포함되기 때문에 본문은 생략)
             # instruments_md = ""
@@ -653,79 +1196,40 @@ class InvestingCompleteKR:
             filepath = self.posts_dir / filename
 
             # 9. 중복 판단: front matter의 article_id로 확인
-            article_id = article.get('id', '')
             is_duplicate = False
 
-            if filepath.exists():
-                # 파일이 존재하면 front matter에서 article_id 확인
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        existing_content = f.read()
-                        # front matter에서 article_id 추출
-                        import re as regex_module
-                        match = regex_module.search(r'article_id:\s*["\']?([^"\'\n]+)["\']?', existing_content)
-                        if match:
-                            existing_article_id = match.group(1)
-                            if existing_article_id == article_id:
-                                is_duplicate = True
-                except:
-                    pass
+            if filepath.exists() and read_article_id(filepath) == str(article_id):
+                is_duplicate = True
 
             if is_duplicate:
                 print(f"  [SKIP] 중복 기사 (ID: {article_id}): {filename}")
+                self.seen_index.add(article_id)
+                self.near_duplicates.confirm(article_id)
+                claimed = False
                 return False
             
             # 10. Jekyll Front Matter 생성
-            image_line = f'image: "{image_url}"\n' if image_url else ''
-
-            # YAML 이스케이프: 작은따옴표 사용 (더 안전)
-            title_escaped = title_kr.replace("'", "''")
-            excerpt_escaped = excerpt.replace("'", "''")
-
-            # 주식 태그 생성 (symbol과 instrument_id 포함)
-            stock_tags = []
-            if instruments:
-                for inst in instruments:
-                    symbol = inst.get('symbol', '')
-                    inst_id = inst.get('id', '')
-                    exchange_id = inst.get('exchange_id', '')
-                    if symbol and inst_id:
-                        stock_tags.append({
-                            'symbol': symbol,
-                            'instrument_id': inst_id,
-                            'exchange_id': exchange_id
-                        })
-
-            # YAML 형식으로 stock_tags 생성
-            stock_tags_yaml = ""
-            if stock_tags:
-                stock_tags_yaml = "stock_tags:\n"
-                for tag in stock_tags:
-                    stock_tags_yaml += f"  - symbol: {tag['symbol']}\n"
-                    stock_tags_yaml += f"    instrument_id: {tag['instrument_id']}\n"
-                    if tag['exchange_id']:
-                        stock_tags_yaml += f"    exchange_id: {tag['exchange_id']}\n"
-
-            front_matter = f"""---
-layout: post
-title: '{title_escaped}'
-date: {pub_date.strftime('%Y-%m-%d %H:%M:%S +0900')}
-categories: [Financial]
-author: "Investing.com"
-article_id: "{article_id}"
-{image_line}excerpt: '{excerpt_escaped}'
-{stock_tags_yaml}---
-
-{content_kr}
-
-
----
-"""
-
-            # 11. 파일 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(front_matter)
-
+            front_matter = self.render_post(article, title_kr, excerpt, content_kr, instruments, pub_date)
+
+            # 11. 파일 저장 (작업 큐 사용 시 임대를 가진 경우에만 게시)
+            with self.metrics.stage('write', article_id):
+                if self.work_queue is not None:
+                    if not self.work_queue.publish(self.worker_id, article_id, filepath, front_matter):
+                        print(f"  [SKIP] 작업 임대 만료, 다른 작업자가 처리 (ID: {article_id})")
+                        self.metrics.count('lease_lost')
+                        self.near_duplicates.confirm(article_id)
+                        claimed = False
+                        return False
+                else:
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        f.write(front_matter)
+                self.seen_index.add(article_id)
+                self.near_duplicates.confirm(article_id)
+                claimed = False
+                self.search_index.add_post(filepath)
+
+            if self.deadline:
+                self.deadline.record_article(time.monotonic() - started)
             print(f"  [OK] 포스트 생성 완료: {filename}\n")
             return True
             
@@ -733,38 +1237,381 @@ article_id: "{article_id}"
             print(f"  [ERROR] 포스트 생성 실패: {e}")
             import traceback
             traceback.print_exc()
+            if self.work_queue is not None:
+                self.work_queue.release(self.worker_id, article_id, str(e))
             return False
+        finally:
+            # 포스트를 쓰지 못하고 끝나면(예외, 중단 등) 유사 기사 서명 해제 → 다음 실행에서 다시 처리
+            if claimed:
+                self.near_duplicates.release(article_id)
     
-    def run(self, limit=5):
-        """크롤러 실행"""
+    def defer_article(self, article_id, index, title):
+        """마감 시간 때문에 처리하지 않은 기사 (작업 큐 사용 시 시도 횟수 차감 없이 반환)"""
+        print(f"[{index}] [SKIP] 마감 시간 임박, 다음 실행에서 처리: {title[:40]}")
+        self.metrics.count('deadline_deferred')
+        if self.work_queue is not None:
+            self.work_queue.release(self.worker_id, article_id, 'deadline', count_attempt=False)
+        return False
+
+    def process_articles(self, articles, workers=1, start_index=1):
+        """기사 목록으로 포스트 생성, 생성된 포스트 수 반환"""
+        created_count = 0
+        if workers <= 1:
+            for i, article in enumerate(articles, start_index):
+                try:
+                    if self.create_post(article, i):
+                        created_count += 1
+                except Exception as e:
+                    print(f"[ERROR] 처리 중 오류: {e}")
+                    continue
+        else:
+            # 요청 간격은 rate_limiter가 호스트별로 조절하므로 기사는 동시에 처리
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self.create_post, article, i)
+                           for i, article in enumerate(articles, start_index)]
+                for future in as_completed(futures):
+                    try:
+                        if future.result():
+                            created_count += 1
+                    except Exception as e:
+                        print(f"[ERROR] 처리 중 오류: {e}")
+        return created_count
+
+    def process_queue(self, articles, limit, workers=1):
+        """
+        새 기사를 공유 작업 큐에 등록하고, 큐에서 임대한 기사를 최대 limit개 처리
+        (다른 실행기/프로세스가 등록했거나 임대가 만료된 기사 포함)
+        """
+        queue = self.work_queue
+        added = queue.enqueue(articles)
+        print(f"[INFO] 작업 큐에 새 기사 {added}개 등록 (작업자: {self.worker_id})")
+
+        for path in queue.recover_publishes():
+            print(f"[INFO] 중단된 게시 복구: {path.name}")
+            self.seen_index.add(read_article_id(path))
+            self.search_index.add_post(path)
+
+        created_count = 0
+        processed = 0
+        batch_size = max(1, workers)
+        with LeaseKeeper(queue, self.worker_id) as keeper:
+            while processed < limit:
+                if self.deadline and not self.deadline.can_start():
+                    print("[INFO] 마감 시간 임박, 큐의 나머지 기사는 다음 실행에서 처리")
+                    break
+                with self.metrics.stage('queue_claim'):
+                    batch = queue.claim(self.worker_id, min(batch_size, limit - processed))
+                if not batch:
+                    break
+                self.metrics.count('queue_claimed', len(batch))
+                keeper.track(a.get('id') for a in batch)
+
+                # 큐 밖에서 이미 처리된 기사는 건너뜀 (아래 complete에서 skipped 처리)
+                new_articles = [a for a in batch if a.get('id') not in self.seen_index]
+                if new_articles:
+                    with self.metrics.stage('prefetch_instruments'):
+                        self.prefetch_instruments(new_articles)
+                    with self.metrics.stage('images'):
+                        self.prefetch_images(new_articles)
+                    created_count += self.process_articles(new_articles, workers, processed + 1)
+
+                # 게시/실패 처리되지 않고 남은 기사: 기사 인덱스에서 처리 완료/영구 건너뜀이면 완료 처리,
+                # 아니면(본문이 일시적으로 없음 등) 기사 인덱스의 재시도 정책에 맞춰 나중에 다시 처리
+                leftover = [str(a.get('id')) for a in batch]
+                finished = [article_id for article_id in leftover if article_id in self.seen_index]
+                queue.complete(self.worker_id, finished)
+                for article_id in leftover:
+                    if article_id not in finished:
+                        queue.release(self.worker_id, article_id, 'not published',
+                                      retry_after=self.queue_retry_delay)
+                keeper.track([])
+                processed += len(batch)
+
+        stats = queue.stats()
+        print("\n" + "=" * 70)
+        print(f"OK: 완료 - 큐에서 {processed}개 처리, {created_count}개의 포스트 생성됨")
+        self.print_deadline_summary()
+        print("작업 큐: " + ", ".join(f"{status} {count}개" for status, count in sorted(stats.items())))
+        print("=" * 70)
+        return created_count
+
+    def print_deadline_summary(self):
+        """마감 시간 때문에 생략/연기한 작업 수 출력"""
+        if not self.deadline:
+            return
+        counters = self.metrics.counters
+        skipped = {label: counters.get(f'deadline_skip_{step}', 0)
+                   for step, label in (('crawl', '크롤링'), ('images', '이미지 저장'), ('tickers', '티커 검색'),
+                                       ('instruments', '주식 정보'))}
+        deferred = counters.get('deadline_deferred', 0)
+        if deferred or any(skipped.values()):
+            print(f"마감 시간 {self.deadline_seconds:.0f}초: 다음 실행으로 미룬 기사 {deferred}개, 생략 "
+                  + ", ".join(f"{label} {count}회" for label, count in skipped.items()))
+
+    def iter_breaking_news(self, start_page=1, page_size=50):
+        """
+        뉴스 목록을 페이지 단위로 순회하는 generator
+
+        Yields:
+            (page, 기사 목록) - 빈 페이지이거나 이전 페이지와 같은 기사만 있으면 종료
+            요청이 실패하면 (page, None)을 마지막으로 반환 (목록 끝과 구분)
+        """
+        page = start_page
+        previous_ids = None
+        while True:
+            articles = self.fetch_breaking_news_api(params={'page': page, 'page_size': page_size})
+            if articles is None:
+                yield page, None
+                return
+            if not articles:
+                return
+
+            # 서버가 페이지 파라미터를 무시하면 같은 목록이 반복됨
+            ids = {a.get('id') for a in articles}
+            if ids == previous_ids:
+                print("[INFO] 이전 페이지와 같은 목록, 마지막 페이지로 판단")
+                return
+            previous_ids = ids
+
+            yield page, articles
+            page += 1
+
+    def backfill(self, max_articles=0, workers=1, page_size=50):
+        """
+        과거 뉴스 목록을 페이지 단위로 스트리밍 처리 (메모리는 한 페이지 분량만 사용)
+        페이지 처리가 끝날 때마다 체크포인트를 저장하여 중단 후 이어서 실행
+        목록 요청이 실패하면 체크포인트를 그 페이지에 두고 None 반환
+        """
+        checkpoint_path = self.cache_dir / "backfill.json"
+        checkpoint = {'page': 1, 'processed': 0, 'created': 0}
+        if checkpoint_path.exists():
+            with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint.update(json.load(f))
+            print(f"[INFO] 체크포인트에서 이어서 실행 (페이지 {checkpoint['page']}, "
+                  f"처리 {checkpoint['processed']}개)")
+
+        self.metrics = RunMetrics()
+        completed = False
+        failed = False
+        try:
+            for page, articles in self.iter_breaking_news(checkpoint['page'], page_size):
+                if articles is None:
+                    # 실패한 페이지부터 다시 시작하도록 체크포인트 유지
+                    failed = True
+                    checkpoint['page'] = page
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    with open(checkpoint_path, 'w', encoding='utf-8') as f:
+                        json.dump(checkpoint, f)
+                    break
+
+                new_articles = [a for a in articles if a.get('id') not in self.seen_index]
+                page_finished = True
+                if max_articles:
+                    remaining = max(0, max_articles - checkpoint['processed'])
+                    page_finished = len(new_articles) <= remaining
+                    new_articles = new_articles[:remaining]
+                print(f"[INFO] 페이지 {page}: 새 기사 {len(new_articles)}개 / 전체 {len(articles)}개")
+
+                if new_articles:
+                    with self.metrics.stage('prefetch_instruments'):
+                        self.prefetch_instruments(new_articles)
+                    with self.metrics.stage('images'):
+                        self.prefetch_images(new_articles)
+                    created = self.process_articles(new_articles, workers, checkpoint['processed'] + 1)
+                    checkpoint['processed'] += len(new_articles)
+                    checkpoint['created'] += created
+                    self.search_index.flush()
+
+                # 페이지 일부만 처리했으면 다음 실행에서 같은 페이지부터 (처리한 기사는 인덱스로 제외)
+                checkpoint['page'] = page + 1 if page_finished else page
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with open(checkpoint_path, 'w', encoding='utf-8') as f:
+                    json.dump(checkpoint, f)
+
+                if max_articles and checkpoint['processed'] >= max_articles:
+                    print(f"[INFO] 최대 처리 수({max_articles}) 도달")
+                    break
+            else:
+                completed = True
+        finally:
+            self.search_index.flush()
+            self.write_quote_snapshot()
+            self.write_metrics(mode='backfill', page_size=page_size, workers=workers, **checkpoint)
+            self.save_session()
+
+        if failed:
+            print(f"[ERROR] 백필 중단 - 페이지 {checkpoint['page']} 목록 요청 실패, "
+                  f"다음 실행은 페이지 {checkpoint['page']}부터 이어서 진행")
+            return None
+        if completed:
+            checkpoint_path.unlink(missing_ok=True)
+            print(f"OK: 백필 완료 - {checkpoint['created']}개의 포스트 생성됨 (체크포인트 삭제)")
+        else:
+            print(f"OK: 백필 중단 - 다음 실행은 페이지 {checkpoint['page']}부터 이어서 진행")
+        return checkpoint['created']
+
+    def run(self, limit=5, workers=1):
+        """
+        크롤러 실행 (workers > 1 이면 기사 단위 병렬 처리), 종료 시 메트릭 JSON 저장
+        deadline_seconds 가 있으면 그 시간 안에 끝나도록 선택 작업을 생략하고 남은 기사는 다음 실행으로 미룸
+        """
+        self.metrics = RunMetrics()
+        self.deadline = RunDeadline(self.deadline_seconds) if self.deadline_seconds else None
+        created_count = 0
+        # 종목 데이터가 비어 있으면 (최초 배포 등) 기존 포스트의 뱃지도 표시되도록 먼저 채움
+        if self.quote_snapshot.is_empty():
+            self.seed_quote_snapshot()
+        try:
+            with self.metrics.stage('total'):
+                created_count = self._run(limit, workers)
+        finally:
+            # 저장 단계는 마감 시간에서 남겨 둔 여유 시간 사용 (요청 timeout 제한 해제)
+            self.deadline = None
+            with self.metrics.stage('search_index'):
+                self.search_index.flush()
+            with self.metrics.stage('quote_snapshot'):
+                self.write_quote_snapshot(force=created_count > 0)
+            self.write_metrics(limit=limit, workers=workers, created=created_count,
+                               deadline=self.deadline_seconds)
+            self.save_session()
+        return created_count
+
+    def write_metrics(self, **run_info):
+        """단계별 요약 출력 및 메트릭 JSON 파일 저장"""
+        caches = {
+            'translation_memory': {'hits': self.translation_memory.hits, 'misses': self.translation_memory.misses},
+            'instruments': {'hits': self.instrument_cache.hits, 'misses': self.instrument_cache.misses},
+            'symbols': {'hits': self.symbol_cache.hits, 'misses': self.symbol_cache.misses},
+            'http': {'fresh': self.http_cache.fresh_hits, 'revalidated': self.http_cache.revalidated},
+            'http_pages': {'fresh': self.page_cache.fresh_hits, 'revalidated': self.page_cache.revalidated},
+        }
+        path = self.metrics_path or (
+            self.cache_dir / "metrics" / f"run-{self.metrics.started_at.strftime('%Y%m%d-%H%M%S')}.json"
+        )
+        try:
+            self.metrics.write(path, extra={'run': run_info, 'caches': caches})
+            if self.metrics_path is None:
+                prune_runs(path.parent, METRICS_KEEP_RUNS)
+            print("단계별 소요 시간:")
+            for line in self.metrics.summary_lines():
+                print(line)
+            print(f"메트릭 저장: {path}")
+        except Exception as e:
+            print(f"[WARNING] 메트릭 저장 실패: {e}")
+
+    def remember_polled(self, article_ids):
+        """목록에서 본 article_id 기록 (다시 보인 ID는 최신으로, 최대 POLLED_IDS_MAX개)"""
+        for article_id in article_ids:
+            self.polled_ids[article_id] = None
+            self.polled_ids.move_to_end(article_id)
+        while len(self.polled_ids) > POLLED_IDS_MAX:
+            self.polled_ids.popitem(last=False)
+
+    def watch(self, limit=5, workers=1, min_interval=60, max_interval=900):
+        """
+        감시 모드: 같은 인스턴스(세션/캐시 유지)로 뉴스 목록을 계속 확인
+        새 기사 도착 빈도(지수 이동 평균)에 맞춰 확인 간격을 조절
+        """
+        if self.metrics_path is None:
+            self.metrics_path = self.cache_dir / "metrics" / "watch-latest.json"
+
+        interval = min_interval
+        arrival_rate = None  # 초당 새 기사 수 (EWMA)
+        last_poll = time.monotonic()
+        print(f"[INFO] 감시 모드 시작 (간격 {min_interval}~{max_interval}초, Ctrl+C로 종료)")
+
+        try:
+            while True:
+                try:
+                    self.run(limit=limit, workers=workers)
+                except Exception as e:
+                    print(f"[ERROR] 감시 중 오류: {e}")
+
+                now = time.monotonic()
+                rate = self.last_new_count / max(now - last_poll, 1)
+                last_poll = now
+                arrival_rate = rate if arrival_rate is None else 0.3 * rate + 0.7 * arrival_rate
+
+                # 다음 확인 때 새 기사가 약 1개 있을 만한 간격
+                interval = max_interval if arrival_rate <= 0 else 1 / arrival_rate
+                interval = max(min_interval, min(max_interval, interval))
+                # 새 기사가 있었거나 limit 때문에 남은 기사가 있으면 바로 다시 확인
+                if self.last_new_count or self.last_pending_count:
+                    interval = min_interval
+
+                print(f"[INFO] 새 기사 {self.last_new_count}개, 남은 기사 {self.last_pending_count}개, "
+                      f"다음 확인까지 {interval:.0f}초\n")
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\n[INFO] 감시 모드 종료")
+
+    def _run(self, limit, workers):
         print("=" * 70)
         print("Investing.com 완전판 크롤러 (한국어)")
         print("Breaking News + 전체 본문 + 이미지 + 주식 정보")
         print("=" * 70)
         
-        # API로 Breaking news 목록 가져오기
-        articles = self.fetch_breaking_news_api()
+        # 설정된 뉴스 목록을 동시에 가져오기
+        with self.metrics.stage('news_list'):
+            source_lists = self.fetch_news_sources()
+        self.last_new_count = 0
+        self.last_pending_count = 0
         
-        if not articles:
+        if not any(articles for _, articles in source_lists):
             print("\n[ERROR] API 호출 실패")
-            return
+            return 0
         
-        print(f"총 {len(articles)}개 기사 발견, 최대 {limit}개 처리\n")
+        # 이미 처리한 기사는 네트워크 요청 없이 제외, 여러 목록에 있는 기사는 한 번만 (소스별 quota 적용)
+        listed_ids = {a.get('id') for _, articles in source_lists for a in articles or []}
+        listed = len(listed_ids)
+        # 작업 큐를 사용하면 새 기사는 모두 등록하고 limit 만큼만 이 프로세스에서 처리
+        # 마감 시간이 있으면 최신 기사부터 (limit 적용 전에 정렬)
+        max_candidates = None if self.work_queue is not None or self.deadline else limit
+        articles, new_count, per_source = merge_candidates(source_lists, max_candidates, self.seen_index.__contains__)
+        if self.deadline:
+            articles.sort(key=lambda a: a.get('published') or '', reverse=True)
+            if self.work_queue is None:
+                articles = articles[:limit]
+        skipped = listed - new_count
+        if skipped:
+            print(f"[INFO] 이미 처리된 기사 {skipped}개 건너뜀")
+        if len(self.news_sources) > 1:
+            print("[INFO] 소스별 선택: " + ", ".join(f"{name} {count}개" for name, count in per_source.items()))
+        # 확인 간격은 직전 확인 이후 새로 나타난 기사로만 계산 (처리하지 못하고 남은 기사는 제외)
+        self.last_new_count = sum(1 for i in listed_ids
+                                  if i not in self.polled_ids and i not in self.seen_index)
+        self.remember_polled(listed_ids)
+        if self.work_queue is None:
+            self.last_pending_count = new_count - len(articles)
+
+        if self.work_queue is not None:
+            return self.process_queue(articles, limit, workers)
+
+        if not articles:
+            print("\n" + "=" * 70)
+            print("OK: 뉴스 목록 변경 없음" if self.news_list_unchanged else "OK: 새로운 기사 없음")
+            print("=" * 70)
+            return 0
+
+        print(f"총 {new_count}개 새 기사 발견, 최대 {limit}개 처리 (workers: {workers})\n")
         
+        # 관련 주식 정보는 기사별로 요청하지 않고 한 번에 조회
+        with self.metrics.stage('prefetch_instruments'):
+            self.prefetch_instruments(articles)
+        with self.metrics.stage('images'):
+            self.prefetch_images(articles)
+
         # 각 기사 처리
-        created_count = 0
-        for i, article in enumerate(articles[:limit], 1):
-            try:
-                if self.create_post(article, i):
-                    created_count += 1
-            except Exception as e:
-                print(f"[ERROR] 처리 중 오류: {e}")
-                continue
+        created_count = self.process_articles(articles, workers)
 
         print("\n" + "=" * 70)
         print(f"OK: 완료 - {created_count}개의 포스트 생성됨")
+        self.print_deadline_summary()
+        print(f"번역 메모리: 적중 {self.translation_memory.hits}개 / 미스 {self.translation_memory.misses}개")
         print("=" * 70)
 
+        return created_count
+
 
 def main():
     """메인 함수"""
@@ -772,10 +1619,86 @@ def main():
     
     parser = argparse.ArgumentParser(description='Investing.com 완전판 크롤러 (한국어)')
     parser.add_argument('--limit', type=int, default=5, help='가져올 기사 수 (기본: 5)')
+    parser.add_argument('--workers', type=int, default=1, help='동시에 처리할 기사 수 (기본: 1)')
+    parser.add_argument('--list-fresh', type=int, default=0,
+                        help='뉴스 목록 응답을 재요청 없이 재사용할 시간(초) (기본: 0, 항상 조건부 요청)')
+    parser.add_argument('--hedge-delay', type=float, default=0.5,
+                        help='한국어 기사 페이지가 이 시간(초) 안에 오지 않으면 영어 페이지도 요청 (기본: 0.5)')
+    parser.add_argument('--no-hedge', action='store_true', help='한국어 페이지 실패 후에만 영어 페이지 요청')
+    parser.add_argument('--record', metavar='DIR', help='모든 HTTP 요청/응답을 fixture로 녹화 (bench_crawler.py에서 재생)')
+    parser.add_argument('--metrics', metavar='PATH', help='메트릭 JSON 저장 경로 (기본: .cache/metrics/run-<시각>.json)')
+    parser.add_argument('--profile', metavar='PATH', nargs='?', const='', help='cProfile로 실행하고 통계 저장')
+    parser.add_argument('--watch', action='store_true', help='종료하지 않고 뉴스 목록을 계속 확인 (간격 자동 조절)')
+    parser.add_argument('--watch-min', type=int, default=60, help='감시 모드 최소 확인 간격(초) (기본: 60)')
+    parser.add_argument('--watch-max', type=int, default=900, help='감시 모드 최대 확인 간격(초) (기본: 900)')
+    parser.add_argument('--backfill', type=int, nargs='?', const=0, metavar='MAX',
+                        help='과거 뉴스 목록을 페이지 단위로 처리 (MAX: 최대 기사 수, 생략 시 제한 없음)')
+    parser.add_argument('--page-size', type=int, default=50, help='백필 페이지 크기 (기본: 50)')
+    parser.add_argument('--reset-backfill', action='store_true', help='백필 체크포인트 삭제 후 처음부터 실행')
+    parser.add_argument('--rebuild-index', action='store_true', help='_posts/ 로부터 기사 인덱스 재생성')
+    parser.add_argument('--rebuild-quotes', action='store_true',
+                        help='기존 포스트의 종목으로 종목 데이터(assets/data/tickers.json) 재생성 후 종료')
+    parser.add_argument('--rules', metavar='PATH', help='본문 필터 규칙 JSON (기본: content_rules.json)')
+    parser.add_argument('--sources', metavar='PATH', help='뉴스 목록 소스 JSON (기본: news_sources.json)')
+    parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                        help='실행 마감 시간(초): 최신 기사부터 처리, 임박하면 크롤링 → 티커 검색 → 주식 정보 조회 순으로 생략하고 남은 기사는 다음 실행으로')
+    parser.add_argument('--queue', metavar='PATH', nargs='?', const='',
+                        help='여러 실행기/프로세스가 공유하는 작업 큐 사용 (기본: .cache/queue.sqlite3)')
+    parser.add_argument('--lease', type=int, default=300, help='작업 큐 임대 시간(초) (기본: 300)')
+    parser.add_argument('--worker-id', help='작업 큐 작업자 ID (기본: 호스트 이름-PID)')
     args = parser.parse_args()
     
-    crawler = InvestingCompleteKR()
-    crawler.run(limit=args.limit)
+    crawler = InvestingCompleteKR(rules_path=args.rules, sources_path=args.sources)
+    crawler.list_fresh_for = args.list_fresh
+    crawler.hedge_delay = None if args.no_hedge else args.hedge_delay
+    crawler.deadline_seconds = args.deadline
+    if args.record:
+        from replay import RecordingSession
+        crawler.scraper = RecordingSession(crawler.scraper, args.record)
+    if args.metrics:
+        crawler.metrics_path = Path(args.metrics)
+    if args.rebuild_index:
+        crawler.seen_index.rebuild()
+    if args.rebuild_quotes:
+        crawler.seed_quote_snapshot()
+        crawler.write_quote_snapshot(force=True)
+        return
+
+    if args.reset_backfill:
+        (crawler.cache_dir / "backfill.json").unlink(missing_ok=True)
+    if args.backfill is not None:
+        created = crawler.backfill(max_articles=args.backfill, workers=args.workers, page_size=args.page_size)
+        if created is None:
+            sys.exit(1)
+        return
+
+    if args.queue is not None:
+        queue_path = Path(args.queue) if args.queue else crawler.cache_dir / "queue.sqlite3"
+        crawler.work_queue = WorkQueue(queue_path, lease_seconds=args.lease)
+        if args.worker_id:
+            crawler.worker_id = args.worker_id
+
+    if args.watch:
+        crawler.watch(limit=args.limit, workers=args.workers,
+                      min_interval=args.watch_min, max_interval=args.watch_max)
+        return
+
+    if args.profile is None:
+        crawler.run(limit=args.limit, workers=args.workers)
+        return
+
+    import cProfile
+    import pstats
+
+    profile_path = Path(args.profile) if args.profile else (
+        crawler.cache_dir / "metrics" / f"run-{datetime.now().strftime('%Y%m%d-%H%M%S')}.prof"
+    )
+    profile_path.parent.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    profiler.runcall(crawler.run, limit=args.limit, workers=args.workers)
+    profiler.dump_stats(str(profile_path))
+    print(f"프로파일 저장: {profile_path}")
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유사 기사(재배포/수정판) 탐지
+- 정규화한 영어 본문의 단어 3-gram 집합으로 MinHash 서명 계산 (자카드 유사도 추정)
+- 서명을 band 단위로 묶어 LSH 버킷에 저장 → 같은 버킷에 들어간 후보만 비교
+  (저장된 서명 수와 관계없이 조회 시간 일정)
+- SQLite에 저장, 오래된 서명은 자동 삭제 (재배포는 보통 며칠 안에 발생)
+- claim 으로 등록한 서명은 포스트를 쓴 뒤 confirm 할 때까지 임시 상태
+  (처리 중 프로세스가 강제 종료되어 release 하지 못해도 claim_timeout 이 지나면 무시/삭제)
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+
+# MinHash 순열: (a * x + b) mod p
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+# "UPDATE 1-", "UPDATE 2:" 등 재배포 표시
+UPDATE_PREFIX_PATTERN = re.compile(r'^\s*(?:update|refile|corrected)\s*\d*\s*[-:]?\s*', re.IGNORECASE)
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def shingles(text, size=3):
+    """소문자 영문/숫자 단어 n-gram 해시 집합 (재배포 표시 제거)"""
+    words = WORD_PATTERN.findall(UPDATE_PREFIX_PATTERN.sub('', text or '').lower())
+    return {
+        int.from_bytes(hashlib.blake2b(' '.join(words[i:i + size]).encode('utf-8'), digest_size=8).digest(), 'big')
+        for i in range(len(words) - size + 1)
+    }
+
+
+class MinHasher:
+    def __init__(self, num_perm=128, seed=1):
+        generator = random.Random(seed)
+        self.permutations = [
+            (generator.randrange(1, MERSENNE_PRIME), generator.randrange(0, MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, hashes):
+        """해시 집합 → MinHash 서명 (순열마다 최솟값, 32비트)"""
+        return array('I', (
+            min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+            for a, b in self.permutations
+        ))
+
+
+def jaccard_estimate(a, b):
+    """두 MinHash 서명에서 자카드 유사도 추정"""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+class NearDuplicateIndex:
+    def __init__(self, db_path, threshold=0.8, num_perm=128, bands=32, min_shingles=20, max_age_days=14,
+                 claim_timeout=3600):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            threshold: 유사 기사로 판단할 최소 자카드 유사도 (단어 3-gram 기준)
+            num_perm: MinHash 순열 수
+            bands: LSH band 수 (band당 num_perm / bands 개 값, 많을수록 낮은 유사도도 후보가 됨)
+            min_shingles: 서명을 만들 최소 3-gram 수 (짧은 글은 오탐이 많아 제외)
+            max_age_days: 서명 보관 기간
+            claim_timeout: confirm 되지 않은 서명을 유효하게 보는 시간(초)
+        """
+        self.db_path = Path(db_path)
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.min_shingles = min_shingles
+        self.max_age = max_age_days * 86400
+        self.claim_timeout = claim_timeout
+        self.hasher = MinHasher(num_perm)
+        self.lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS signatures ('
+            'article_id TEXT PRIMARY KEY, signature BLOB NOT NULL, title TEXT, '
+            'duplicate_of TEXT, created_at REAL NOT NULL, confirmed INTEGER NOT NULL DEFAULT 1)'
+        )
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(signatures)')}
+        if 'confirmed' not in columns:
+            self.conn.execute('ALTER TABLE signatures ADD COLUMN confirmed INTEGER NOT NULL DEFAULT 1')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS bands ('
+            'band INTEGER NOT NULL, bucket INTEGER NOT NULL, article_id TEXT NOT NULL)'
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS bands_lookup ON bands(band, bucket)')
+        self.prune()
+
+    def _buckets(self, signature):
+        """서명 → [(band 번호, 버킷 해시)]"""
+        buckets = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            bucket = int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), 'big', signed=True)
+            buckets.append((band, bucket))
+        return buckets
+
+    def prune(self):
+        """보관 기간이 지난 서명과 confirm 되지 않고 만료된 서명 삭제"""
+        now = time.time()
+        expired = 'created_at < ? OR (confirmed = 0 AND created_at < ?)'
+        params = (now - self.max_age, now - self.claim_timeout)
+        with self.lock:
+            self.conn.execute('BEGIN')
+            self.conn.execute(
+                f'DELETE FROM bands WHERE article_id IN (SELECT article_id FROM signatures WHERE {expired})',
+                params
+            )
+            self.conn.execute(f'DELETE FROM signatures WHERE {expired}', params)
+            self.conn.execute('COMMIT')
+
+    def _find(self, signature, buckets, exclude_id):
+        """버킷 후보 중 유사도가 가장 높은 기사 (lock 보유 상태에서 호출)"""
+        candidates = set()
+        for band, bucket in buckets:
+            rows = self.conn.execute('SELECT article_id FROM bands WHERE band = ? AND bucket = ?', (band, bucket))
+            candidates.update(article_id for (article_id,) in rows)
+        candidates.discard(exclude_id)
+
+        best = None
+        stale = time.time() - self.claim_timeout
+        for article_id in candidates:
+            row = self.conn.execute('SELECT signature, title, confirmed, created_at FROM signatures '
+                                    'WHERE article_id = ?', (article_id,)).fetchone()
+            # 만료된 임시 서명은 강제 종료된 처리의 흔적이므로 무시
+            if not row or (not row[2] and row[3] < stale):
+                continue
+            similarity = jaccard_estimate(signature, array('I', row[0]))
+            if similarity >= self.threshold and (best is None or similarity > best['similarity']):
+                best = {'article_id': article_id, 'title': row[1] or '', 'similarity': similarity}
+        return best
+
+    def claim(self, article_id, text, title=''):
+        """
+        유사 기사가 있으면 그 정보를 반환, 없으면 이 기사의 서명을 임시로 등록하고 None 반환
+        (조회와 등록을 한 번에 처리하여 동시에 처리 중인 재배포 기사도 탐지)
+        포스트를 쓴 뒤 confirm, 실패하면 release 호출
+
+        Returns:
+            dict | None: {'article_id', 'title', 'similarity'}
+        """
+        hashes = shingles(text)
+        if len(hashes) < self.min_shingles:
+            return None
+
+        article_id = str(article_id)
+        signature = self.hasher.signature(hashes)
+        buckets = self._buckets(signature)
+        with self.lock:
+            match = self._find(signature, buckets, article_id)
+            self.conn.execute('BEGIN')
+            self.conn.execute(
+                'INSERT OR REPLACE INTO signatures (article_id, signature, title, duplicate_of, created_at, confirmed) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (article_id, signature.tobytes(), title, match['article_id'] if match else None, time.time(),
+                 1 if match else 0)
+            )
+            # 원본 기사만 버킷에 등록 (재배포 기사끼리 연쇄로 묶이지 않도록)
+            self.conn.execute('DELETE FROM bands WHERE article_id = ?', (article_id,))
+            if not match:
+                self.conn.executemany(
+                    'INSERT INTO bands (band, bucket, article_id) VALUES (?, ?, ?)',
+                    [(band, bucket, article_id) for band, bucket in buckets]
+                )
+            self.conn.execute('COMMIT')
+        return match
+
+    def confirm(self, article_id):
+        """포스트가 생성된 기사의 서명을 확정 (보관 기간 동안 유사 기사 탐지에 사용)"""
+        with self.lock:
+            self.conn.execute('UPDATE signatures SET confirmed = 1 WHERE article_id = ?', (str(article_id),))
+
+    def release(self, article_id):
+        """포스트 생성에 실패한 기사의 서명 삭제 (다음 실행에서 다시 처리)"""
+        article_id = str(article_id)
+        with self.lock:
+            self.conn.execute('BEGIN')
+            self.conn.execute('DELETE FROM bands WHERE article_id = ?', (article_id,))
+            self.conn.execute('DELETE FROM signatures WHERE article_id = ?', (article_id,))
+            self.conn.execute('COMMIT')
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM signatures').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
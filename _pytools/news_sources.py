@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+뉴스 목록 소스 설정 및 병합
+- news_sources.json: 뉴스 목록(list slug 또는 URL)별 이름, 우선순위, 실행당 최대 기사 수(quota)
+- 크롤러는 모든 소스를 동시에 요청하고 merge_candidates 로 하나의 후보 목록으로 병합
+- 같은 기사가 여러 목록에 있으면 한 번만 처리 (우선순위가 높은 소스의 quota 부터 사용)
+"""
+
+import json
+from pathlib import Path
+
+DEFAULT_SOURCES_PATH = Path(__file__).parent / "news_sources.json"
+
+LIST_URL_TEMPLATE = "https://endpoints.investing.com/news-delivery/api/v2/articles/delivery/domains/{domain}/news/lists/{list}"
+
+
+def load_news_sources(path=DEFAULT_SOURCES_PATH):
+    """
+    소스 설정 로드 (우선순위 순으로 정렬, 비활성 소스 제외)
+
+    Returns:
+        [{'name', 'url', 'quota', 'priority'}, ...]
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    sources = []
+    for entry in entries:
+        if not entry.get('enabled', True):
+            continue
+        url = entry.get('url') or LIST_URL_TEMPLATE.format(domain=entry.get('domain', 18), list=entry['list'])
+        sources.append({
+            'name': entry.get('name') or entry.get('list') or url,
+            'url': url,
+            'quota': entry.get('quota'),
+            'priority': entry.get('priority', 0),
+        })
+
+    if not sources:
+        raise ValueError(f"활성화된 뉴스 소스가 없음: {path}")
+    return sorted(sources, key=lambda source: source['priority'])
+
+
+def merge_candidates(results, limit=None, is_seen=lambda article_id: False):
+    """
+    소스별 기사 목록을 article_id 기준으로 병합
+
+    Args:
+        results: [(소스 dict, 기사 목록 또는 None), ...] (우선순위 순)
+        limit: 전체 최대 기사 수
+        is_seen: 이미 처리한 기사인지 확인하는 함수
+
+    Returns:
+        (선택된 기사 목록, 전체 새 기사 수(중복 제외), 소스별 선택 수)
+    """
+    selected = {}
+    new_ids = set()
+    for source, articles in results:
+        taken = 0
+        for article in articles or []:
+            article_id = article.get('id')
+            if article_id in selected or is_seen(article_id):
+                continue
+            new_ids.add(article_id)
+            if source['quota'] is not None and taken >= source['quota']:
+                continue
+            article['source'] = source['name']
+            selected[article_id] = article
+            taken += 1
+
+    candidates = list(selected.values())
+    if limit is not None:
+        candidates = candidates[:limit]
+
+    per_source = {source['name']: 0 for source, _ in results}
+    for article in candidates:
+        per_source[article['source']] += 1
+    return candidates, len(new_ids), per_source
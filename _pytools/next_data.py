@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+__NEXT_DATA__ 빠른 추출
+- 전체 HTML을 BeautifulSoup으로 파싱하지 않고 <script id="__NEXT_DATA__"> 위치만 찾아서 잘라냄
+- orjson이 설치되어 있으면 사용 (없으면 표준 json)
+- 알려진 경로(props.pageProps.articleStore 등)를 먼저 확인하고, 실패 시에만 전체 탐색
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+NEXT_DATA_MARKERS = ('id="__NEXT_DATA__"', "id='__NEXT_DATA__'")
+
+# 기사 객체가 위치하는 알려진 경로 (앞에서부터 시도)
+ARTICLE_PATHS = [
+    ('props', 'pageProps', 'articleStore', 'article'),
+    ('props', 'pageProps', 'articleStore'),
+    ('props', 'pageProps', 'article'),
+    ('props', 'pageProps', 'state', 'articleStore', 'article'),
+    ('props', 'pageProps', 'state', 'articleStore'),
+]
+
+MIN_BODY_LENGTH = 500
+
+
+def loads(raw):
+    """JSON 디코딩 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def extract_next_data_raw(html):
+    """HTML에서 __NEXT_DATA__ 스크립트 내용 문자열만 잘라서 반환 (없으면 None)"""
+    if not html:
+        return None
+
+    for marker in NEXT_DATA_MARKERS:
+        marker_pos = html.find(marker)
+        if marker_pos != -1:
+            break
+    else:
+        return None
+
+    start = html.find('>', marker_pos)
+    if start == -1:
+        return None
+    end = html.find('</script>', start)
+    if end == -1:
+        return None
+
+    return html[start + 1:end]
+
+
+def extract_next_data(html):
+    """HTML에서 __NEXT_DATA__ JSON 디코딩 결과 반환 (없거나 실패하면 None)"""
+    raw = extract_next_data_raw(html)
+    if not raw:
+        return None
+    return loads(raw)
+
+
+def get_path(data, path):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _article_from(obj):
+    """dict가 충분한 길이의 본문을 가진 기사이면 {'title', 'body'} 반환"""
+    if isinstance(obj, dict):
+        body = obj.get('body', '')
+        if isinstance(body, str) and len(body) > MIN_BODY_LENGTH:
+            return {'title': obj.get('title', ''), 'body': body}
+    return None
+
+
+def find_article_body(obj, depth=0):
+    """재귀적으로 기사 본문 탐색 (articleStore/article 키 우선)"""
+    if depth > 10:
+        return None
+
+    if isinstance(obj, dict):
+        # articleStore나 article 키를 찾아서 그 안의 body를 우선
+        if 'articleStore' in obj or 'article' in obj:
+            result = _article_from(obj.get('articleStore') or obj.get('article'))
+            if result:
+                return result
+
+        # 일반 body 검색 (길이가 충분히 긴 것만)
+        if 'body' in obj and 'title' in obj:
+            result = _article_from(obj)
+            if result:
+                return result
+
+        # 재귀 탐색
+        for v in obj.values():
+            result = find_article_body(v, depth + 1)
+            if result:
+                return result
+
+    elif isinstance(obj, list):
+        for item in obj:
+            result = find_article_body(item, depth + 1)
+            if result:
+                return result
+
+    return None
+
+
+def find_article(data):
+    """알려진 경로에서 먼저 기사를 찾고, 없으면 전체 탐색"""
+    for path in ARTICLE_PATHS:
+        result = _article_from(get_path(data, path))
+        if result:
+            return result
+    return find_article_body(data)
+
+
+def find_access_token(data):
+    """props.pageProps.accessToken 반환"""
+    token = get_path(data, ('props', 'pageProps', 'accessToken'))
+    return token if isinstance(token, str) else None
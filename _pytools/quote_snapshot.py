@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+종목 뱃지용 정적 데이터 (assets/data/tickers.json)
+- symbols: 종목 코드(EXCHANGE:SYMBOL) → instrument_id (크롤러가 본문 티커를 변환할 때 확인한 값)
+- quotes: instrument_id → [심볼, 현재가, 변동, 변동률] (실행 시 batch 조회한 시세 스냅샷)
+- 브라우저는 이 파일 하나만 받아서 페이지의 모든 뱃지를 표시 (종목 검색/종목별 시세 요청 없음)
+- 최근에 사용된 순서를 유지하고 개수를 제한하여 파일 크기 유지
+- 비어 있으면 기존 포스트(stock_tags front matter, 본문 티커 뱃지)에서 종목을 다시 수집 (seed_from_posts)
+"""
+
+import json
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+# front matter stock_tags 의 instrument_id
+STOCK_TAG_ID_PATTERN = re.compile(r'^\s+instrument_id:\s*"?(\d+)"?\s*$', re.MULTILINE)
+# 본문 티커 뱃지 (convert_tickers_to_badges 출력)
+TICKER_SPAN_PATTERN = re.compile(
+    r'<span class="stock-ticker" data-ticker="[^"]*" data-exchange="([^"]*)" data-symbol="([^"]*)"'
+    r' data-instrument-id="(\d+)"'
+)
+
+
+def scan_post(path):
+    """포스트 1개의 (종목 코드 → instrument_id, instrument_id 목록)"""
+    text = Path(path).read_text(encoding='utf-8')
+    symbols = {f"{exchange}:{symbol}": instrument_id
+               for exchange, symbol, instrument_id in TICKER_SPAN_PATTERN.findall(text)}
+    ids = STOCK_TAG_ID_PATTERN.findall(text.split('\n---', 1)[0]) + list(symbols.values())
+    return symbols, ids
+
+
+class QuoteSnapshot:
+    def __init__(self, path, max_symbols=5000, max_quotes=500):
+        self.path = Path(path)
+        self.max_symbols = max_symbols
+        self.max_quotes = max_quotes
+        self.lock = threading.Lock()
+        self.symbols = {}
+        self.quotes = {}
+        self.updated_at = 0.0
+        self.changed = False
+        self.load()
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] 종목 데이터 로드 실패 ({self.path}): {e}")
+            return
+
+        self.symbols = data.get('symbols', {})
+        self.quotes = data.get('quotes', {})
+        self.updated_at = data.get('updated_ts', 0.0)
+
+    def _touch(self, mapping, key, value):
+        """최근 사용 항목을 맨 앞으로 이동 (lock 보유 상태에서 호출)"""
+        mapping.pop(key, None)
+        items = [(key, value)] + list(mapping.items())
+        mapping.clear()
+        mapping.update(items)
+
+    def add_symbols(self, symbols):
+        """{종목 코드: instrument_id} 추가 (해당 종목 시세도 스냅샷 대상)"""
+        with self.lock:
+            for key, instrument_id in symbols.items():
+                if not instrument_id:
+                    continue
+                if self.symbols.get(key) != instrument_id:
+                    self.changed = True
+                self._touch(self.symbols, key, instrument_id)
+                self._touch(self.quotes, str(instrument_id), self.quotes.get(str(instrument_id)))
+
+    def add_instruments(self, instrument_ids):
+        """포스트에 사용된 instrument_id를 시세 스냅샷 대상에 추가"""
+        with self.lock:
+            for instrument_id in instrument_ids:
+                if not instrument_id:
+                    continue
+                if str(instrument_id) not in self.quotes:
+                    self.changed = True
+                self._touch(self.quotes, str(instrument_id), self.quotes.get(str(instrument_id)))
+
+    def is_empty(self):
+        with self.lock:
+            return not self.symbols and not self.quotes
+
+    def seed_from_posts(self, paths):
+        """
+        포스트 목록(오래된 순)의 종목으로 스냅샷 대상 채우기, 최근 포스트 종목이 앞쪽
+
+        Returns:
+            (종목 코드 수, instrument_id 수)
+        """
+        symbols = {}
+        ids = {}
+        for path in paths:
+            try:
+                post_symbols, post_ids = scan_post(path)
+            except OSError:
+                continue
+            for key, instrument_id in post_symbols.items():
+                symbols.pop(key, None)
+                symbols[key] = int(instrument_id)
+            for instrument_id in post_ids:
+                ids.pop(instrument_id, None)
+                ids[instrument_id] = None
+
+        with self.lock:
+            # 최근 포스트 순서로 앞에 두고 기존 항목은 뒤에 유지 (항목별 _touch 없이 한 번에 병합)
+            merged_symbols = dict(reversed(list(symbols.items())))
+            merged_symbols.update((k, v) for k, v in self.symbols.items() if k not in merged_symbols)
+            merged_quotes = {instrument_id: self.quotes.get(instrument_id) for instrument_id in reversed(ids)}
+            merged_quotes.update((k, v) for k, v in self.quotes.items() if k not in merged_quotes)
+            self.symbols = merged_symbols
+            self.quotes = merged_quotes
+            if symbols or ids:
+                self.changed = True
+        return len(symbols), len(ids)
+
+    def instrument_ids(self):
+        """시세를 조회할 instrument_id 목록 (최근 사용 순, 최대 max_quotes개)"""
+        with self.lock:
+            return list(self.quotes)[:self.max_quotes]
+
+    def age(self):
+        """마지막 시세 갱신 후 지난 시간(초)"""
+        return time.time() - self.updated_at
+
+    def write(self, instruments):
+        """
+        시세 반영 후 파일 저장
+
+        Args:
+            instruments: {instrument_id(str): 주식 정보 dict} (fetch_instruments_batch 결과)
+        """
+        with self.lock:
+            for instrument_id in list(self.quotes)[:self.max_quotes]:
+                inst = instruments.get(instrument_id)
+                if not inst:
+                    continue
+                price = inst.get('price') or {}
+                self.quotes[instrument_id] = [
+                    inst.get('symbol', ''), price.get('last'), price.get('change'), price.get('change_percent')
+                ]
+
+            symbols = dict(list(self.symbols.items())[:self.max_symbols])
+            quotes = {k: v for k, v in list(self.quotes.items())[:self.max_quotes] if v}
+            self.updated_at = time.time()
+            data = {
+                'v': 1,
+                'updated': datetime.now().astimezone().isoformat(timespec='seconds'),
+                'updated_ts': round(self.updated_at),
+                'symbols': symbols,
+                'quotes': quotes,
+            }
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            tmp_path.replace(self.path)
+            self.changed = False
+            return len(symbols), len(quotes)
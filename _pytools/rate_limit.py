@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+호스트별 토큰 버킷 Rate Limiter
+- 고정 time.sleep() 대신 호스트 단위로 요청 속도 제한
+- 여러 스레드가 같은 호스트를 공유해도 전체 요청률 유지
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+# 호스트별 (초당 요청 수, 버스트 크기)
+DEFAULT_HOST_RATES = {
+    'www.investing.com': (1.0, 2),
+    'kr.investing.com': (1.0, 2),
+    'endpoints.investing.com': (3.0, 3),
+    'i-invdn-com.investing.com': (4.0, 4),
+    'translate.google.com': (2.0, 2),
+}
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기, 대기한 시간(초) 반환"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+
+                delay = (1 - self.tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+class HostRateLimiter:
+    def __init__(self, host_rates=None, default_rate=(2.0, 2)):
+        self.host_rates = dict(DEFAULT_HOST_RATES)
+        if host_rates:
+            self.host_rates.update(host_rates)
+        self.default_rate = default_rate
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def _bucket(self, host):
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                rate, capacity = self.host_rates.get(host, self.default_rate)
+                bucket = TokenBucket(rate, capacity)
+                self.buckets[host] = bucket
+            return bucket
+
+    def wait(self, url_or_host):
+        """URL 또는 호스트명에 해당하는 버킷에서 토큰 획득"""
+        host = urlparse(url_or_host).hostname if '://' in url_or_host else url_or_host
+        return self._bucket(host or '').acquire()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 녹화/재생 (오프라인 테스트 및 벤치마크용)
+- RecordingSession: 실제 세션을 감싸서 모든 요청/응답을 fixture 파일로 저장
+- ReplaySession: fixture 파일로 응답 재생 (지연 시간, 오류 주입 설정 가능)
+- FakeTranslator: 네트워크 없이 동작하는 번역기
+- write_synthetic_fixtures: 녹화 없이 사용할 수 있는 합성 fixture 생성
+"""
+
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from http_cache import CachedResponse
+
+
+def exchange_key(method, url, data=None):
+    """요청을 식별하는 키 (메서드 + URL + 폼 데이터)"""
+    key = f"{method.upper()} {url}"
+    if data:
+        key += ' ' + json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return key
+
+
+def fixture_name(key):
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + '.json'
+
+
+def request_stage(url):
+    """URL을 처리 단계로 분류 (단계별 요청 수 집계용)"""
+    if 'news-delivery' in url:
+        return 'news_list'
+    if 'pd-instruments' in url:
+        return 'instruments'
+    if '/search/service/search' in url:
+        return 'search'
+    if '/news/latest-news' in url:
+        return 'token'
+    return 'article'
+
+
+class RecordingSession:
+    """실제 HTTP 세션을 감싸서 요청/응답을 fixture 디렉토리에 기록"""
+
+    def __init__(self, session, fixtures_dir):
+        self.session = session
+        self.fixtures_dir = Path(fixtures_dir)
+        self.fixtures_dir.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # cookies, headers 등은 원래 세션 그대로 사용
+        return getattr(self.session, name)
+
+    def _record(self, method, url, data, response):
+        key = exchange_key(method, url, data)
+        exchange = {
+            'key': key,
+            'method': method.upper(),
+            'url': url,
+            'data': data,
+            'status': response.status_code,
+            'headers': {k: v for k, v in response.headers.items()
+                        if k in ('Content-Type', 'ETag', 'Last-Modified')},
+        }
+        # 이미지 등 바이너리 응답은 base64로 저장
+        if response.headers.get('Content-Type', '').startswith('image/'):
+            exchange['text'] = ''
+            exchange['body_b64'] = base64.b64encode(response.content).decode('ascii')
+        else:
+            exchange['text'] = response.text
+
+        with self.lock:
+            with open(self.fixtures_dir / fixture_name(key), 'w', encoding='utf-8') as f:
+                json.dump(exchange, f, ensure_ascii=False)
+
+    def get(self, url, **kwargs):
+        response = self.session.get(url, **kwargs)
+        self._record('GET', url, None, response)
+        return response
+
+    def post(self, url, data=None, **kwargs):
+        response = self.session.post(url, data=data, **kwargs)
+        self._record('POST', url, data, response)
+        return response
+
+
+class _Cookies(dict):
+    """requests 쿠키 저장소 대용 (세션 상태 저장/복원 호환)"""
+
+    def set(self, name, value, **kwargs):
+        self[name] = value
+
+    def __iter__(self):
+        return iter([])
+
+
+class ReplaySession:
+    """fixture 디렉토리의 녹화 내용으로 응답을 재생"""
+
+    def __init__(self, fixtures_dir, latency=0.0, error_rate=0.0, seed=None):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.headers = {}
+        self.cookies = _Cookies()
+        self.requests = Counter()
+        self.errors = 0
+        self.lock = threading.Lock()
+
+        self.exchanges = {}
+        self.instruments = {}
+        for path in sorted(self.fixtures_dir.glob('*.json')):
+            with open(path, 'r', encoding='utf-8') as f:
+                exchange = json.load(f)
+            self.exchanges[exchange['key']] = exchange
+            if 'instrument_ids=' in exchange['url'] and exchange['status'] == 200:
+                for inst in json.loads(exchange['text'] or '[]'):
+                    self.instruments[str(inst.get('id'))] = inst
+
+    def _respond(self, method, url, data):
+        with self.lock:
+            self.requests[request_stage(url)] += 1
+            fail = self.random.random() < self.error_rate
+            if fail:
+                self.errors += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            return CachedResponse(url, '', status_code=503, from_cache=False)
+
+        exchange = self.exchanges.get(exchange_key(method, url, data))
+        if exchange:
+            response = CachedResponse(url, exchange['text'], exchange['headers'],
+                                      status_code=exchange['status'], from_cache=False)
+            if exchange.get('body_b64'):
+                response.content = base64.b64decode(exchange['body_b64'])
+            return response
+
+        # 녹화 시점과 batch 구성이 달라도 개별 종목 응답을 모아서 재생
+        if 'instrument_ids=' in url:
+            ids = parse_qs(urlparse(url).query).get('instrument_ids', [''])[0].split(',')
+            items = [self.instruments[i] for i in ids if i in self.instruments]
+            return CachedResponse(url, json.dumps(items), {'Content-Type': 'application/json'}, from_cache=False)
+
+        return CachedResponse(url, '', status_code=404, from_cache=False)
+
+    def get(self, url, **kwargs):
+        return self._respond('GET', url, None)
+
+    def post(self, url, data=None, **kwargs):
+        return self._respond('POST', url, data)
+
+
+class FakeTranslator:
+    """입력 문단마다 고정된 한국어 접두어를 붙여 반환하는 번역기"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self.chars = 0
+        self.lock = threading.Lock()
+
+    def translate(self, text):
+        with self.lock:
+            self.calls += 1
+            self.chars += len(text)
+        if self.latency:
+            time.sleep(self.latency)
+        return '\n\n'.join(f"[번역] {p}" for p in text.split('\n\n'))
+
+
+def write_synthetic_fixtures(fixtures_dir, count=10, base_url="https://www.investing.com", page_size=None):
+    """뉴스 목록(page_size 지정 시 페이지별 목록 포함), 기사 페이지, 종목 정보로 구성된 합성 fixture 생성"""
+    fixtures_dir = Path(fixtures_dir)
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+
+    def write(method, url, text, data=None, status=200, content_type='application/json'):
+        key = exchange_key(method, url, data)
+        with open(fixtures_dir / fixture_name(key), 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'method': method, 'url': url, 'data': data, 'status': status,
+                       'headers': {'Content-Type': content_type}, 'text': text}, f, ensure_ascii=False)
+
+    token = 'eyJhbGciOiJIUzI1NiJ9.' + 'e' * 120 + '.signature'
+    next_data = {'props': {'pageProps': {'accessToken': token}}}
+    write('GET', f"{base_url}/news/latest-news",
+          f'<html><script id="__NEXT_DATA__">{json.dumps(next_data)}</script></html>', content_type='text/html')
+
+    symbols = [('NASDAQ', 'NVDA', 6497), ('NASDAQ', 'AAPL', 6408), ('KS', '005930', 43433), ('NYSE', 'JPM', 267)]
+    articles = []
+    for i in range(count):
+        article_id = 4000000 + i
+        link = f"/news/stock-market-news/synthetic-article-{article_id}"
+        exchange, symbol, inst_id = symbols[i % len(symbols)]
+        paragraphs = [
+            f"Shares of Company {i} ({exchange}:{symbol}) moved after quarterly results beat estimates. " * 3
+            for _ in range(8 + i % 5)
+        ]
+        paragraphs.append("This article was generated with the support of AI and reviewed by an editor.")
+        body = ''.join(f"<p>{p}</p>" for p in paragraphs)
+        page_data = {'props': {'pageProps': {'articleStore': {'article': {'title': f"Synthetic story {i}", 'body': body}}}}}
+        page = f'<html><script id="__NEXT_DATA__">{json.dumps(page_data)}</script></html>'
+        write('GET', f"{base_url}{link}".replace('www.investing.com', 'kr.investing.com'), '', status=404,
+              content_type='text/html')
+        write('GET', f"{base_url}{link}", page, content_type='text/html')
+        articles.append({
+            'id': article_id,
+            'title': f"Synthetic story {i} By Investing.com",
+            'link': link,
+            'body': '',
+            'media': [{'purpose': 'main_image', 'url': f"https://i-invdn-com.investing.com/news/{article_id}.jpg"}],
+            'instruments': [{'id': inst_id, 'primary_tag': True}],
+            'published_at': '2025-11-21T05:25:08Z',
+        })
+
+    list_url = "https://endpoints.investing.com/news-delivery/api/v2/articles/delivery/domains/18/news/lists/breaking-news"
+    write('GET', list_url, json.dumps({'articles': articles}))
+    if page_size:
+        for page, start in enumerate(range(0, count + page_size, page_size), 1):
+            write('GET', f"{list_url}?page={page}&page_size={page_size}",
+                  json.dumps({'articles': articles[start:start + page_size]}))
+    write('GET', "https://endpoints.investing.com/pd-instruments/v1/instruments?instrument_ids="
+          + ','.join(str(inst_id) for _, _, inst_id in symbols),
+          json.dumps([{'id': inst_id, 'long_name': f"{symbol} Inc", 'symbol': symbol, 'exchange_id': 1,
+                       'price': {'last': 100.0, 'change': 1.0, 'change_percent': 1.0},
+                       'link': f"/equities/{symbol.lower()}"} for _, symbol, inst_id in symbols]))
+
+    return count
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실행 마감 시간 (--deadline)
+- 남은 시간이 전체의 일정 비율 아래로 내려가면 선택 작업을 순서대로 생략
+  본문 크롤링(API 요약 사용)·이미지 저장(원본 URL 사용) → 티커 검색(캐시만) → 주식 정보 조회(캐시만)
+- 기사 1개 처리 시간(이동 평균)보다 남은 시간이 적으면 새 기사를 시작하지 않음 (다음 실행에서 처리)
+- 마지막 저장 단계(검색 인덱스, 종목 데이터, 메트릭)를 위한 시간은 항상 남겨 둠
+- HTTP 요청 timeout 을 남은 시간에 맞춰 줄임
+"""
+
+import threading
+import time
+
+# (생략할 작업, 남은 시간 비율) - 비율이 큰 작업부터 먼저 생략
+DEGRADE_STEPS = (
+    ('crawl', 0.4),
+    ('images', 0.4),
+    ('tickers', 0.25),
+    ('instruments', 0.15),
+)
+
+
+class RunDeadline:
+    def __init__(self, seconds, finish_reserve=None, steps=DEGRADE_STEPS):
+        self.seconds = seconds
+        self.end = time.monotonic() + seconds
+        # 마지막 저장 단계용 여유 시간
+        self.finish_reserve = min(30.0, seconds * 0.05) if finish_reserve is None else finish_reserve
+        self.thresholds = {step: fraction * seconds for step, fraction in steps}
+        # 기사 1개 처리 시간 추정값 (완료된 기사로 갱신)
+        self.article_seconds = min(60.0, seconds * 0.1)
+        self.lock = threading.Lock()
+
+    def remaining(self):
+        return self.end - time.monotonic()
+
+    def allows(self, step):
+        """선택 작업 step 을 아직 실행해도 되는지"""
+        return self.remaining() > self.thresholds[step] + self.finish_reserve
+
+    def can_start(self):
+        """새 기사를 시작해도 마감 전에 끝낼 수 있는지"""
+        with self.lock:
+            estimate = self.article_seconds
+        return self.remaining() > estimate + self.finish_reserve
+
+    def record_article(self, seconds):
+        """완료된 기사 처리 시간 반영 (지수 이동 평균)"""
+        with self.lock:
+            self.article_seconds = 0.3 * seconds + 0.7 * self.article_seconds
+
+    def timeout(self, default):
+        """남은 시간을 넘지 않는 요청 timeout (최소 1초)"""
+        return max(1.0, min(default, self.remaining() - self.finish_reserve))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실행 단계별 시간 측정 및 JSON 메트릭
+- stage(): 단계별 소요 시간 (전체 합계 + 기사별)
+- count(): 요청 수, 바이트, 재시도, 캐시 적중 등 카운터
+- write(): 실행 단위 JSON 파일 저장 (워크플로우 artifact로 비교)
+- prune_runs(): 기본 위치(.cache/metrics/)의 run-*.json 은 최근 keep개만 유지
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+
+def prune_runs(directory, keep=30):
+    """오래된 run-*.json 삭제 (파일명의 시각 순), 삭제된 수 반환"""
+    runs = sorted(Path(directory).glob('run-*.json'))
+    for path in runs[:-keep] if keep else runs:
+        path.unlink(missing_ok=True)
+    return max(0, len(runs) - keep)
+
+
+class RunMetrics:
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.start = time.perf_counter()
+        self.lock = threading.Lock()
+        self.stages = defaultdict(lambda: {'count': 0, 'seconds': 0.0})
+        self.articles = defaultdict(dict)
+        self.counters = defaultdict(int)
+
+    @contextmanager
+    def stage(self, name, article_id=None):
+        """with 블록의 소요 시간을 단계별로 누적"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                stage = self.stages[name]
+                stage['count'] += 1
+                stage['seconds'] += elapsed
+                if article_id is not None:
+                    article = self.articles[str(article_id)]
+                    article[name] = round(article.get(name, 0.0) + elapsed, 4)
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counters[name] += value
+
+    def to_dict(self, extra=None):
+        with self.lock:
+            data = {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'wall_seconds': round(time.perf_counter() - self.start, 4),
+                'stages': {name: {'count': s['count'], 'seconds': round(s['seconds'], 4)}
+                           for name, s in sorted(self.stages.items())},
+                'counters': dict(sorted(self.counters.items())),
+                'articles': dict(self.articles),
+            }
+        if extra:
+            data.update(extra)
+        return data
+
+    def write(self, path, extra=None):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(extra), f, ensure_ascii=False, indent=2)
+        return path
+
+    def summary_lines(self):
+        """콘솔 출력용 단계별 요약"""
+        lines = []
+        for name, s in sorted(self.stages.items(), key=lambda item: -item[1]['seconds']):
+            lines.append(f"  - {name:<22} {s['seconds']:7.2f}s ({s['count']}회)")
+        return lines
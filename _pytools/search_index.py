@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색 인덱스 생성기 (월별 샤드)
+- _posts/ 의 포스트를 월(YYYY-MM) 단위 샤드로 나누어 역색인 생성
+- 샤드: 문서 목록(제목, URL, 요약, 날짜, 이미지) + 토큰 → 문서 번호 목록
+- 토큰: 영문/숫자 단어 + 한글 2-gram
+- 크롤러가 포스트를 만들 때마다 해당 샤드만 갱신 (flush 시 한 번에 저장)
+- 브라우저는 manifest.json만 먼저 받고 필요한 샤드를 나중에 요청
+
+사용법:
+    python search_index.py --rebuild    # _posts/ 전체로 재생성
+"""
+
+import json
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+
+WORD_PATTERN = re.compile(r'[a-z0-9]+|[가-힣]+')
+HANGUL_PATTERN = re.compile(r'[가-힣]+')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+POST_FILENAME_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})-(.+)\.md$')
+
+EXCERPT_LENGTH = 160
+
+
+def tokenize(text):
+    """검색 토큰 집합 (영문 소문자 단어, 한글은 2-gram)"""
+    tokens = set()
+    for word in WORD_PATTERN.findall(text.lower()):
+        if HANGUL_PATTERN.fullmatch(word):
+            if len(word) == 1:
+                tokens.add(word)
+            else:
+                tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+        elif len(word) >= 2:
+            tokens.add(word)
+    return tokens
+
+
+def _unquote(value):
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    return value
+
+
+def parse_post(text):
+    """포스트를 (front matter dict, 본문)으로 분리 (최상위 스칼라/인라인 리스트만 해석)"""
+    if not text.startswith('---'):
+        return {}, text
+
+    end = text.find('\n---', 3)
+    if end == -1:
+        return {}, text
+
+    meta = {}
+    for line in text[3:end].splitlines():
+        if not line or line[0] in ' \t-#' or ':' not in line:
+            continue
+        key, value = line.split(':', 1)
+        value = value.strip()
+        if value.startswith('[') and value.endswith(']'):
+            meta[key.strip()] = [_unquote(v) for v in value[1:-1].split(',') if v.strip()]
+        else:
+            meta[key.strip()] = _unquote(value)
+
+    body = text[end + 4:]
+    return meta, body.split('\n', 1)[1] if '\n' in body else ''
+
+
+def post_url(filename, meta):
+    """Jekyll 기본 permalink (/:categories/:year/:month/:day/:title.html)"""
+    match = POST_FILENAME_PATTERN.match(filename)
+    if not match:
+        return None
+    year, month, day, slug = match.groups()
+    categories = meta.get('categories') or []
+    if isinstance(categories, str):
+        categories = categories.split()
+    prefix = ''.join(f"/{c.lower()}" for c in dict.fromkeys(categories))
+    return f"{prefix}/{year}/{month}/{day}/{slug}.html"
+
+
+def build_document(filepath):
+    """포스트 파일 → (샤드 ID, 문서 dict, 토큰 집합)"""
+    filepath = Path(filepath)
+    meta, body = parse_post(filepath.read_text(encoding='utf-8'))
+    url = post_url(filepath.name, meta)
+    if not url:
+        return None
+
+    date = meta.get('date', '') or filepath.name[:10]
+    shard_id = date[:7]
+    body_text = ' '.join(HTML_TAG_PATTERN.sub(' ', body).split())
+    excerpt = meta.get('excerpt') or body_text[:EXCERPT_LENGTH]
+    title = meta.get('title', '')
+    categories = meta.get('categories') or []
+
+    doc = {
+        't': title,
+        'u': url,
+        'e': excerpt[:EXCERPT_LENGTH],
+        'd': date[:10],
+        'i': meta.get('image', ''),
+    }
+    tokens = tokenize(' '.join([title, excerpt, body_text, ' '.join(categories)]))
+    return shard_id, doc, tokens
+
+
+class SearchIndexBuilder:
+    def __init__(self, posts_dir, output_dir, archive_dir=None):
+        self.posts_dir = Path(posts_dir)
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self.output_dir = Path(output_dir)
+        self.shards_dir = self.output_dir / "shards"
+        self.manifest_path = self.output_dir / "manifest.json"
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def add_post(self, filepath):
+        """새로 생성된 포스트를 갱신 대기열에 추가 (flush 시 반영)"""
+        try:
+            built = build_document(filepath)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  [WARNING] 검색 인덱스 추가 실패 ({filepath}): {e}")
+            return
+        if not built:
+            return
+
+        shard_id, doc, tokens = built
+        with self.lock:
+            self.pending.setdefault(shard_id, {})[doc['u']] = (doc, sorted(tokens))
+
+    def _load_shard(self, shard_id):
+        """샤드 파일 → {url: (doc, tokens)}"""
+        path = self.shards_dir / f"{shard_id}.json"
+        if not path.exists():
+            return {}
+
+        with open(path, 'r', encoding='utf-8') as f:
+            shard = json.load(f)
+
+        tokens_by_doc = [[] for _ in shard['docs']]
+        for token, postings in shard['index'].items():
+            for doc_index in postings:
+                tokens_by_doc[doc_index].append(token)
+        return {doc['u']: (doc, tokens) for doc, tokens in zip(shard['docs'], tokens_by_doc)}
+
+    def _write_shard(self, shard_id, entries):
+        """문서를 최신순으로 정렬하고 역색인 생성 후 저장"""
+        ordered = sorted(entries.values(), key=lambda entry: (entry[0]['d'], entry[0]['u']), reverse=True)
+        index = {}
+        for doc_index, (_, tokens) in enumerate(ordered):
+            for token in tokens:
+                index.setdefault(token, []).append(doc_index)
+
+        self.shards_dir.mkdir(parents=True, exist_ok=True)
+        path = self.shards_dir / f"{shard_id}.json"
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'docs': [doc for doc, _ in ordered], 'index': index},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        tmp_path.replace(path)
+        return len(ordered)
+
+    def _write_manifest(self, counts):
+        manifest = {'version': 1, 'updated': datetime.now().isoformat(timespec='seconds'), 'shards': []}
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest['shards'] = json.load(f).get('shards', [])
+
+        shards = {shard['id']: shard for shard in manifest['shards']}
+        for shard_id, count in counts.items():
+            shards[shard_id] = {'id': shard_id, 'count': count, 'file': f"shards/{shard_id}.json"}
+
+        manifest['shards'] = sorted(shards.values(), key=lambda shard: shard['id'], reverse=True)
+        manifest['total'] = sum(shard['count'] for shard in manifest['shards'])
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+
+    def flush(self):
+        """대기 중인 포스트를 해당 샤드에만 반영"""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        if not pending:
+            return 0
+
+        counts = {}
+        for shard_id, entries in pending.items():
+            shard = self._load_shard(shard_id)
+            shard.update(entries)
+            counts[shard_id] = self._write_shard(shard_id, shard)
+        self._write_manifest(counts)
+
+        updated = sum(len(entries) for entries in pending.values())
+        print(f"[OK] 검색 인덱스 갱신 ({updated}개 포스트, 샤드 {len(counts)}개)")
+        return updated
+
+    def is_empty(self):
+        """매니페스트가 없거나 샤드가 하나도 없는지 (한 번도 재생성하지 않은 인덱스)"""
+        if not self.manifest_path.exists():
+            return True
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return not json.load(f).get('shards')
+        except (OSError, ValueError):
+            return True
+
+    def rebuild(self):
+        """_posts/ 와 보관된 포스트(_archive/) 전체로 인덱스 재생성"""
+        posts = list(self.posts_dir.glob('*.md'))
+        if self.archive_dir and self.archive_dir.exists():
+            posts.extend(self.archive_dir.rglob('*.md'))
+
+        shards = {}
+        for post in sorted(posts, key=lambda path: path.name):
+            built = build_document(post)
+            if built:
+                shard_id, doc, tokens = built
+                shards.setdefault(shard_id, {})[doc['u']] = (doc, sorted(tokens))
+
+        if self.shards_dir.exists():
+            for old in self.shards_dir.glob('*.json'):
+                if old.stem not in shards:
+                    old.unlink()
+        if self.manifest_path.exists():
+            self.manifest_path.unlink()
+
+        counts = {shard_id: self._write_shard(shard_id, entries) for shard_id, entries in shards.items()}
+        self._write_manifest(counts)
+        print(f"[OK] 검색 인덱스 재생성 완료 ({sum(counts.values())}개 포스트, 샤드 {len(counts)}개)")
+        return counts
+
+
+def main():
+    import argparse
+
+    root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description='검색 인덱스 생성기 (월별 샤드)')
+    parser.add_argument('--rebuild', action='store_true', help='_posts/ 전체로 재생성')
+    parser.add_argument('--if-empty', action='store_true',
+                        help='--rebuild 와 함께 사용: 인덱스에 샤드가 없을 때만 재생성 (워크플로우에서 매 실행 호출)')
+    parser.add_argument('--posts', default=str(root / "_posts"), help='포스트 디렉토리')
+    parser.add_argument('--archive', default=str(root / "_archive"), help='보관된 포스트 디렉토리')
+    parser.add_argument('--output', default=str(root / "assets" / "search"), help='인덱스 출력 디렉토리')
+    parser.add_argument('files', nargs='*', help='갱신할 포스트 파일')
+    args = parser.parse_args()
+
+    builder = SearchIndexBuilder(args.posts, args.output, args.archive)
+    if args.if_empty and not builder.is_empty():
+        print("[SKIP] 검색 인덱스가 이미 있음 (--if-empty)")
+        return
+    if args.if_empty and not any(Path(args.posts).glob('*.md')) and not any(Path(args.archive).rglob('*.md')):
+        print("[SKIP] 색인할 포스트 없음 (--if-empty)")
+        return
+    if args.rebuild or not args.files:
+        builder.rebuild()
+    else:
+        for path in args.files:
+            builder.add_post(path)
+        builder.flush()
+
+
+if __name__ == "__main__":
+    main()
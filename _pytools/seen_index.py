@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+처리 완료 기사 인덱스
+- article_id 기반 O(1) 중복 조회
+- append-only 텍스트 파일 (한 줄에 article_id 하나)
+- _posts/ (및 _archive/) 의 front matter에서 언제든 재생성 가능
+- 인덱스에 반영한 포스트 파일명 목록을 함께 저장하여, 실행 시 목록에 없는 파일만 읽어 병합
+  (checkout/캐시 복원/보관 이동으로 바뀌는 mtime과 무관, 보관 시 파일명은 그대로이므로 다시 읽지 않음)
+- 포스트를 만들 수 없는 기사는 별도 파일에 건너뜀 상태로 기록 (재생성 대상 아님)
+  일시적인 실패일 수 있으므로 SKIP_ATTEMPTS 번 건너뛴 뒤부터 처리된 기사로 취급
+"""
+
+import re
+import threading
+from pathlib import Path
+
+ARTICLE_ID_PATTERN = re.compile(r'^article_id:\s*["\']?([^"\'\n]+)["\']?\s*$', re.MULTILINE)
+
+# 이 횟수만큼 건너뛴 기사는 다시 시도하지 않음
+SKIP_ATTEMPTS = 3
+
+
+def read_front_matter(filepath, max_lines=40):
+    """포스트 파일에서 front matter 부분만 읽기 (본문은 읽지 않음)"""
+    lines = []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        first = f.readline()
+        if first.strip() != '---':
+            return ''
+        for _ in range(max_lines):
+            line = f.readline()
+            if not line or line.strip() == '---':
+                break
+            lines.append(line)
+    return ''.join(lines)
+
+
+def read_article_id(filepath):
+    """포스트 front matter에서 article_id 추출"""
+    try:
+        match = ARTICLE_ID_PATTERN.search(read_front_matter(filepath))
+        return match.group(1).strip() if match else None
+    except OSError:
+        return None
+
+
+class SeenArticleIndex:
+    def __init__(self, index_path, posts_dir, archive_dir=None):
+        self.index_path = Path(index_path)
+        self.posts_dir = Path(posts_dir)
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self.skipped_path = self.index_path.with_name(f"{self.index_path.stem}_skipped.txt")
+        self.files_path = self.index_path.with_name(f"{self.index_path.stem}_files.txt")
+        self._ids = set()
+        self._skips = {}  # article_id -> 건너뛴 횟수
+        self._lock = threading.Lock()
+        self.load()
+        self.load_skips()
+
+    def load(self):
+        """인덱스 파일 로드 후 아직 반영하지 않은 포스트 파일만 병합 (인덱스가 없으면 재생성)"""
+        if not self.index_path.exists() or not self.files_path.exists():
+            self.rebuild()
+            return
+
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            self._ids = {line.strip() for line in f if line.strip()}
+        with open(self.files_path, 'r', encoding='utf-8') as f:
+            indexed = {line.strip() for line in f if line.strip()}
+
+        new_posts = {name: path for name, path in self._post_files().items() if name not in indexed}
+        if not new_posts:
+            return
+
+        ids = {article_id for article_id in map(read_article_id, new_posts.values()) if article_id}
+        new_ids = sorted(ids - self._ids)
+        self._append(self.index_path, new_ids)
+        self._append(self.files_path, sorted(new_posts))
+        self._ids.update(new_ids)
+        print(f"[INFO] 기사 인덱스 갱신: 새 포스트 파일 {len(new_posts)}개 (새 article_id {len(new_ids)}개)")
+
+    def _post_files(self):
+        """{파일명: 경로} - _posts/ 와 보관된 포스트 (보관 시 파일명은 그대로)"""
+        posts = list(self.posts_dir.glob('*.md')) if self.posts_dir.exists() else []
+        if self.archive_dir and self.archive_dir.exists():
+            posts.extend(self.archive_dir.rglob('*.md'))
+        return {path.name: path for path in posts}
+
+    @staticmethod
+    def _append(path, lines):
+        if not lines:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.writelines(f"{line}\n" for line in lines)
+
+    @staticmethod
+    def _write(path, lines):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{line}\n" for line in lines)
+        tmp_path.replace(path)
+
+    def rebuild(self):
+        """_posts/ 와 보관된 포스트의 front matter로부터 인덱스 재생성"""
+        posts = self._post_files()
+
+        ids = set()
+        for post in posts.values():
+            article_id = read_article_id(post)
+            if article_id:
+                ids.add(article_id)
+
+        self._write(self.index_path, sorted(ids))
+        self._write(self.files_path, sorted(posts))
+
+        self._ids = ids
+        print(f"[INFO] 기사 인덱스 재생성 완료 ({len(ids)}개)")
+
+    def add(self, article_id):
+        """처리 완료된 article_id 추가"""
+        article_id = str(article_id).strip()
+        with self._lock:
+            if not article_id or article_id in self._ids:
+                return
+
+            self._ids.add(article_id)
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(f"{article_id}\n")
+
+    def load_skips(self):
+        """건너뜀 기록 로드 (한 줄에 article_id, 사유, 누적 횟수)"""
+        if not self.skipped_path.exists():
+            return
+        with open(self.skipped_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.rstrip('\n').split('\t')
+                if len(parts) == 3 and parts[2].isdigit():
+                    self._skips[parts[0]] = max(self._skips.get(parts[0], 0), int(parts[2]))
+
+    def skip(self, article_id, reason, permanent=False):
+        """
+        포스트를 만들 수 없었던 기사 기록
+
+        Args:
+            permanent: True 이면 바로 처리된 기사로 취급 (다시 시도해도 같은 결과인 경우)
+
+        Returns:
+            이후 실행에서 건너뛰면 True
+        """
+        article_id = str(article_id).strip()
+        if not article_id:
+            return False
+        with self._lock:
+            attempts = SKIP_ATTEMPTS if permanent else self._skips.get(article_id, 0) + 1
+            self._skips[article_id] = attempts
+            self.skipped_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.skipped_path, 'a', encoding='utf-8') as f:
+                f.write(f"{article_id}\t{reason}\t{attempts}\n")
+        return attempts >= SKIP_ATTEMPTS
+
+    def compact_skips(self):
+        """건너뜀 기록을 article_id당 한 줄로 정리 (이후 포스트가 생성된 기사는 제외), 정리 후 줄 수 반환"""
+        with self._lock:
+            if not self.skipped_path.exists():
+                return 0
+            reasons = {}
+            with open(self.skipped_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.rstrip('\n').split('\t')
+                    if len(parts) == 3 and parts[2].isdigit():
+                        reasons[parts[0]] = parts[1]
+            lines = [f"{article_id}\t{reasons[article_id]}\t{attempts}"
+                     for article_id, attempts in sorted(self._skips.items())
+                     if article_id in reasons and article_id not in self._ids]
+            self._write(self.skipped_path, lines)
+            return len(lines)
+
+    def __contains__(self, article_id):
+        article_id = str(article_id).strip()
+        return article_id in self._ids or self._skips.get(article_id, 0) >= SKIP_ATTEMPTS
+
+    def __len__(self):
+        return len(self._ids)
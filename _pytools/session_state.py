@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실행 간 세션 상태 저장
+- Bearer JWT 토큰 (만료 시각은 JWT exp 클레임 사용)
+- cloudscraper 쿠키 (Cloudflare cf_clearance 등)와 User-Agent
+"""
+
+import base64
+import json
+import time
+from pathlib import Path
+
+# exp 클레임이 없는 토큰의 기본 유효 시간 (초)
+DEFAULT_TOKEN_TTL = 1800
+
+
+def jwt_expiry(token):
+    """JWT payload의 exp 클레임 반환 (해석 실패 시 None)"""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        exp = claims.get('exp')
+        return float(exp) if exp else None
+    except Exception:
+        return None
+
+
+class SessionState:
+    def __init__(self, state_path, expiry_margin=60):
+        self.state_path = Path(state_path)
+        self.expiry_margin = expiry_margin
+        self.bearer_token = None
+        self.token_expires_at = None
+        self.cookies = []
+        self.user_agent = None
+        self.load()
+
+    def load(self):
+        if not self.state_path.exists():
+            return
+
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] 세션 상태 로드 실패: {e}")
+            return
+
+        self.bearer_token = data.get('bearer_token')
+        self.token_expires_at = data.get('token_expires_at')
+        self.cookies = data.get('cookies', [])
+        self.user_agent = data.get('user_agent')
+
+    def save(self):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'bearer_token': self.bearer_token,
+                'token_expires_at': self.token_expires_at,
+                'cookies': self.cookies,
+                'user_agent': self.user_agent,
+            }, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.state_path)
+
+    def valid_token(self):
+        """만료되지 않은 저장 토큰 반환 (없으면 None)"""
+        if not self.bearer_token or not self.token_expires_at:
+            return None
+        if self.token_expires_at - self.expiry_margin <= time.time():
+            return None
+        return self.bearer_token
+
+    def set_token(self, token):
+        self.bearer_token = token
+        if token:
+            self.token_expires_at = jwt_expiry(token) or time.time() + DEFAULT_TOKEN_TTL
+        else:
+            self.token_expires_at = None
+
+    def restore_session(self, session):
+        """저장된 쿠키/User-Agent를 requests 세션에 복원 (만료된 쿠키 제외)"""
+        now = time.time()
+        restored = 0
+        for cookie in self.cookies:
+            if cookie.get('expires') and cookie['expires'] <= now:
+                continue
+            session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/'),
+                expires=cookie.get('expires'), secure=cookie.get('secure', False)
+            )
+            restored += 1
+
+        if self.user_agent:
+            session.headers['User-Agent'] = self.user_agent
+        return restored
+
+    def capture_session(self, session):
+        """requests 세션의 쿠키/User-Agent 저장"""
+        self.cookies = [
+            {
+                'name': c.name,
+                'value': c.value,
+                'domain': c.domain,
+                'path': c.path,
+                'expires': c.expires,
+                'secure': c.secure,
+            }
+            for c in session.cookies
+        ]
+        self.user_agent = session.headers.get('User-Agent')
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""_pytools/ 의 모듈을 스크립트와 같은 방식(평문 import)으로 불러오기 위한 경로 설정"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
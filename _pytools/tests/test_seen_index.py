@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""기사 인덱스(seen_index) 동작 확인"""
+
+from investing_complete_kr import InvestingCompleteKR
+from replay import FakeTranslator
+
+SUMMARY = ' '.join(f"Shares of company {i} rallied after the central bank held rates steady." for i in range(12))
+
+
+def make_crawler(tmp_path):
+    return InvestingCompleteKR(translator=FakeTranslator(), posts_dir=tmp_path / "_posts",
+                               cache_dir=tmp_path / ".cache")
+
+
+def article(article_id, title):
+    return {'id': article_id, 'title': title, 'url': f"https://www.investing.com/news/{article_id}",
+            'summary': SUMMARY, 'image_url': '', 'instrument_ids': []}
+
+
+def test_near_duplicate_skip_survives_rebuild(tmp_path):
+    crawler = make_crawler(tmp_path)
+
+    assert crawler.create_post(article(5000001, 'Central bank holds rates'), 1)
+    assert not crawler.create_post(article(5000002, 'UPDATE 1-Central bank holds rates'), 2)
+    assert crawler.metrics.counters['near_duplicates'] == 1
+
+    crawler.seen_index.rebuild()
+    assert 5000001 in crawler.seen_index
+    assert 5000002 in crawler.seen_index
+
+    # 새 인스턴스(다음 실행)에서도 건너뜀
+    assert 5000002 in make_crawler(tmp_path).seen_index
+
+
+def write_post(path, article_id):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nlayout: post\narticle_id: \"{article_id}\"\n---\n\n본문\n", encoding='utf-8')
+
+
+def test_load_reads_only_new_post_files(tmp_path, monkeypatch):
+    import os
+    import seen_index
+
+    posts_dir = tmp_path / "_posts"
+    archive_dir = tmp_path / "_archive"
+    index_path = tmp_path / ".cache" / "seen_articles.txt"
+    for i in range(5):
+        write_post(posts_dir / f"2025-01-0{i + 1}-post-{i}.md", 6000000 + i)
+    seen_index.SeenArticleIndex(index_path, posts_dir, archive_dir)
+
+    reads = []
+    original = seen_index.read_article_id
+    monkeypatch.setattr(seen_index, 'read_article_id', lambda path: reads.append(path.name) or original(path))
+
+    # 보관 이동 + checkout 처럼 _posts/ mtime이 인덱스보다 새로워져도 다시 읽지 않음
+    archived = archive_dir / "2025" / "01" / "2025-01-01-post-0.md"
+    archived.parent.mkdir(parents=True)
+    (posts_dir / archived.name).rename(archived)
+    os.utime(posts_dir)
+    index = seen_index.SeenArticleIndex(index_path, posts_dir, archive_dir)
+    assert reads == []
+    assert all(6000000 + i in index for i in range(5))
+
+    # 새로 받은 포스트(git pull 등)만 읽어서 병합
+    write_post(posts_dir / "2025-01-06-post-5.md", 6000005)
+    index = seen_index.SeenArticleIndex(index_path, posts_dir, archive_dir)
+    assert reads == ["2025-01-06-post-5.md"]
+    assert 6000005 in index
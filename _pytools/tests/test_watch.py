@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""감시 모드 확인 간격 계산용 상태 확인"""
+
+import investing_complete_kr
+from investing_complete_kr import InvestingCompleteKR
+from replay import FakeTranslator
+
+
+def test_polled_ids_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(investing_complete_kr, 'POLLED_IDS_MAX', 100)
+    crawler = InvestingCompleteKR(translator=FakeTranslator(), posts_dir=tmp_path / "_posts",
+                                  cache_dir=tmp_path / ".cache")
+
+    for start in range(0, 1000, 50):
+        crawler.remember_polled(range(start, start + 50))
+    # 다시 보인 ID는 최신으로 유지
+    crawler.remember_polled([0])
+
+    assert len(crawler.polled_ids) == 100
+    assert list(crawler.polled_ids)[0] == 901
+    assert list(crawler.polled_ids)[-1] == 0
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""작업 큐(work_queue) 와 크롤러 큐 처리 동작 확인"""
+
+from investing_complete_kr import InvestingCompleteKR
+from replay import FakeTranslator
+from work_queue import WorkQueue
+
+BODY = ' '.join(f"Shares of company {i} rallied after the central bank held rates steady." for i in range(12))
+
+
+def test_empty_fetch_is_retried_from_queue(tmp_path):
+    crawler = InvestingCompleteKR(translator=FakeTranslator(), posts_dir=tmp_path / "_posts",
+                                  cache_dir=tmp_path / ".cache")
+    crawler.work_queue = WorkQueue(tmp_path / ".cache" / "queue.sqlite3")
+    crawler.queue_retry_delay = 0
+    article = {'id': 5100001, 'title': 'Central bank holds rates', 'summary': '', 'image_url': '',
+               'url': 'https://www.investing.com/news/5100001', 'instrument_ids': []}
+
+    # 첫 번째 실행: 본문을 가져오지 못함 → 완료 처리되지 않고 큐에 다시 대기
+    crawler.fetch_full_article_content = lambda url: (None, None)
+    assert crawler.process_queue([article], limit=1) == 0
+    assert crawler.work_queue.stats() == {'queued': 1}
+    assert 5100001 not in crawler.seen_index
+
+    # 다음 실행: 본문을 가져오면 게시
+    crawler.fetch_full_article_content = lambda url: (None, BODY)
+    assert crawler.process_queue([article], limit=1) == 1
+    assert crawler.work_queue.stats() == {'done': 1}
+
+
+def test_retry_after_delays_claim(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite3")
+    queue.enqueue([{'id': 1}])
+    assert [a['id'] for a in queue.claim('w1')] == [1]
+
+    queue.release('w1', 1, 'not published', retry_after=3600)
+    assert queue.claim('w1') == []
+    assert queue.stats() == {'queued': 1}
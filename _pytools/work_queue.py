@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 실행기/프로세스가 함께 쓰는 기사 작업 큐 (SQLite)
+- 뉴스 목록에서 받은 기사를 article_id 기준으로 한 번만 등록 (완료된 기사는 다시 등록되지 않음)
+- 작업자는 기사를 임대(lease)하여 처리하고, 처리 중에는 heartbeat로 임대 기간을 연장
+- 임대가 만료된 기사(작업자 종료/중단)는 다른 작업자가 다시 가져감, max_attempts 초과 시 failed
+- 일시적으로 처리하지 못한 기사(본문 없음 등)는 retry_after 초 뒤에 다시 가져갈 수 있도록 반환
+- 포스트 게시: 임시 파일 작성 → 임대 확인과 완료 기록을 한 트랜잭션으로 커밋 → 파일 이름 변경
+  임대를 잃은 작업자는 커밋할 수 없으므로 포스트는 한 번만 생성됨
+  커밋 후 이름 변경 전에 중단되면 다음 작업자가 recover_publishes()로 마무리
+- 여러 머신에서 공유 볼륨으로 사용할 때는 POSIX 파일 잠금을 지원하는 파일시스템이어야 함 (WAL 미사용)
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def default_worker_id():
+    """호스트 이름 + PID"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class WorkQueue:
+    def __init__(self, db_path, lease_seconds=300, max_attempts=3):
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=DELETE')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            'article_id TEXT PRIMARY KEY, payload TEXT NOT NULL, '
+            "status TEXT NOT NULL DEFAULT 'queued', owner TEXT, lease_until REAL, "
+            'attempts INTEGER NOT NULL DEFAULT 0, error TEXT, post TEXT, pending_tmp TEXT, '
+            'enqueued_at REAL NOT NULL, updated_at REAL NOT NULL, available_at REAL)'
+        )
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(jobs)')}
+        if 'available_at' not in columns:
+            self.conn.execute('ALTER TABLE jobs ADD COLUMN available_at REAL')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, enqueued_at)')
+
+    @contextmanager
+    def transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (프로세스 간 claim/complete 직렬화)"""
+        with self.lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+            self.conn.execute('COMMIT')
+
+    def enqueue(self, articles):
+        """기사 등록 (이미 있는 article_id는 무시), 새로 등록된 수 반환"""
+        now = time.time()
+        rows = [(str(a.get('id')), json.dumps(a, ensure_ascii=False), now + i * 1e-6, now)
+                for i, a in enumerate(articles) if a.get('id')]
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO jobs (article_id, payload, enqueued_at, updated_at) VALUES (?, ?, ?, ?)',
+                rows
+            )
+            return conn.total_changes - before
+
+    def claim(self, owner, limit=1):
+        """
+        대기 중(재시도 시각이 지난)이거나 임대가 만료된 기사를 등록 순서대로 임대
+
+        Returns:
+            기사 dict 목록
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            # 임대 만료 + 시도 횟수 초과는 실패 처리
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', owner = NULL, error = COALESCE(error, 'lease expired'), "
+                "updated_at = ? WHERE status = 'leased' AND lease_until < ? AND attempts >= ?",
+                (now, now, self.max_attempts)
+            )
+            rows = conn.execute(
+                "SELECT article_id, payload FROM jobs "
+                "WHERE (status = 'queued' AND COALESCE(available_at, 0) <= ?) "
+                "OR (status = 'leased' AND lease_until < ?) "
+                "ORDER BY enqueued_at LIMIT ?",
+                (now, now, limit)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET status = 'leased', owner = ?, lease_until = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE article_id = ?",
+                [(owner, now + self.lease_seconds, now, article_id) for article_id, _ in rows]
+            )
+        return [json.loads(payload) for _, payload in rows]
+
+    def heartbeat(self, owner, article_ids):
+        """아직 임대 중인 기사의 임대 기간 연장, 연장된 수 반환"""
+        article_ids = [str(i) for i in article_ids]
+        if not article_ids:
+            return 0
+        now = time.time()
+        placeholders = ','.join('?' * len(article_ids))
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET lease_until = ?, updated_at = ? "
+                f"WHERE status = 'leased' AND owner = ? AND article_id IN ({placeholders})",
+                [now + self.lease_seconds, now, owner, *article_ids]
+            )
+            return cursor.rowcount
+
+    def holds(self, conn, owner, article_id):
+        """트랜잭션 안에서 임대 보유 여부 확인 (만료되었어도 다른 작업자가 가져가지 않았으면 보유)"""
+        row = conn.execute(
+            "SELECT 1 FROM jobs WHERE article_id = ? AND status = 'leased' AND owner = ?",
+            (str(article_id), owner)
+        ).fetchone()
+        return row is not None
+
+    def publish(self, owner, article_id, filepath, text):
+        """
+        포스트를 한 번만 게시
+
+        Returns:
+            True: 게시 완료 / False: 임대를 잃었거나 이미 완료된 기사 (파일을 쓰지 않음)
+        """
+        filepath = Path(filepath)
+        tmp_path = filepath.with_name(f".{filepath.name}.{owner}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+
+        try:
+            with self.transaction() as conn:
+                if not self.holds(conn, owner, article_id):
+                    tmp_path.unlink(missing_ok=True)
+                    return False
+                conn.execute(
+                    "UPDATE jobs SET status = 'done', owner = NULL, lease_until = NULL, post = ?, "
+                    "pending_tmp = ?, updated_at = ? WHERE article_id = ?",
+                    (str(filepath), str(tmp_path), time.time(), str(article_id))
+                )
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        self._finish_rename(article_id, tmp_path, filepath)
+        return True
+
+    def _finish_rename(self, article_id, tmp_path, filepath):
+        """임시 파일을 포스트 경로로 이동 (다른 작업자가 먼저 복구했으면 무시)"""
+        try:
+            os.replace(tmp_path, filepath)
+        except FileNotFoundError:
+            return False
+        finally:
+            self.clear_pending(article_id)
+        return True
+
+    def clear_pending(self, article_id):
+        with self.transaction() as conn:
+            conn.execute("UPDATE jobs SET pending_tmp = NULL WHERE article_id = ?", (str(article_id),))
+
+    def recover_publishes(self):
+        """완료 기록 후 파일 이름 변경 전에 중단된 게시 마무리, 복구된 포스트 경로 목록 반환"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT article_id, post, pending_tmp FROM jobs WHERE pending_tmp IS NOT NULL"
+            ).fetchall()
+
+        return [Path(post) for article_id, post, pending_tmp in rows
+                if self._finish_rename(article_id, Path(pending_tmp), Path(post))]
+
+    def complete(self, owner, article_ids, status='skipped'):
+        """아직 임대 중인 기사를 완료 처리 (게시 없이 끝난 기사), 처리된 수 반환"""
+        article_ids = [str(i) for i in article_ids]
+        if not article_ids:
+            return 0
+        placeholders = ','.join('?' * len(article_ids))
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET status = ?, owner = NULL, lease_until = NULL, updated_at = ? "
+                f"WHERE status = 'leased' AND owner = ? AND article_id IN ({placeholders})",
+                [status, time.time(), owner, *article_ids]
+            )
+            return cursor.rowcount
+
+    def release(self, owner, article_id, error=None, count_attempt=True, retry_after=0):
+        """
+        처리하지 못한 기사를 다시 대기 상태로 (시도 횟수 초과 시 failed)
+
+        Args:
+            count_attempt: False 이면 이번 임대를 시도 횟수에서 제외 (마감 시간 등으로 시작하지 않은 기사)
+            retry_after: 이 시간(초)이 지난 뒤에 다시 임대 가능 (같은 실행에서 바로 다시 가져가지 않도록)
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            if not count_attempt:
+                conn.execute(
+                    "UPDATE jobs SET attempts = MAX(attempts - 1, 0) "
+                    "WHERE article_id = ? AND status = 'leased' AND owner = ?",
+                    (str(article_id), owner)
+                )
+            conn.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+                "owner = NULL, lease_until = NULL, error = ?, updated_at = ?, available_at = ? "
+                "WHERE article_id = ? AND status = 'leased' AND owner = ?",
+                (self.max_attempts, error, now, now + retry_after, str(article_id), owner)
+            )
+
+    def stats(self):
+        """상태별 기사 수"""
+        with self.lock:
+            return dict(self.conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall())
+
+    def purge(self, older_than_days=14):
+        """오래된 완료/건너뜀 기록 삭제 (처리 여부는 기사 인덱스로 확인), 삭제된 수 반환"""
+        cutoff = time.time() - older_than_days * 86400
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'skipped') AND pending_tmp IS NULL AND updated_at < ?",
+                (cutoff,)
+            )
+            return cursor.rowcount
+
+
+class LeaseKeeper:
+    """처리 중인 기사의 임대를 주기적으로 연장하는 백그라운드 스레드"""
+
+    def __init__(self, queue, owner, interval=None):
+        self.queue = queue
+        self.owner = owner
+        self.interval = interval or max(1.0, queue.lease_seconds / 3)
+        self.article_ids = set()
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def track(self, article_ids):
+        with self.lock:
+            self.article_ids = {str(i) for i in article_ids}
+
+    def _loop(self):
+        while not self.stopped.wait(self.interval):
+            with self.lock:
+                article_ids = list(self.article_ids)
+            try:
+                self.queue.heartbeat(self.owner, article_ids)
+            except sqlite3.Error as e:
+                print(f"[WARNING] 작업 임대 연장 실패: {e}")
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self._loop, name='lease-keeper', daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='기사 작업 큐 상태 확인/정리')
+    parser.add_argument('--queue', default=str(Path(__file__).parent / ".cache" / "queue.sqlite3"),
+                        help='작업 큐 경로 (기본: .cache/queue.sqlite3)')
+    parser.add_argument('--purge', type=int, metavar='DAYS', help='DAYS일 지난 완료 기록 삭제')
+    args = parser.parse_args()
+
+    queue = WorkQueue(args.queue)
+    if args.purge is not None:
+        print(f"[OK] 완료 기록 {queue.purge(args.purge)}개 삭제")
+    stats = queue.stats()
+    print("작업 큐: " + (", ".join(f"{status} {count}개" for status, count in sorted(stats.items())) or "비어 있음"))
+
+
+if __name__ == "__main__":
+    main()
@@ -125,74 +125,118 @@ document.addEventListener('DOMContentLoaded', function() {
   });
   
   // Search Functionality
-  let searchData = [];
-  let searchIndex = null;
-  
-  // Get base URL - use relative path
-  const searchJsonPath = '/search.json';
-  
-  // Load search data
-  fetch(searchJsonPath)
+  // The index is split into monthly shards (built by _pytools/search_index.py).
+  // Only the small manifest is loaded up front; shards are fetched on demand, newest first.
+  const searchBasePath = '/assets/search/';
+  const maxResults = 10;
+  let searchManifest = null;
+  const loadedShards = {};
+
+  fetch(searchBasePath + 'manifest.json')
     .then(response => {
       if (!response.ok) {
-        throw new Error('Search data not found');
+        throw new Error('Search manifest not found');
       }
       return response.json();
     })
     .then(data => {
-      searchData = data;
-      // Create search index (simple word-based index)
-      searchIndex = searchData.map((item, index) => ({
-        index: index,
-        words: (item.title + ' ' + item.excerpt + ' ' + item.content + ' ' + (item.categories || []).join(' ') + ' ' + (item.tags || []).join(' ')).toLowerCase().split(/\s+/)
-      }));
+      searchManifest = data;
     })
     .catch(err => {
-      console.error('Error loading search data:', err);
+      console.error('Error loading search manifest:', err);
     });
-  
-  // Search function
-  function performSearch(query) {
-    if (!searchIndex || !query || query.trim().length === 0) {
-      return [];
+
+  function loadShard(shard) {
+    if (!loadedShards[shard.id]) {
+      loadedShards[shard.id] = fetch(searchBasePath + shard.file)
+        .then(response => {
+          if (!response.ok) {
+            throw new Error('Search shard not found: ' + shard.id);
+          }
+          return response.json();
+        })
+        .catch(err => {
+          console.error('Error loading search shard:', err);
+          delete loadedShards[shard.id];
+          return { docs: [], index: {} };
+        });
     }
-    
-    const queryWords = query.toLowerCase().trim().split(/\s+/);
-    const results = [];
-    
-    searchIndex.forEach(item => {
-      let score = 0;
-      const post = searchData[item.index];
-      
-      queryWords.forEach(word => {
-        // Title matches get highest score
-        if (post.title.toLowerCase().includes(word)) {
-          score += 10;
-        }
-        // Category/tag matches
-        if (post.categories && post.categories.some(cat => cat.toLowerCase().includes(word))) {
-          score += 5;
+    return loadedShards[shard.id];
+  }
+
+  // Same tokenization as the index builder: lowercase words, Hangul as 2-grams
+  function tokenize(text) {
+    const tokens = [];
+    (text.toLowerCase().match(/[a-z0-9]+|[가-힣]+/g) || []).forEach(word => {
+      if (/^[가-힣]+$/.test(word)) {
+        if (word.length === 1) {
+          tokens.push(word);
         }
-        if (post.tags && post.tags.some(tag => tag.toLowerCase().includes(word))) {
-          score += 5;
+        for (let i = 0; i < word.length - 1; i++) {
+          tokens.push(word.slice(i, i + 2));
         }
-        // Content matches
-        item.words.forEach(postWord => {
-          if (postWord.includes(word) || word.includes(postWord)) {
-            score += 1;
-          }
-        });
-      });
-      
-      if (score > 0) {
-        results.push({ post, score });
+      } else if (word.length >= 2) {
+        tokens.push(word);
       }
     });
-    
-    // Sort by score (highest first)
+    return Array.from(new Set(tokens));
+  }
+
+  // Postings for a token; the last query word also matches as a prefix
+  function postingsFor(shard, token, isPrefix) {
+    if (!isPrefix || /[가-힣]/.test(token)) {
+      return shard.index[token] || [];
+    }
+    const docs = new Set();
+    Object.keys(shard.index).forEach(key => {
+      if (key.startsWith(token)) {
+        shard.index[key].forEach(docIndex => docs.add(docIndex));
+      }
+    });
+    return Array.from(docs);
+  }
+
+  function searchShard(shard, tokens, query) {
+    let candidates = null;
+    tokens.forEach((token, i) => {
+      const postings = new Set(postingsFor(shard, token, i === tokens.length - 1));
+      candidates = candidates === null
+        ? postings
+        : new Set(Array.from(candidates).filter(docIndex => postings.has(docIndex)));
+    });
+
+    return Array.from(candidates || []).map(docIndex => {
+      const doc = shard.docs[docIndex];
+      const score = doc.t.toLowerCase().includes(query) ? 10 : 1;
+      return { post: { title: doc.t, url: doc.u, excerpt: doc.e, date: doc.d, image: doc.i }, score };
+    });
+  }
+
+  // Search function
+  async function performSearch(query) {
+    if (!searchManifest || !query || query.trim().length === 0) {
+      return [];
+    }
+
+    const normalized = query.toLowerCase().trim();
+    const tokens = tokenize(normalized);
+    if (tokens.length === 0) {
+      return [];
+    }
+
+    const results = [];
+    for (const shardInfo of searchManifest.shards) {
+      const shard = await loadShard(shardInfo);
+      results.push(...searchShard(shard, tokens, normalized));
+      if (results.length >= maxResults) {
+        break;
+      }
+    }
+
+    // Sort by score (highest first), shards are already newest first
     results.sort((a, b) => b.score - a.score);
-    
-    return results.slice(0, 10); // Return top 10 results
+
+    return results.slice(0, maxResults);
   }
   
   // Display search results
@@ -239,8 +283,12 @@ document.addEventListener('DOMContentLoaded', function() {
       
       // Debounce search
       searchTimeout = setTimeout(() => {
-        const results = performSearch(query);
-        displaySearchResults(results);
+        performSearch(query).then(results => {
+          // Ignore results for a query that is no longer in the input
+          if (searchInput.value.trim() === query) {
+            displaySearchResults(results);
+          }
+        });
       }, 300);
     });
     
@@ -250,10 +298,11 @@ document.addEventListener('DOMContentLoaded', function() {
         e.preventDefault();
         const query = this.value.trim();
         if (query.length > 0) {
-          const results = performSearch(query);
-          if (results.length > 0) {
-            window.location.href = results[0].post.url;
-          }
+          performSearch(query).then(results => {
+            if (results.length > 0) {
+              window.location.href = results[0].post.url;
+            }
+          });
         }
       }
     });
@@ -1,283 +1,191 @@
 /**
  * 실시간 주식 티커 뱃지
- * Investing.com 검색 API + 실시간 가격 API를 사용하여 실시간 주가 정보를 표시
+ * 크롤러가 생성한 정적 데이터(/assets/data/tickers.json) 하나로 페이지의 모든 뱃지를 표시
+ * - symbols: 종목 코드(EXCHANGE:SYMBOL) → instrument_id
+ * - quotes: instrument_id → [심볼, 현재가, 변동, 변동률]
+ * data-live-prices="true" 이면 페이지의 모든 종목 시세를 한 번의 batch 요청으로 추가 갱신 (5분마다)
+ * 스냅샷에 없는 종목은 live 옵션과 관계없이 실시간 API로 조회
+ * - 시세가 없는 instrument_id: 한 번의 batch 요청
+ * - instrument_id를 알 수 없는 종목 코드: 검색 API (종목당 1회, 결과 캐시)
  */
 
 (function() {
   'use strict';
 
-  // 검색 결과 캐시 (같은 심볼 중복 요청 방지)
-  const instrumentCache = new Map();
-
-  // Investing.com 검색 API로 종목 정보 조회
-  async function searchInstrument(symbol) {
-    // 캐시 확인
-    if (instrumentCache.has(symbol)) {
-      return instrumentCache.get(symbol);
+  const script = document.currentScript;
+  const snapshotUrl = (script && script.dataset.snapshot) || '/assets/data/tickers.json';
+  const livePrices = !!(script && script.dataset.livePrices === 'true');
+
+  // 정적 데이터는 페이지당 한 번만 요청 (브라우저 캐시 사용)
+  let snapshotPromise = null;
+
+  function loadSnapshot() {
+    if (!snapshotPromise) {
+      snapshotPromise = fetch(snapshotUrl)
+        .then(response => {
+          if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+          return response.json();
+        })
+        .catch(error => {
+          console.error('[Stock Ticker] 종목 데이터 로드 실패:', error);
+          return { symbols: {}, quotes: {} };
+        });
     }
+    return snapshotPromise;
+  }
 
-    const url = 'https://kr.investing.com/search/service/search';
+  // 스냅샷 항목 → 가격 API 응답과 같은 형태
+  function quoteFromSnapshot(entry) {
+    if (!entry) {
+      return null;
+    }
+    const [symbol, last, change, changePercent] = entry;
+    return {
+      symbol: symbol,
+      price: { last: last, change: change || 0, change_percent: changePercent || 0 }
+    };
+  }
 
-    try {
-      console.log('[Stock Ticker] 종목 검색 중:', symbol);
+  // 검색 결과 캐시 (같은 심볼 중복 요청 방지)
+  const searchCache = new Map();
 
-      const response = await fetch(url, {
+  // Investing.com 검색 API로 instrument_id 조회 (스냅샷에 없는 종목 코드)
+  function searchInstrumentId(symbol) {
+    if (!searchCache.has(symbol)) {
+      const request = fetch('https://kr.investing.com/search/service/search', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/x-www-form-urlencoded',
-          'X-Requested-With': 'XMLHttpRequest',
+          'X-Requested-With': 'XMLHttpRequest'
         },
-        body: new URLSearchParams({
-          search_text: symbol,
-          term: symbol,
-          country_id: '0',
-          tab_id: 'All'
+        body: new URLSearchParams({ search_text: symbol, term: symbol, country_id: '0', tab_id: 'All' })
+      })
+        .then(response => {
+          if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+          return response.json();
         })
-      });
-
-      if (!response.ok) {
-        console.error('[Stock Ticker] 검색 API 오류:', response.status);
-        return null;
-      }
-
-      const data = await response.json();
-      const results = data.All || [];
-
-      if (results.length > 0) {
-        const result = results[0];
-        const instrumentInfo = {
-          id: result.pair_ID,
-          symbol: result.symbol,
-          name: result.name,
-          exchange: result.exchange_popular_symbol
-        };
-
-        // 캐시에 저장
-        instrumentCache.set(symbol, instrumentInfo);
-        console.log('[Stock Ticker] 검색 성공:', symbol, '->', instrumentInfo.id);
-        return instrumentInfo;
-      }
-
-      console.warn('[Stock Ticker] 검색 결과 없음:', symbol);
-      return null;
-
-    } catch (error) {
-      console.error('[Stock Ticker] 검색 API 호출 실패:', error);
-      return null;
+        .then(data => {
+          const result = (data.All || [])[0];
+          return result && result.pair_ID ? String(result.pair_ID) : null;
+        })
+        .catch(error => {
+          console.error('[Stock Ticker] 종목 검색 실패:', symbol, error);
+          return null;
+        });
+      searchCache.set(symbol, request);
     }
+    return searchCache.get(symbol);
   }
 
-  // API 호출 함수 (단일 instrument - 실시간 가격 조회)
-  async function fetchSingleStock(instrumentId) {
-    const url = `https://endpoints.investing.com/pd-instruments/v1/instruments?instrument_ids=${instrumentId}`;
-    console.log('[Stock Ticker] 가격 API 호출:', instrumentId);
+  // 여러 종목 실시간 가격을 한 번에 조회 (live 옵션 또는 스냅샷에 없는 종목)
+  async function fetchLiveQuotes(instrumentIds) {
+    if (instrumentIds.length === 0) {
+      return {};
+    }
 
+    const url = `https://endpoints.investing.com/pd-instruments/v1/instruments?instrument_ids=${instrumentIds.join(',')}`;
     try {
       const response = await fetch(url);
-      console.log('[Stock Ticker] 가격 API 응답 상태:', response.status);
       if (!response.ok) {
-        const text = await response.text();
-        console.error('[Stock Ticker] 오류 응답:', text);
         throw new Error(`HTTP ${response.status}`);
       }
-      const data = await response.json();
-      return data[0]; // 첫 번째 항목 반환
+      const quotes = {};
+      for (const item of await response.json()) {
+        if (item && item.id) {
+          quotes[String(item.id)] = item;
+        }
+      }
+      return quotes;
     } catch (error) {
-      console.error('[Stock Ticker] 가격 데이터 가져오기 실패:', error);
-      return null;
-    }
-  }
-  
-  // 여러 주식 데이터 가져오기
-  async function fetchStockData(instrumentIds) {
-    if (!instrumentIds || instrumentIds.length === 0) {
-      return [];
+      console.error('[Stock Ticker] 실시간 가격 조회 실패:', error);
+      return {};
     }
-
-    // 각 instrument를 개별적으로 조회
-    const promises = instrumentIds.map(id => fetchSingleStock(id));
-    const results = await Promise.all(promises);
-    
-    // null이 아닌 것만 반환
-    return results.filter(data => data !== null);
   }
 
-  // 뱃지 HTML 생성
-  function createBadge(data) {
-    const price = data.price || {};
-    const change = price.change || 0;
-    const changePercent = price.change_percent || 0;
-    const symbol = data.symbol || '';
-    
-    // 등락에 따른 색상 및 아이콘
+  // 등락에 따른 색상 클래스와 변동률 문자열
+  function formatChange(data) {
+    const change = (data.price && data.price.change) || 0;
+    const changePercent = (data.price && data.price.change_percent) || 0;
     const isUp = change > 0;
     const isDown = change < 0;
-    const colorClass = isUp ? 'badge-up' : isDown ? 'badge-down' : 'badge-neutral';
-    const icon = isUp ? '▲' : isDown ? '▼' : '―';
-    
-    // 변동률 포맷팅
-    const formattedChange = changePercent.toFixed(2);
-    const sign = isUp ? '+' : '';
-    
-    return `<span class="stock-badge ${colorClass}">${symbol} ${icon} ${sign}${formattedChange}%</span>`;
+    return {
+      colorClass: isUp ? 'badge-up' : isDown ? 'badge-down' : 'badge-neutral',
+      icon: isUp ? '▲' : isDown ? '▼' : '―',
+      text: `${isUp ? '+' : ''}${changePercent.toFixed(2)}%`
+    };
   }
 
-  // Post-Card 배지 업데이트 함수
-  async function updateCardBadges() {
-    console.log('[Stock Ticker] Post-Card 배지 업데이트 시작');
-    const cardBadges = document.querySelectorAll('.stock-badge--card');
-    console.log('[Stock Ticker] 발견된 Post-Card 배지:', cardBadges.length);
-
-    if (cardBadges.length === 0) {
-      console.log('[Stock Ticker] Post-Card 배지가 없습니다');
-      return;
-    }
-
-    const updatePromises = [];
-
-    cardBadges.forEach(element => {
-      const symbol = element.dataset.symbol;
-      const instrumentId = element.dataset.instrumentId;
-
-      console.log('[Stock Ticker] Post-Card 배지 처리:', symbol, 'ID:', instrumentId);
-
-      if (instrumentId) {
-        updatePromises.push(
-          fetchSingleStock(instrumentId).then(data => {
-            if (data) {
-              const change = data.price?.change || 0;
-              const changePercent = data.price?.change_percent || 0;
-              const isUp = change > 0;
-              const isDown = change < 0;
-              const colorClass = isUp ? 'badge-up' : isDown ? 'badge-down' : 'badge-neutral';
-              const sign = isUp ? '+' : '';
-
-              // Post-Card 배지 업데이트
-              element.className = `stock-badge stock-badge--card ${colorClass}`;
-              element.textContent = `${symbol} ${sign}${changePercent.toFixed(2)}%`;
-              element.classList.add('ticker-loaded');
-
-              console.log('[Stock Ticker] Post-Card 배지 업데이트 완료:', symbol);
-            }
-          })
-        );
-      }
-    });
-
-    await Promise.all(updatePromises);
-    console.log('[Stock Ticker] Post-Card 배지 업데이트 완료');
+  // 본문 티커 뱃지 HTML 생성
+  function createBadge(data, symbol) {
+    const { colorClass, icon, text } = formatChange(data);
+    return `<span class="stock-badge ${colorClass}">${data.symbol || symbol} ${icon} ${text}</span>`;
   }
 
-  // Post 페이지 메타 배지 업데이트 함수
-  async function updatePostBadges() {
-    console.log('[Stock Ticker] Post 메타 배지 업데이트 시작');
-    const postBadges = document.querySelectorAll('.stock-badge--post');
-    console.log('[Stock Ticker] 발견된 Post 메타 배지:', postBadges.length);
+  // Post-Card / Post 메타 배지 업데이트
+  function updateTagBadge(element, variant, data) {
+    const { colorClass, text } = formatChange(data);
+    element.className = `stock-badge stock-badge--${variant} ${colorClass}`;
+    element.textContent = `${element.dataset.symbol} ${text}`;
+    element.classList.add('ticker-loaded');
+  }
 
-    if (postBadges.length === 0) {
-      console.log('[Stock Ticker] Post 메타 배지가 없습니다');
-      return;
+  // 요소의 instrument_id (data 속성 우선, 없으면 종목 코드 맵)
+  function instrumentIdOf(element, symbols) {
+    if (element.dataset.instrumentId) {
+      return String(element.dataset.instrumentId);
     }
-
-    const updatePromises = [];
-
-    postBadges.forEach(element => {
-      const symbol = element.dataset.symbol;
-      const instrumentId = element.dataset.instrumentId;
-
-      console.log('[Stock Ticker] Post 메타 배지 처리:', symbol, 'ID:', instrumentId);
-
-      if (instrumentId) {
-        updatePromises.push(
-          fetchSingleStock(instrumentId).then(data => {
-            if (data) {
-              const change = data.price?.change || 0;
-              const changePercent = data.price?.change_percent || 0;
-              const isUp = change > 0;
-              const isDown = change < 0;
-              const colorClass = isUp ? 'badge-up' : isDown ? 'badge-down' : 'badge-neutral';
-              const sign = isUp ? '+' : '';
-
-              // Post 메타 배지 업데이트
-              element.className = `stock-badge stock-badge--post ${colorClass}`;
-              element.textContent = `${symbol} ${sign}${changePercent.toFixed(2)}%`;
-              element.classList.add('ticker-loaded');
-
-              console.log('[Stock Ticker] Post 메타 배지 업데이트 완료:', symbol);
-            }
-          })
-        );
-      }
-    });
-
-    await Promise.all(updatePromises);
-    console.log('[Stock Ticker] Post 메타 배지 업데이트 완료');
+    const { exchange, symbol } = element.dataset;
+    const instrumentId = symbols[`${exchange}:${symbol}`];
+    return instrumentId ? String(instrumentId) : null;
   }
 
   // 모든 티커 업데이트
   async function updateAllTickers() {
-    console.log('[Stock Ticker] 초기화 시작');
-    const tickerElements = document.querySelectorAll('.stock-ticker');
-    console.log('[Stock Ticker] 발견된 티커:', tickerElements.length);
-
-    // 모든 티커 요소 처리
-    const updatePromises = [];
-
-    tickerElements.forEach(element => {
-      const symbol = element.dataset.symbol;
-      const exchange = element.dataset.exchange;
-
-      console.log('[Stock Ticker] 처리 중:', symbol, 'Exchange:', exchange);
-
-      // 1. data-instrument-id 속성에서 직접 가져오기 (우선순위)
-      let instrumentId = element.dataset.instrumentId;
+    const elements = [
+      ...Array.from(document.querySelectorAll('.stock-ticker'), element => [element, 'ticker']),
+      ...Array.from(document.querySelectorAll('.stock-badge--card'), element => [element, 'card']),
+      ...Array.from(document.querySelectorAll('.stock-badge--post'), element => [element, 'post'])
+    ];
+    if (elements.length === 0) {
+      return;
+    }
 
-      if (instrumentId) {
-        // instrument_id가 있으면 바로 가격 조회
-        console.log('[Stock Ticker] ID 사용:', symbol, '->', instrumentId);
-        updatePromises.push(
-          fetchSingleStock(instrumentId).then(data => {
-            if (data) {
-              const badge = createBadge(data);
-              element.innerHTML = badge;
-              element.classList.add('ticker-loaded');
-            }
-          })
-        );
+    const snapshot = await loadSnapshot();
+    const symbols = snapshot.symbols || {};
+    const snapshotQuotes = snapshot.quotes || {};
+
+    // 스냅샷에 없는 종목 코드는 검색 API로 instrument_id 조회
+    const targets = await Promise.all(elements.map(async ([element, variant]) => {
+      const instrumentId = instrumentIdOf(element, symbols)
+        || (element.dataset.symbol ? await searchInstrumentId(element.dataset.symbol) : null);
+      return [element, variant, instrumentId];
+    }));
+    const resolved = targets.filter(([, , instrumentId]) => instrumentId);
+
+    // live 옵션이면 전체, 아니면 스냅샷에 시세가 없는 종목만 실시간 조회
+    const liveIds = [...new Set(resolved.map(([, , instrumentId]) => instrumentId))]
+      .filter(instrumentId => livePrices || !snapshotQuotes[instrumentId]);
+    const liveQuotes = await fetchLiveQuotes(liveIds);
+
+    let updated = 0;
+    resolved.forEach(([element, variant, instrumentId]) => {
+      const data = liveQuotes[instrumentId] || quoteFromSnapshot(snapshotQuotes[instrumentId]);
+      if (!data) {
+        return;
+      }
+      if (variant === 'ticker') {
+        element.innerHTML = createBadge(data, element.dataset.symbol);
+        element.classList.add('ticker-loaded');
       } else {
-        // instrument_id가 없으면 검색 API로 동적 조회
-        console.log('[Stock Ticker] 종목 검색 필요:', symbol);
-        updatePromises.push(
-          searchInstrument(symbol).then(instrumentInfo => {
-            if (instrumentInfo && instrumentInfo.id) {
-              // 검색 성공 → 가격 조회
-              console.log('[Stock Ticker] 검색 성공, 가격 조회:', instrumentInfo.id);
-              return fetchSingleStock(instrumentInfo.id).then(data => {
-                if (data) {
-                  const badge = createBadge(data);
-                  element.innerHTML = badge;
-                  element.classList.add('ticker-loaded');
-                }
-              });
-            } else {
-              console.warn('[Stock Ticker] 검색 실패:', symbol);
-            }
-          })
-        );
+        updateTagBadge(element, variant, data);
       }
+      updated += 1;
     });
-
-    // 모든 업데이트 완료 대기
-    if (updatePromises.length > 0) {
-      await Promise.all(updatePromises);
-    }
-    console.log('[Stock Ticker] 모든 티커 업데이트 완료');
-
-    // Post-Card 배지도 업데이트
-    await updateCardBadges();
-
-    // Post 메타 배지도 업데이트
-    await updatePostBadges();
+    console.log('[Stock Ticker] 뱃지 업데이트 완료:', updated, '/', elements.length);
   }
 
   // 페이지 로드 시 실행
@@ -287,8 +195,9 @@
     updateAllTickers();
   }
 
-  // 5분마다 업데이트 (선택사항)
-  setInterval(updateAllTickers, 5 * 60 * 1000);
+  // 실시간 가격 옵션이 켜져 있으면 5분마다 업데이트
+  if (livePrices) {
+    setInterval(updateAllTickers, 5 * 60 * 1000);
+  }
 
 })();
-